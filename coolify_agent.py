@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Coolify Background Agent
+Keeps logged-in sessions, pooled connections and the inventory warm behind a Unix socket for instant CLI calls
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+
+DEFAULT_SOCKET = os.path.join(os.path.expanduser('~'), '.cache', 'coolify-cli', 'agent.sock')
+DEFAULT_REFRESH_INTERVAL = 60
+CONNECT_TIMEOUT = 0.5  # The agent is local; anything slower means it is not there
+
+
+def get_socket_path():
+    return os.environ.get('COOLIFY_AGENT_SOCKET', DEFAULT_SOCKET)
+
+
+# -- client side (kept free of heavy imports so thin commands start fast) ----
+
+def agent_call(command, path=None, timeout=60, **params):
+    """Send one request to a running agent; returns its reply dict, or None if no agent answers"""
+    path = path or get_socket_path()
+    if not os.path.exists(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None  # Stale socket file from an agent that died
+    try:
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps(dict(params, command=command)).encode('utf-8') + b'\n')
+        with sock.makefile('rb') as reader:
+            line = reader.readline()
+    except (BrokenPipeError, ConnectionResetError):
+        return None  # The agent is shutting down
+    finally:
+        sock.close()
+    if not line:
+        return None
+    return json.loads(line)
+
+
+# -- agent side --------------------------------------------------------------
+
+class WarmClient:
+    """One logged-in CoolifyAPI per instance and account, re-logging in when the session expires"""
+
+    def __init__(self, base_url, email, password, refresh_interval=DEFAULT_REFRESH_INTERVAL):
+        from coolify_final_deploy import CoolifyAPI
+        from coolify_index import ApplicationIndex
+
+        self.api = CoolifyAPI(base_url)
+        self.base_url = base_url
+        self.email = email
+        self.password = password
+        self.inventory = self.api.inventory
+        self.index = ApplicationIndex().attach(self.inventory, base_url)
+        self.logged_in = False
+        self.relogins = 0
+        self._lock = threading.Lock()
+        self._stop_refresh = self.inventory.start_background_refresh(base_url, {
+            'servers': lambda: self._fetch('servers'),
+            'applications': lambda: self._fetch('applications'),
+        }, refresh_interval)
+
+    def _login(self, force=False):
+        with self._lock:
+            if force or not self.logged_in:
+                if force:
+                    self.relogins += 1
+                    self.api.session.cookies.clear()
+                self.logged_in = self.api.login(self.email, self.password)
+            return self.logged_in
+
+    def _with_session(self, func):
+        """Run func(); if the session was rejected, log in again and retry once"""
+        import requests
+
+        if not self._login():
+            raise PermissionError('login failed')
+        try:
+            return func()
+        except (requests.HTTPError, ValueError) as e:
+            # An expired session answers 401/419, or redirects to the HTML login page
+            status = getattr(getattr(e, 'response', None), 'status_code', None)
+            if status not in (None, 401, 419):
+                raise
+        if not self._login(force=True):
+            raise PermissionError('login failed')
+        return func()
+
+    def _fetch(self, kind):
+        from coolify_http import iter_resources
+        return self._with_session(lambda: list(iter_resources(self.api.session, f"{self.base_url}/api/v1/{kind}")))
+
+    def listing(self, kind, refresh=False):
+        # A stale copy is answered at once and refreshed behind the reply
+        return self.inventory.read_through(self.base_url, kind, lambda: self._fetch(kind),
+                                           refresh=refresh, background=True) or []
+
+    def find(self, query, refresh=False):
+        if refresh or self.inventory.get(self.base_url, 'applications') is None:
+            self.listing('applications', refresh=True)
+        return self.index.find(query)
+
+    def deploy(self, app, branch='main', force=False):
+        matches = self.find(app)
+        if len(matches) != 1:
+            return None, f"'{app}' matches {len(matches)} applications, expected exactly one"
+        app_id = matches[0].get('uuid') or matches[0].get('id')
+
+        def post():
+            response = self.api.session.post(f"{self.base_url}/api/v1/applications/{app_id}/deploy",
+                                              json={'branch': branch, 'force_rebuild': force},
+                                              allow_redirects=False)
+            if response.status_code == 302:
+                raise ValueError('redirected to login')
+            response.raise_for_status()
+            return response.json()
+        return self._with_session(post), None
+
+    def close(self):
+        self._stop_refresh.set()
+        self.index.detach()
+        self.api.session.close()
+
+
+class AgentHandler(socketserver.StreamRequestHandler):
+    """Newline-delimited JSON requests and replies, several per connection"""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                reply = self.server.dispatch(request)
+            except Exception as e:
+                reply = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(reply).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+
+class CoolifyAgent(socketserver.ThreadingUnixStreamServer):
+    """The agent process: a threaded Unix socket server in front of WarmClients"""
+
+    daemon_threads = True
+
+    def __init__(self, path=None, refresh_interval=DEFAULT_REFRESH_INTERVAL, idle_timeout=0):
+        self.path = path or get_socket_path()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        if os.path.exists(self.path):
+            if agent_call('ping', self.path) is not None:
+                raise RuntimeError(f"An agent is already listening on {self.path}")
+            os.unlink(self.path)
+        old_umask = os.umask(0o177)  # Socket usable by this user only
+        try:
+            super().__init__(self.path, AgentHandler)
+        finally:
+            os.umask(old_umask)
+        self.refresh_interval = refresh_interval
+        self.idle_timeout = idle_timeout
+        self.started = time.time()
+        self.last_request = time.time()
+        self.requests = 0
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+
+    def client(self, request):
+        key = (request['url'].rstrip('/'), request['email'])
+        with self._clients_lock:
+            client = self._clients.get(key)
+            if client is not None and client.password != request['password']:
+                client.close()
+                client = None
+            if client is None:
+                client = WarmClient(key[0], request['email'], request['password'], self.refresh_interval)
+                self._clients[key] = client
+            return client
+
+    def dispatch(self, request):
+        self.last_request = time.time()
+        self.requests += 1
+        command = request.get('command')
+        if command == 'ping':
+            return {'ok': True, 'pid': os.getpid()}
+        if command == 'status':
+            with self._clients_lock:
+                clients = [{'url': url, 'email': email, 'logged_in': c.logged_in, 'relogins': c.relogins}
+                           for (url, email), c in self._clients.items()]
+            return {'ok': True, 'pid': os.getpid(), 'uptime': time.time() - self.started,
+                    'requests': self.requests, 'clients': clients}
+        if command == 'shutdown':
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {'ok': True}
+
+        client = self.client(request)
+        if command in ('servers', 'applications'):
+            return {'ok': True, 'items': client.listing(command, request.get('refresh', False))}
+        if command == 'find':
+            return {'ok': True, 'items': client.find(request['query'], request.get('refresh', False))}
+        if command == 'deploy':
+            result, error = client.deploy(request['app'], request.get('branch', 'main'), request.get('force', False))
+            return {'ok': error is None, 'result': result, 'error': error}
+        return {'ok': False, 'error': f"Unknown command {command!r}"}
+
+    def _watch_idle(self):
+        while True:
+            time.sleep(min(self.idle_timeout, 30))
+            if time.time() - self.last_request > self.idle_timeout:
+                print(f"💤 Idle for {self.idle_timeout:g}s, stopping agent")
+                self.shutdown()
+                return
+
+    def serve(self):
+        print(f"🤖 Coolify agent (pid {os.getpid()}) listening on {self.path}")
+        if self.idle_timeout:
+            threading.Thread(target=self._watch_idle, name='agent-idle', daemon=True).start()
+        try:
+            self.serve_forever()
+        finally:
+            self.close()
+
+    def close(self):
+        with self._clients_lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+        self.server_close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+def start_detached(path=None, refresh_interval=DEFAULT_REFRESH_INTERVAL, idle_timeout=0, log_path=None, wait=10.0):
+    """Launch the agent as a background process and wait until it answers"""
+    path = path or get_socket_path()
+    log_path = log_path or os.path.splitext(path)[0] + '.log'
+    os.makedirs(os.path.dirname(log_path) or '.', exist_ok=True)
+    with open(log_path, 'ab') as log:
+        process = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), 'serve', '--socket', path,
+             '--refresh-interval', str(refresh_interval), '--idle-timeout', str(idle_timeout)],
+            stdin=subprocess.DEVNULL, stdout=log, stderr=subprocess.STDOUT, start_new_session=True)
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return None
+        if agent_call('ping', path) is not None:
+            return process.pid
+        time.sleep(0.05)
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Warm background agent for the coolify CLI')
+    parser.add_argument('action', choices=['serve', 'start', 'stop', 'status'],
+                        help='serve in the foreground, start in the background, stop or query a running agent')
+    parser.add_argument('--socket', default=get_socket_path(), help='Unix socket path')
+    parser.add_argument('--refresh-interval', type=float, default=DEFAULT_REFRESH_INTERVAL,
+                        help='Seconds between background inventory refreshes')
+    parser.add_argument('--idle-timeout', type=float, default=0, help='Exit after this many idle seconds (0: never)')
+    args = parser.parse_args(argv)
+
+    if args.action == 'serve':
+        try:
+            agent = CoolifyAgent(args.socket, args.refresh_interval, args.idle_timeout)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            return 1
+        try:
+            agent.serve()
+        except KeyboardInterrupt:
+            print("\n👋 Stopping agent")
+        return 0
+
+    if args.action == 'start':
+        if agent_call('ping', args.socket) is not None:
+            print(f"✅ Agent already running on {args.socket}")
+            return 0
+        pid = start_detached(args.socket, args.refresh_interval, args.idle_timeout)
+        if pid is None:
+            print(f"❌ Agent failed to start (see {os.path.splitext(args.socket)[0]}.log)")
+            return 1
+        print(f"✅ Agent started (pid {pid}) on {args.socket}")
+        return 0
+
+    if args.action == 'stop':
+        if agent_call('shutdown', args.socket) is None:
+            print("⚠️  No agent running")
+            return 1
+        print("✅ Agent stopped")
+        return 0
+
+    status = agent_call('status', args.socket)
+    if status is None:
+        print("⚠️  No agent running")
+        return 1
+    print(f"🤖 Agent pid {status['pid']}, up {status['uptime']:.0f}s, {status['requests']} requests")
+    for client in status['clients']:
+        state = 'logged in' if client['logged_in'] else 'not logged in'
+        print(f"   - {client['email']} @ {client['url']}: {state}, {client['relogins']} re-logins")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
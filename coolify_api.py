@@ -1,19 +1,27 @@
-import requests
 import re
 import json
+import threading
 import time
 from urllib.parse import urljoin, parse_qs
 from bs4 import BeautifulSoup
+from coolify_http import create_session, iter_resources
+from coolify_index import ApplicationIndex
+from coolify_inventory import get_inventory
+from coolify_resolver import EnvironmentResolver
 
 class CoolifyAPI:
     """Complete Coolify API wrapper based on reverse engineering findings"""
     
     def __init__(self, base_url="https://coolify.247420.xyz"):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = create_session()
         self.csrf_token = None
         self.project_id = None
         self.environment_id = None
+        self.inventory = get_inventory()
+        self.index = None
+        self._index_lock = threading.Lock()
+        self.resolver = EnvironmentResolver(self.session, base_url, self.inventory)
         
         # Set proper headers
         self.session.headers.update({
@@ -28,6 +36,12 @@ class CoolifyAPI:
             'X-Livewire': 'true'   # Required for Livewire requests
         })
     
+    def close(self):
+        """Stop following inventory refreshes and release pooled connections"""
+        if self.index is not None:
+            self.index.detach()
+        self.session.close()
+    
     def login(self, email, password):
         """Authenticate with Coolify"""
         print(f"🔐 Logging into {self.base_url}")
@@ -73,46 +87,21 @@ class CoolifyAPI:
         except Exception as e:
             return False, f"Login error: {str(e)}"
     
-    def get_dashboard_info(self):
-        """Get dashboard information and extract project/environment IDs"""
+    def get_dashboard_info(self, project=None, revalidate=False):
+        """Resolve the project/environment IDs to deploy into (discovered once per instance)"""
         print("📊 Getting dashboard information...")
         
         try:
-            response = self.session.get(f"{self.base_url}/dashboard")
-            if response.status_code != 200:
-                return False, f"Dashboard not accessible: {response.status_code}"
-            
-            # Extract project and environment IDs from the page
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Look for project links or forms
-            project_links = soup.find_all('a', href=re.compile(r'/project/'))
-            if project_links:
-                # Extract project ID from first project link
-                href = project_links[0].get('href', '')
-                project_match = re.search(r'/project/(\d+)', href)
-                if project_match:
-                    self.project_id = project_match.group(1)
-                    print(f"   ✅ Found project ID: {self.project_id}")
+            if revalidate:
+                self.resolver.revalidate()
+            env = self.resolver.resolve(project)
+            if env is None:
+                return False, "No project/environment found on dashboard"
             
-            # Look for environment links
-            env_links = soup.find_all('a', href=re.compile(r'/environment/'))
-            if env_links:
-                href = env_links[0].get('href', '')
-                env_match = re.search(r'/environment/(\d+)', href)
-                if env_match:
-                    self.environment_id = env_match.group(1)
-                    print(f"   ✅ Found environment ID: {self.environment_id}")
-            
-            if not self.project_id:
-                # Try to find default project
-                self.project_id = "1"  # Default assumption
-                print("   ⚠️  Using default project ID: 1")
-            
-            if not self.environment_id:
-                # Try to find default environment
-                self.environment_id = "1"  # Default assumption
-                print("   ⚠️  Using default environment ID: 1")
+            self.project_id = env['project_uuid']
+            self.environment_id = env['environment_uuid']
+            print(f"   ✅ Found project ID: {self.project_id} ({env.get('project_name') or 'unnamed'})")
+            print(f"   ✅ Found environment ID: {self.environment_id}")
             
             return True, "Dashboard info extracted"
             
@@ -131,6 +120,13 @@ class CoolifyAPI:
             resource_url = f"{self.base_url}/project/{self.project_id}/environment/{self.environment_id}/new"
             response = self.session.get(resource_url)
             
+            if response.status_code == 404:
+                # Stored IDs are stale: rescan the dashboard once and retry
+                success, _ = self.get_dashboard_info(revalidate=True)
+                if success:
+                    resource_url = f"{self.base_url}/project/{self.project_id}/environment/{self.environment_id}/new"
+                    response = self.session.get(resource_url)
+            
             if response.status_code != 200:
                 return False, f"Resource page not accessible: {response.status_code}"
             
@@ -203,6 +199,7 @@ class CoolifyAPI:
             )
             
             if livewire_response.status_code == 200:
+                self.inventory.invalidate(self.base_url, 'applications')
                 print(f"   ✅ Application creation initiated")
                 return True, "Application created successfully"
             else:
@@ -211,12 +208,98 @@ class CoolifyAPI:
         except Exception as e:
             return False, f"Application creation error: {str(e)}"
     
-    def monitor_deployment(self, app_name, timeout=300):
+    def find_application(self, app_name):
+        """Look up an application by name, repository, domain or UUID via the index"""
+        # Held while refreshing so no lookup reads the index between the cache write and its update
+        with self._index_lock:
+            if self.index is None:
+                self.index = ApplicationIndex().attach(self.inventory, self.base_url)
+            try:
+                self.inventory.read_through(
+                    self.base_url, 'applications',
+                    lambda: list(iter_resources(self.session, f"{self.base_url}/api/v1/applications")))
+            except Exception as e:
+                print(f"   ⚠️  Application list unavailable: {e}")
+        matches = self.index.find(app_name)
+        return matches[0] if len(matches) == 1 else None
+    
+    def _latest_deployment(self, app_uuid):
+        """UUID of the application's most recent deployment listed by the API, or None"""
+        try:
+            response = self.session.get(f"{self.base_url}/api/v1/deployments")
+            if response.status_code != 200:
+                return None
+            deployments = response.json()
+        except Exception:
+            return None
+        if isinstance(deployments, dict):
+            deployments = deployments.get('data', [])
+        for deployment in reversed(deployments):
+            if isinstance(deployment, dict) and deployment.get('application_uuid') == app_uuid:
+                return deployment.get('deployment_uuid')
+        return None
+    
+    def _monitor_via_api(self, app_uuid, start_time, timeout, deployment_uuid=None):
+        """Poll the deployment record (or, without one, the application's status) until it settles
+        
+        The application status alone is ambiguous: a new app reports exited
+        before its first deployment and a redeployed app reports running
+        before the new build. Without a deployment record, a status only
+        counts once it differs from the one seen when monitoring started.
+        """
+        initial_status = None
+        while time.time() - start_time < timeout:
+            try:
+                deployment_uuid = deployment_uuid or self._latest_deployment(app_uuid)
+                if deployment_uuid:
+                    response = self.session.get(f"{self.base_url}/api/v1/deployments/{deployment_uuid}")
+                    if response.status_code == 200:
+                        status = str(response.json().get('status', '')).lower()
+                        print(f"   📈 Deployment status: {status}")
+                        if status == 'finished':
+                            print(f"   ✅ Deployment completed successfully!")
+                            return True, "Deployment successful"
+                        elif status in ('failed', 'error', 'cancelled', 'cancelled-by-user'):
+                            print(f"   ❌ Deployment failed")
+                            return False, "Deployment failed"
+                else:
+                    response = self.session.get(f"{self.base_url}/api/v1/applications/{app_uuid}")
+                    if response.status_code == 200:
+                        status = str(response.json().get('status', '')).lower()
+                        print(f"   📈 Status: {status}")
+                        if initial_status is None:
+                            initial_status = status
+                        elif status != initial_status:
+                            if status.startswith('running'):
+                                print(f"   ✅ Deployment completed successfully!")
+                                return True, "Deployment successful"
+                            elif status.startswith(('exited', 'failed', 'error')):
+                                print(f"   ❌ Deployment failed")
+                                return False, "Deployment failed"
+                            initial_status = status  # e.g. exited -> starting; wait for the next change
+                
+                print(f"   ⏳ Checking again in 10 seconds...")
+                time.sleep(10)
+                
+            except Exception as e:
+                print(f"   ⚠️  Error checking status: {e}")
+                time.sleep(5)
+        
+        return False, "Deployment timeout"
+    
+    def monitor_deployment(self, app_name, timeout=300, deployment_uuid=None):
         """Monitor deployment progress"""
         print(f"📊 Monitoring deployment for {app_name}...")
         
         start_time = time.time()
         
+        app = self.find_application(app_name)
+        if app and (app.get('uuid') or app.get('id')):
+            return self._monitor_via_api(app.get('uuid') or app.get('id'), start_time, timeout, deployment_uuid)
+        
+        # Fall back to scraping the dashboard, only visiting text nodes that mention the app
+        app_pattern = re.compile(re.escape(app_name), re.I)
+        
         while time.time() - start_time < timeout:
             try:
                 # Check deployment status
@@ -226,18 +309,17 @@ class CoolifyAPI:
                     soup = BeautifulSoup(response.text, 'html.parser')
                     
                     # Look for deployment status
-                    status_elements = soup.find_all(text=re.compile(r'deploy|running|success|error', re.I))
-                    
-                    for element in status_elements:
-                        if app_name.lower() in element.lower():
-                            print(f"   📈 Status: {element.strip()}")
-                            
-                            if 'success' in element.lower() or 'deployed' in element.lower():
-                                print(f"   ✅ Deployment completed successfully!")
-                                return True, "Deployment successful"
-                            elif 'error' in element.lower():
-                                print(f"   ❌ Deployment failed")
-                                return False, "Deployment failed"
+                    for element in soup.find_all(string=app_pattern):
+                        if not re.search(r'deploy|running|success|error', element, re.I):
+                            continue
+                        print(f"   📈 Status: {element.strip()}")
+                        
+                        if 'success' in element.lower() or 'deployed' in element.lower():
+                            print(f"   ✅ Deployment completed successfully!")
+                            return True, "Deployment successful"
+                        elif 'error' in element.lower():
+                            print(f"   ❌ Deployment failed")
+                            return False, "Deployment failed"
                 
                 print(f"   ⏳ Checking again in 10 seconds...")
                 time.sleep(10)
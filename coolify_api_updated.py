@@ -1,19 +1,22 @@
-import requests
 import re
 import json
 import time
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
+from coolify_http import create_session
+from coolify_resolver import EnvironmentResolver
+from coolify_tracing import current_span, traced
 
 class CoolifyAPI:
     """Updated Coolify API wrapper with correct component structure"""
     
     def __init__(self, base_url="https://coolify.247420.xyz"):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = create_session()
         self.csrf_token = None
         self.project_uuid = None
         self.environment_uuid = None
+        self.resolver = EnvironmentResolver(self.session, base_url)
         
         # Set proper headers
         self.session.headers.update({
@@ -29,6 +32,7 @@ class CoolifyAPI:
             'Content-Type': 'application/json'
         })
     
+    @traced()
     def login(self, email, password):
         """Authenticate with Coolify"""
         print(f"🔐 Logging into {self.base_url}")
@@ -74,48 +78,21 @@ class CoolifyAPI:
         except Exception as e:
             return False, f"Login error: {str(e)}"
     
-    def extract_uuids_from_dashboard(self):
-        """Extract project and environment UUIDs from dashboard"""
+    @traced()
+    def extract_uuids_from_dashboard(self, refresh=False, project=None):
+        """Resolve project and environment UUIDs (discovered once per instance, rescanned on refresh)"""
         print("🔍 Extracting UUIDs from dashboard...")
         
         try:
-            response = self.session.get(f"{self.base_url}/dashboard")
-            if response.status_code != 200:
-                return False, f"Dashboard not accessible: {response.status_code}"
-            
-            # Extract UUIDs from page content
-            content = response.text
+            if refresh:
+                self.resolver.revalidate()
+            env = self.resolver.resolve(project)
             
-            # Look for project UUID patterns
-            project_matches = re.findall(r'/project/([a-z0-9]{32})', content)
-            if project_matches:
-                self.project_uuid = project_matches[0]
+            if env:
+                self.project_uuid = env['project_uuid']
+                self.environment_uuid = env['environment_uuid']
                 print(f"   ✅ Found project UUID: {self.project_uuid}")
-            
-            # Look for environment UUID patterns  
-            env_matches = re.findall(r'/environment/([a-z0-9]{32})', content)
-            if env_matches:
-                self.environment_uuid = env_matches[0]
                 print(f"   ✅ Found environment UUID: {self.environment_uuid}")
-            
-            # If not found in content, try to find them in specific patterns
-            if not self.project_uuid or not self.environment_uuid:
-                # Look for resource creation links
-                resource_links = re.findall(r'href="([^"]*/project/[^"]*/environment/[^"]*/new[^"]*)"', content)
-                if resource_links:
-                    link = resource_links[0]
-                    project_match = re.search(r'/project/([a-z0-9]{32})', link)
-                    env_match = re.search(r'/environment/([a-z0-9]{32})', link)
-                    
-                    if project_match:
-                        self.project_uuid = project_match.group(1)
-                        print(f"   ✅ Found project UUID from link: {self.project_uuid}")
-                    
-                    if env_match:
-                        self.environment_uuid = env_match.group(1)
-                        print(f"   ✅ Found environment UUID from link: {self.environment_uuid}")
-            
-            if self.project_uuid and self.environment_uuid:
                 return True, "UUIDs extracted successfully"
             else:
                 return False, "Could not extract required UUIDs"
@@ -123,6 +100,7 @@ class CoolifyAPI:
         except Exception as e:
             return False, f"UUID extraction error: {str(e)}"
     
+    @traced()
     def navigate_to_resource_creation(self):
         """Navigate to resource creation page and extract component info"""
         print("🚀 Navigating to resource creation page...")
@@ -171,6 +149,7 @@ class CoolifyAPI:
         except Exception as e:
             return False, f"Navigation error: {str(e)}"
     
+    @traced()
     def select_application_type(self, component_id):
         """Select application type using Livewire"""
         print("📱 Selecting application type...")
@@ -205,6 +184,7 @@ class CoolifyAPI:
         except Exception as e:
             return False, f"Type selection error: {str(e)}"
     
+    @traced()
     def create_application_with_form(self, app_name, repo_url, domain_name=None):
         """Create application by submitting the form"""
         print(f"🏗️ Creating application: {app_name}")
@@ -278,9 +258,14 @@ class CoolifyAPI:
         except Exception as e:
             return False, f"Form submission error: {str(e)}"
     
+    @traced()
     def full_deployment_workflow(self, app_name, repo_url, domain_name=None):
         """Execute the complete deployment workflow"""
         print(f"🚀 Starting full deployment workflow for {app_name}")
+        workflow = current_span()
+        if workflow is not None:
+            workflow.set_attribute('coolify.app_name', app_name)
+            workflow.set_attribute('coolify.repository', repo_url)
         
         # Step 1: Login
         success, result = self.login("admin@247420.xyz", "123,slam123,slam")
@@ -292,8 +277,10 @@ class CoolifyAPI:
         if not success:
             return False, f"UUID extraction failed: {result}"
         
-        # Step 3: Navigate to resource creation
+        # Step 3: Navigate to resource creation (rescan once if the stored UUIDs went stale)
         success, result = self.navigate_to_resource_creation()
+        if not success and self.extract_uuids_from_dashboard(refresh=True)[0]:
+            success, result = self.navigate_to_resource_creation()
         if not success:
             return False, f"Navigation failed: {result}"
         
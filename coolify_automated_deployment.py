@@ -1,15 +1,15 @@
-import requests
 import re
 import json
 import time
 from bs4 import BeautifulSoup
+from coolify_http import create_session
 
 class CoolifyAutomatedDeployment:
     """Complete automated deployment based on visual workflow analysis"""
     
     def __init__(self, base_url="https://coolify.247420.xyz"):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = create_session()
         self.csrf_token = None
         
         # Real UUIDs from analysis
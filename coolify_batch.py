@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Coolify Batch Mode
+Runs newline-delimited JSON operations over one logged-in, pooled session and streams results back in order
+"""
+
+import argparse
+import collections
+import contextlib
+import json
+import re
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+OPERATIONS = ('list', 'create', 'deploy', 'monitor')
+LIST_KINDS = ('servers', 'applications', 'deployments')
+FINISHED_STATUSES = ('finished', 'failed', 'error', 'cancelled', 'cancelled-by-user')
+UUID_PATTERN = re.compile(r'^[a-z0-9]{20,32}$')
+REFERENCE_PATTERN = re.compile(r'^\$([A-Za-z0-9_.-]+)$')
+DEFAULT_CONCURRENCY = 8
+
+
+class BatchError(Exception):
+    """An operation that could not be carried out; reported in its result line"""
+
+
+def references(operation):
+    """Ids of earlier operations this one waits for: "after" plus any "$id" values
+
+    A value starting with "$$" is the literal string with one "$" removed.
+    """
+    refs = operation.get('after') or []
+    if isinstance(refs, str):
+        refs = [refs]
+    refs = list(refs)
+    for value in operation.values():
+        match = REFERENCE_PATTERN.match(value) if isinstance(value, str) else None
+        if match:
+            refs.append(match.group(1))
+    return refs
+
+
+def reference_value(result):
+    """What "$id" stands for: the created app's or the started deployment's UUID"""
+    if isinstance(result, dict):
+        for key in ('deployment_uuid', 'uuid', 'id'):
+            if result.get(key):
+                return result[key]
+    return result
+
+
+class BatchRunner:
+    """Executes operations on a thread pool sharing one CoolifyAPI session
+
+    Operations start as soon as they are read and every operation they
+    reference has finished; results are written in input order. References
+    are looked up while reading, so workers only ever wait on the futures
+    they were handed.
+    """
+
+    def __init__(self, api, concurrency=DEFAULT_CONCURRENCY, output=None, window=None):
+        self.api = api
+        self.concurrency = concurrency
+        self.output = output or sys.stdout
+        self.window = window or concurrency * 4  # Read-ahead bound, keeps memory flat on long inputs
+        self.failed = 0
+        self.count = 0
+
+    def _dependencies(self, operation, futures):
+        """Futures of the operations this one references; runs on the reading thread"""
+        op_id = operation.get('id')
+        if op_id is not None and not isinstance(op_id, str):
+            raise BatchError('id must be a string')
+        if op_id in futures:
+            raise BatchError(f"duplicate id {op_id!r}")
+        dependencies = {}
+        for ref in references(operation):
+            future = futures.get(ref) if isinstance(ref, str) else None
+            if future is None:
+                raise BatchError(f"unknown reference {ref!r} (ids must appear on earlier lines)")
+            dependencies[ref] = future
+        return dependencies
+
+    def _resolve(self, operation, dependencies):
+        for ref, future in dependencies.items():
+            if not future.result()['ok']:
+                raise BatchError(f"depends on failed operation {ref!r}")
+        resolved = {}
+        for key, value in operation.items():
+            if isinstance(value, str) and value.startswith('$$'):
+                value = value[1:]
+            else:
+                match = REFERENCE_PATTERN.match(value) if isinstance(value, str) else None
+                if match:
+                    value = reference_value(dependencies[match.group(1)].result()['result'])
+            resolved[key] = value
+        return resolved
+
+    def _execute(self, number, operation, dependencies):
+        start = time.monotonic()
+        line = {'line': number, 'id': operation.get('id'), 'op': operation.get('op'), 'ok': False}
+        try:
+            operation = self._resolve(operation, dependencies)
+            handler = getattr(self, f"op_{operation.get('op')}", None)
+            if operation.get('op') not in OPERATIONS or handler is None:
+                raise BatchError(f"unknown op {operation.get('op')!r} (expected one of {', '.join(OPERATIONS)})")
+            line['result'] = handler(operation)
+            line['ok'] = True
+        except BatchError as e:
+            line['error'] = str(e)
+        except Exception as e:
+            line['error'] = f"{type(e).__name__}: {e}"
+        line['elapsed'] = round(time.monotonic() - start, 4)
+        return line
+
+    def _emit(self, line):
+        self.count += 1
+        if not line['ok']:
+            self.failed += 1
+        self.output.write(json.dumps(line) + '\n')
+        self.output.flush()
+
+    def run(self, lines):
+        """Run every operation from an iterable of JSON lines; returns the number that failed"""
+        futures = {}
+        pending = collections.deque()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for number, raw in enumerate(lines, 1):
+                raw = raw.strip()
+                if not raw or raw.startswith('#'):
+                    continue
+                try:
+                    operation = json.loads(raw)
+                    if not isinstance(operation, dict):
+                        raise ValueError('expected a JSON object')
+                except ValueError as e:
+                    pending.append(_done({'line': number, 'id': None, 'op': None, 'ok': False,
+                                          'error': f"invalid JSON: {e}", 'elapsed': 0.0}))
+                else:
+                    try:
+                        dependencies = self._dependencies(operation, futures)
+                    except BatchError as e:
+                        future = _done({'line': number, 'id': operation.get('id'), 'op': operation.get('op'),
+                                        'ok': False, 'error': str(e), 'elapsed': 0.0})
+                    else:
+                        # FIFO scheduling: everything an operation references was submitted (and started) first
+                        future = pool.submit(self._execute, number, operation, dependencies)
+                    op_id = operation.get('id')
+                    if isinstance(op_id, str) and op_id and op_id not in futures:
+                        futures[op_id] = future
+                    pending.append(future)
+                while pending and (pending[0].done() or len(pending) >= self.window):
+                    self._emit(pending.popleft().result())
+            while pending:
+                self._emit(pending.popleft().result())
+        return self.failed
+
+    # -- operations -------------------------------------------------------
+
+    def op_list(self, operation):
+        kind = operation.get('kind', 'applications')
+        if kind not in LIST_KINDS:
+            raise BatchError(f"unknown kind {kind!r} (expected one of {', '.join(LIST_KINDS)})")
+        if kind == 'servers':
+            return list(self.api.iter_servers())
+        if kind == 'applications':
+            return list(self.api.iter_applications())
+        from coolify_http import iter_resources
+        return list(iter_resources(self.api.session, f"{self.api.base_url}/api/v1/deployments"))
+
+    def op_create(self, operation):
+        if not operation.get('name') or not operation.get('repo'):
+            raise BatchError('create needs name and repo')
+        result = self.api.create_application(operation['name'], operation['repo'], operation.get('branch', 'main'))
+        if result is None:
+            raise BatchError('application creation failed')
+        return result
+
+    def _app_id(self, app):
+        if not app:
+            raise BatchError('app is required')
+        # find() tries the uuid before names, so a long lowercase name still resolves
+        matches = self.api.find_applications(app)
+        if not matches and UUID_PATTERN.match(str(app)):
+            return app  # Not in the inventory yet, e.g. created earlier in this batch
+        if len(matches) != 1:
+            raise BatchError(f"'{app}' matches {len(matches)} applications, expected exactly one")
+        return matches[0].get('uuid') or matches[0].get('id')
+
+    def op_deploy(self, operation):
+        result = self.api.deploy_application(self._app_id(operation.get('app')), operation.get('branch', 'main'),
+                                             operation.get('force', False))
+        if result is None:
+            raise BatchError('deployment failed to start')
+        return result
+
+    def op_monitor(self, operation):
+        deployment = operation.get('deployment')
+        if not deployment:
+            raise BatchError('monitor needs a deployment uuid')
+        timeout = float(operation.get('timeout', 600))
+        interval = float(operation.get('interval', 5))
+        deadline = time.monotonic() + timeout
+        while True:
+            response = self.api.session.get(f"{self.api.base_url}/api/v1/deployments/{deployment}")
+            if response.status_code != 200:
+                raise BatchError(f"deployment status unavailable: HTTP {response.status_code}")
+            status = response.json()
+            if str(status.get('status', '')).lower() in FINISHED_STATUSES:
+                if status['status'] != 'finished':
+                    raise BatchError(f"deployment {status['status']}")
+                return status
+            if time.monotonic() + interval > deadline:
+                raise BatchError(f"deployment still {status.get('status')} after {timeout:g}s")
+            time.sleep(interval)
+
+
+def _done(value):
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+def open_session(base_url, email, password, concurrency=DEFAULT_CONCURRENCY):
+    """One logged-in CoolifyAPI whose connection pool fits the batch concurrency"""
+    from coolify_cassette import CassetteAdapter
+    from coolify_final_deploy import CoolifyAPI
+    from coolify_timing import TimingAdapter
+
+    api = CoolifyAPI(base_url)
+    if not isinstance(api.session.get_adapter(base_url), CassetteAdapter):
+        adapter = TimingAdapter(pool_maxsize=max(10, concurrency))
+        api.session.mount('http://', adapter)
+        api.session.mount('https://', adapter)
+    if not api.login(email, password):
+        return None
+    return api
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run NDJSON Coolify operations from a file or stdin',
+                                     epilog='Each line: {"op": "list|create|deploy|monitor", "id": ..., ...}; '
+                                            '"$id" values refer to the result of an earlier line ("$$" for a literal "$").')
+    parser.add_argument('input', nargs='?', default='-', help='Operations file (default: stdin)')
+    parser.add_argument('--url', default='https://coolify.247420.xyz', help='Coolify base URL')
+    parser.add_argument('--email', default='admin@247420.xyz', help='Email for login')
+    parser.add_argument('--password', default='123,slam123,slam', help='Password for login')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help='Operations in flight')
+    args = parser.parse_args(argv)
+
+    output = sys.stdout
+    # Client progress prints go to stderr so stdout stays pure JSONL
+    with contextlib.redirect_stdout(sys.stderr):
+        api = open_session(args.url, args.email, args.password, args.concurrency)
+        if api is None:
+            output.write(json.dumps({'line': 0, 'op': 'login', 'ok': False, 'error': 'login failed'}) + '\n')
+            return 1
+        runner = BatchRunner(api, args.concurrency, output)
+        try:
+            if args.input == '-':
+                failed = runner.run(sys.stdin)
+            else:
+                with open(args.input) as f:
+                    failed = runner.run(f)
+        finally:
+            api.close()
+        print(f"📦 {runner.count} operations, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
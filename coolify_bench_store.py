@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Coolify Benchmark Store
+Keeps coolify_benchmark runs with their git/Python/machine metadata and compares runs for regressions
+"""
+
+import argparse
+import functools
+import json
+import math
+import os
+import re
+import sys
+
+DEFAULT_STORE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'coolify-cli', 'benchmarks')
+DEFAULT_THRESHOLD = 0.05  # Relative change below which a difference is not reported
+DEFAULT_ALPHA = 0.05
+EXACT_LIMIT = 20  # Largest sample size for the exact Mann-Whitney distribution
+
+
+def get_store_dir():
+    return os.environ.get('COOLIFY_BENCH_STORE', DEFAULT_STORE_DIR)
+
+
+@functools.lru_cache(maxsize=None)
+def _u_counts(m, n):
+    """Number of orderings of m vs n samples giving each U value (no ties)"""
+    if m == 0 or n == 0:
+        return (1,)
+    counts = [0] * (m * n + 1)
+    # The largest value belongs to the first sample (adds n to U) or to the second
+    for u, count in enumerate(_u_counts(m - 1, n)):
+        counts[u + n] += count
+    for u, count in enumerate(_u_counts(m, n - 1)):
+        counts[u] += count
+    return tuple(counts)
+
+
+def mann_whitney(a, b):
+    """Two-sided Mann-Whitney U test; returns the p-value (None if a sample is empty)
+
+    Exact for small samples without ties, normal approximation with tie
+    correction otherwise. Makes no normality assumption, which suits
+    timing data with its long right tail.
+    """
+    m, n = len(a), len(b)
+    if not m or not n:
+        return None
+    values = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    ranks = [0.0] * len(values)
+    tie_term = 0
+    i = 0
+    while i < len(values):
+        j = i
+        while j + 1 < len(values) and values[j + 1][0] == values[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        size = j - i + 1
+        tie_term += size ** 3 - size
+        i = j + 1
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, values) if group == 0)
+    u = rank_sum - m * (m + 1) / 2
+
+    if not tie_term and m <= EXACT_LIMIT and n <= EXACT_LIMIT:
+        counts = _u_counts(m, n)
+        total = sum(counts)
+        u = int(round(u))
+        lower = sum(counts[:u + 1]) / total
+        upper = sum(counts[u:]) / total
+        return min(1.0, 2 * min(lower, upper))
+
+    mean = m * n / 2
+    variance = m * n / 12 * ((m + n + 1) - tie_term / ((m + n) * (m + n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (abs(u - mean) - 0.5) / math.sqrt(variance)
+    return min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2)))
+
+
+def compare_results(base, head, threshold=DEFAULT_THRESHOLD, alpha=DEFAULT_ALPHA):
+    """Per-benchmark comparison rows for two reports ({'meta', 'results'})
+
+    A change is flagged only when it is statistically significant
+    (Mann-Whitney on the per-round times), larger than threshold and
+    larger than twice the rounds' relative spread, so run-to-run noise is
+    not reported as a regression.
+    """
+    base_results = {r['name']: r for r in base['results']}
+    head_results = {r['name']: r for r in head['results']}
+    rows = []
+    for name in list(base_results) + [n for n in head_results if n not in base_results]:
+        old, new = base_results.get(name), head_results.get(name)
+        if old is None or new is None:
+            rows.append({'name': name, 'status': 'added' if old is None else 'removed',
+                         'base': old and old['median'], 'head': new and new['median'],
+                         'change': None, 'p_value': None})
+            continue
+        change = new['median'] / old['median'] - 1 if old['median'] else None
+        p_value = mann_whitney(old.get('times') or [], new.get('times') or [])
+        noise = max(_spread(old), _spread(new))
+        if change is None or abs(change) < threshold:
+            status = 'unchanged'
+        elif p_value is None or len(old.get('times') or []) < 2 or len(new.get('times') or []) < 2:
+            # Single-round runs cannot be tested; fall back to the noise band alone
+            status = ('slower' if change > 0 else 'faster') if abs(change) > max(threshold, 2 * noise) else 'noise'
+        elif p_value < alpha and abs(change) > 2 * noise:
+            status = 'slower' if change > 0 else 'faster'
+        else:
+            status = 'noise'
+        rows.append({'name': name, 'status': status, 'base': old['median'], 'head': new['median'],
+                     'change': change, 'p_value': p_value, 'noise': noise})
+    return rows
+
+
+def _spread(result):
+    """Relative spread (stdev / median) of a result's rounds"""
+    if not result.get('median'):
+        return 0.0
+    return (result.get('stdev') or 0.0) / result['median']
+
+
+class BenchmarkStore:
+    """A directory of benchmark reports, one JSON file per run named <timestamp>-<sha>"""
+
+    def __init__(self, path=None):
+        self.path = path or get_store_dir()
+
+    def save(self, report, label=None):
+        """Store a report from coolify_benchmark and return its run id"""
+        os.makedirs(self.path, exist_ok=True)
+        meta = report.get('meta') or {}
+        stamp = re.sub(r'[^0-9T]', '', (meta.get('timestamp') or '')[:19]) or 'unknown'
+        run_id = f"{stamp}-{(meta.get('git_sha') or 'nogit')[:10]}"
+        if meta.get('git_dirty'):
+            run_id += '-dirty'
+        if label:
+            run_id += '-' + re.sub(r'[^A-Za-z0-9_.-]', '_', label)
+        report = dict(report, meta=dict(meta, run_id=run_id, label=label))
+        with open(os.path.join(self.path, run_id + '.json'), 'w') as f:
+            json.dump(report, f, indent=2)
+        return run_id
+
+    def run_ids(self):
+        """Stored run ids, oldest first"""
+        if not os.path.isdir(self.path):
+            return []
+        return sorted(name[:-5] for name in os.listdir(self.path) if name.endswith('.json'))
+
+    def resolve(self, ref):
+        """Run id for 'latest', 'latest~N', a run id prefix, a label or a git SHA prefix"""
+        runs = self.run_ids()
+        if not runs:
+            raise LookupError(f"No benchmark runs stored in {self.path}")
+        match = re.fullmatch(r'latest(?:~(\d+))?', ref)
+        if match:
+            back = int(match.group(1) or 0)
+            if back >= len(runs):
+                raise LookupError(f"Only {len(runs)} runs stored, cannot go back {back}")
+            return runs[-1 - back]
+        candidates = [run for run in runs if run.startswith(ref)]
+        if not candidates:
+            candidates = [run for run in runs
+                          if len(ref) >= 4 and any(part.startswith(ref) for part in run.split('-')[1:])]
+        if not candidates:
+            raise LookupError(f"No stored run matches {ref!r}")
+        return candidates[-1]  # Newest run for a SHA or label
+
+    def load(self, ref):
+        """Load a stored run by reference, or a results JSON file by path"""
+        if os.path.isfile(ref):
+            with open(ref) as f:
+                return json.load(f)
+        with open(os.path.join(self.path, self.resolve(ref) + '.json')) as f:
+            return json.load(f)
+
+
+def format_change(change):
+    return '' if change is None else f"{change * 100:+.1f}%"
+
+
+def print_comparison(base, head, rows):
+    from coolify_benchmark import format_seconds
+
+    base_meta, head_meta = base.get('meta') or {}, head.get('meta') or {}
+    print(f"📊 {base_meta.get('run_id') or base_meta.get('git_sha')} → {head_meta.get('run_id') or head_meta.get('git_sha')}")
+    for key in ('python', 'machine', 'cpu_count', 'platform'):
+        if base_meta.get(key) != head_meta.get(key):
+            print(f"   ⚠️  {key} differs: {base_meta.get(key)} vs {head_meta.get(key)} (timings may not be comparable)")
+    icons = {'slower': '🔴', 'faster': '🟢', 'unchanged': '⚪', 'noise': '〰️', 'added': '➕', 'removed': '➖'}
+    print(f"   {'benchmark':<50}{'base':>10}{'head':>10}{'change':>9}{'p':>8}  status")
+    for row in rows:
+        base_time = format_seconds(row['base']) if row['base'] is not None else '-'
+        head_time = format_seconds(row['head']) if row['head'] is not None else '-'
+        p_value = '' if row['p_value'] is None else f"{row['p_value']:.3f}"
+        print(f"   {row['name']:<50}{base_time:>10}{head_time:>10}{format_change(row['change']):>9}{p_value:>8}"
+              f"  {icons[row['status']]} {row['status']}")
+    slower = [row for row in rows if row['status'] == 'slower']
+    faster = [row for row in rows if row['status'] == 'faster']
+    print(f"\n{'❌' if slower else '✅'} {len(slower)} regressions, {len(faster)} improvements, "
+          f"{len(rows) - len(slower) - len(faster)} unchanged or within noise")
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Store and compare Coolify benchmark runs')
+    parser.add_argument('--store', default=None, help=f'Results directory (default: {DEFAULT_STORE_DIR})')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    save = commands.add_parser('save', help='Store a results file written by coolify_benchmark.py --output')
+    save.add_argument('results')
+    save.add_argument('--label')
+
+    run = commands.add_parser('run', help='Run the benchmarks and store the results')
+    run.add_argument('--filter')
+    run.add_argument('--repeat', type=int, default=5)
+    run.add_argument('--min-time', type=float, default=0.2)
+    run.add_argument('--label')
+
+    commands.add_parser('list', help='List stored runs')
+
+    compare = commands.add_parser('compare', help='Compare two runs (default: latest~1 against latest)')
+    compare.add_argument('base', nargs='?', default='latest~1', help='Run reference or results file')
+    compare.add_argument('head', nargs='?', default='latest', help='Run reference or results file')
+    compare.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                         help='Relative change treated as meaningful (default 0.05 = 5%%)')
+    compare.add_argument('--alpha', type=float, default=DEFAULT_ALPHA, help='Significance level')
+    compare.add_argument('--fail-on-regression', action='store_true', help='Exit 1 if anything got slower')
+    args = parser.parse_args()
+
+    store = BenchmarkStore(args.store)
+    try:
+        if args.command == 'save':
+            with open(args.results) as f:
+                report = json.load(f)
+            print(f"💾 Stored run {store.save(report, args.label)} in {store.path}")
+
+        elif args.command == 'run':
+            import tempfile
+            import coolify_benchmark
+
+            coolify_benchmark.isolate_environment(tempfile.mkdtemp(prefix='coolify-bench-'))
+            print("🏁 Running Coolify benchmarks")
+            results = coolify_benchmark.run_benchmarks(args.filter, args.repeat, args.min_time)
+            coolify_benchmark.stop_standin()
+            report = {'meta': coolify_benchmark.environment_metadata(), 'results': results}
+            print(f"💾 Stored run {store.save(report, args.label)} in {store.path}")
+
+        elif args.command == 'list':
+            for run_id in store.run_ids():
+                meta = store.load(run_id).get('meta') or {}
+                print(f"   {run_id:<48} python {meta.get('python')}  {meta.get('machine')}  "
+                      f"{meta.get('cpu_count')} CPUs")
+
+        elif args.command == 'compare':
+            base, head = store.load(args.base), store.load(args.head)
+            rows = compare_results(base, head, args.threshold, args.alpha)
+            slower = print_comparison(base, head, rows)
+            if slower and args.fail_on_regression:
+                return 1
+    except (LookupError, OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
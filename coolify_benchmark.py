@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Coolify Benchmark Suite
+Times token extraction, page parsing, payload builders, end-to-end flows against the local stand-in server and CLI startup
+"""
+
+import argparse
+import contextlib
+import html
+import io
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+from coolify_standin_server import FIXTURE_DIR
+
+BENCHMARKS = []
+
+TOKEN_PATTERN = re.compile(r'name="_token"[^>]*value="([^"]*)"')
+SNAPSHOT_PATTERN = re.compile(r'wire:snapshot="([^"]*)"')
+SIMULATOR_BUILDERS = ['generate_livewire_init_data', 'generate_repo_validation_data', 'generate_build_config_data',
+                      'generate_destination_data', 'generate_app_creation_data', 'generate_deployment_start_data']
+FLEET_SIZES = [10, 1000, 50000]
+
+
+def benchmark(name, group, missing=None):
+    """Register a benchmark; the decorated function does setup and returns the callable to time
+
+    missing names an optional dependency that is not installed, which
+    makes the benchmark report itself as skipped.
+    """
+    def register(setup):
+        BENCHMARKS.append({'name': name, 'group': group, 'setup': setup, 'missing': missing})
+        return setup
+    return register
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+@contextlib.contextmanager
+def quiet():
+    """Swallow the clients' progress prints while timing"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+# -- parsing ----------------------------------------------------------------
+
+@benchmark('parse.login_token_regex', 'parse')
+def bench_login_token_regex():
+    page = fixture('login_page_fresh.html')
+    return lambda: TOKEN_PATTERN.search(page).group(1)
+
+
+@benchmark('parse.login_token_soup', 'parse', missing=None if BeautifulSoup else 'beautifulsoup4')
+def bench_login_token_soup():
+    page = fixture('login_page_fresh.html')
+    return lambda: BeautifulSoup(page, 'html.parser').find('meta', {'name': 'csrf-token'}).get('content')
+
+
+@benchmark('parse.dashboard_environments', 'parse')
+def bench_dashboard_environments():
+    from coolify_inventory import parse_environments
+    page = fixture('deployment__resources.html')
+    return lambda: parse_environments(page)
+
+
+@benchmark('parse.dashboard_soup_links', 'parse', missing=None if BeautifulSoup else 'beautifulsoup4')
+def bench_dashboard_soup_links():
+    page = fixture('deployment__resources.html')
+
+    def run():
+        soup = BeautifulSoup(page, 'html.parser')
+        return [a['href'] for a in soup.find_all('a', href=True) if '/environment/' in a['href']]
+    return run
+
+
+@benchmark('parse.resource_page_snapshots', 'parse')
+def bench_resource_page_snapshots():
+    page = fixture('resource_page.html')
+    return lambda: [json.loads(html.unescape(raw)) for raw in SNAPSHOT_PATTERN.findall(page)]
+
+
+def _fleet_dashboard(size):
+    def setup():
+        from coolify_fleet_generator import Fleet, FleetSite
+        from coolify_inventory import parse_environments
+        page = FleetSite(Fleet.generate(size)).page('/')
+        return lambda: parse_environments(page)
+    return setup
+
+
+for _size in FLEET_SIZES:
+    benchmark(f"scale.dashboard_environments[{_size}]", 'scale')(_fleet_dashboard(_size))
+
+
+def _fleet_index(size):
+    def setup():
+        from coolify_fleet_generator import Fleet
+        from coolify_index import ApplicationIndex
+        apps = Fleet.generate(size).applications
+        return lambda: ApplicationIndex(apps)
+    return setup
+
+
+for _size in FLEET_SIZES:
+    benchmark(f"scale.application_index[{_size}]", 'scale')(_fleet_index(_size))
+
+
+# -- payload builders -------------------------------------------------------
+
+def _builder(method):
+    def setup():
+        from deployment_simulation import CoolifyDeploymentSimulator
+        with quiet():
+            simulator = CoolifyDeploymentSimulator(os.path.join(tempfile.mkdtemp(), 'network.jsonl'))
+        return getattr(simulator, method)
+    return setup
+
+
+for _method in SIMULATOR_BUILDERS:
+    benchmark(f"payload.{_method}", 'payload')(_builder(_method))
+
+
+# -- end-to-end flows -------------------------------------------------------
+
+_standin = None
+
+
+def standin():
+    """One stand-in server shared by all flow benchmarks"""
+    global _standin
+    if _standin is None:
+        from coolify_standin_server import StandInServer
+        _standin = StandInServer(deploy_duration=0.0).start()
+    return _standin
+
+
+def stop_standin():
+    global _standin
+    if _standin is not None:
+        _standin.stop()
+        _standin = None
+
+
+@benchmark('flow.login', 'flow')
+def bench_flow_login():
+    from coolify_final_deploy import CoolifyAPI
+    base_url = standin().base_url
+
+    def run():
+        with quiet():
+            return CoolifyAPI(base_url).login('bench@example.com', 'bench')
+    return run
+
+
+@benchmark('flow.login_create_deploy_monitor', 'flow')
+def bench_flow_full():
+    from coolify_final_deploy import CoolifyAPI
+    base_url = standin().base_url
+
+    def run():
+        with quiet():
+            api = CoolifyAPI(base_url)
+            api.login('bench@example.com', 'bench')
+            app = api.create_application('bench-app', 'https://github.com/AnEntrypoint/nixpacks-test-app')
+            api.deploy_application(app['uuid'])
+            while True:
+                status = api.session.get(f"{base_url}/api/v1/applications/{app['uuid']}").json()['status']
+                if status.startswith('running'):
+                    return status
+    return run
+
+
+# -- CLI startup (whole interpreter runs; cheap commands should stay under 100 ms) --
+
+def _command(*argv):
+    """Setup that times one interpreter run of a repo script (or of bare interpreter options)"""
+    def setup():
+        script = os.path.join(FIXTURE_DIR, argv[0]) if argv[0].endswith('.py') else argv[0]
+        command = [sys.executable, script] + list(argv[1:])
+
+        def run():
+            subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        return run
+    return setup
+
+
+benchmark('startup.python_baseline', 'startup')(_command('-c', 'pass'))
+benchmark('startup.coolify_help', 'startup')(_command('coolify_cli.py', '--help'))
+benchmark('startup.coolify_deploy_help', 'startup')(_command('coolify_cli.py', 'deploy', '--help'))
+benchmark('startup.legacy_final_deploy_help', 'startup')(_command('coolify_final_deploy.py', '--help'))
+
+
+@benchmark('startup.coolify_servers_cached', 'startup')
+def bench_servers_cached():
+    from coolify_cli import DEFAULT_URL
+    from coolify_inventory import get_inventory
+    get_inventory().put(os.environ.get('COOLIFY_URL', DEFAULT_URL), 'servers',
+                        [{'uuid': f"server{n}", 'name': f"server-{n}", 'ip': f"10.0.0.{n}"} for n in range(5)])
+    return _command('coolify_cli.py', 'servers')()
+
+
+# -- runner -----------------------------------------------------------------
+
+def isolate_environment(directory):
+    """Keep benchmarks off the user's caches and the shared rate limiter"""
+    os.environ['COOLIFY_RATE_LIMIT'] = '0'
+    os.environ['COOLIFY_INVENTORY_DB'] = os.path.join(directory, 'inventory.db')
+    os.environ['COOLIFY_CAPABILITIES_FILE'] = os.path.join(directory, 'capabilities.json')
+    os.environ.pop('COOLIFY_CASSETTE', None)
+
+
+def git_revision():
+    try:
+        sha = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=FIXTURE_DIR, capture_output=True, text=True,
+                             timeout=10).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=FIXTURE_DIR,
+                               capture_output=True, text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None, None
+    return sha or None, bool(dirty)
+
+
+def package_version(name):
+    try:
+        module = __import__(name)
+    except ImportError:
+        return None
+    return getattr(module, '__version__', None)
+
+
+def environment_metadata():
+    sha, dirty = git_revision()
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'git_sha': sha,
+        'git_dirty': dirty,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'packages': {name: package_version(name) for name in ('requests', 'urllib3', 'bs4')},
+    }
+
+
+def measure(func, repeat=5, min_time=0.2):
+    """Per-call seconds for each of `repeat` rounds, looping enough calls to last min_time"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1_000_000:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+
+    times = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    return number, times
+
+
+def run_benchmarks(pattern=None, repeat=5, min_time=0.2):
+    results = []
+    for entry in BENCHMARKS:
+        if pattern and not re.search(pattern, entry['name']):
+            continue
+        if entry['missing']:
+            print(f"⏭️  {entry['name']}: {entry['missing']} not installed")
+            continue
+        func = entry['setup']()
+        number, times = measure(func, repeat, min_time)
+        result = {
+            'name': entry['name'],
+            'group': entry['group'],
+            'number': number,
+            'repeat': repeat,
+            'times': times,
+            'min': min(times),
+            'median': statistics.median(times),
+            'mean': statistics.mean(times),
+            'stdev': statistics.stdev(times) if len(times) > 1 else 0.0,
+        }
+        results.append(result)
+        print(f"⏱️  {entry['name']:<48} {format_seconds(result['median']):>10}  "
+              f"±{format_seconds(result['stdev']):>9}  ({number} × {repeat})")
+    return results
+
+
+def format_seconds(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('µs', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Coolify tooling benchmarks')
+    parser.add_argument('--filter', help='Only run benchmarks whose name matches this regex')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help='Minimum seconds per timing round')
+    parser.add_argument('--output', help='Write results as JSON to this file')
+    parser.add_argument('--list', action='store_true', help='List benchmarks and exit')
+    parser.add_argument('--save', action='store_true', help='Also keep the run in the benchmark store')
+    parser.add_argument('--label', help='Label for the stored run (with --save)')
+    args = parser.parse_args()
+
+    if args.list:
+        for entry in BENCHMARKS:
+            print(f"{entry['group']:<8} {entry['name']}")
+        return 0
+
+    isolate_environment(tempfile.mkdtemp(prefix='coolify-bench-'))
+    print("🏁 Running Coolify benchmarks")
+    results = run_benchmarks(args.filter, args.repeat, args.min_time)
+    stop_standin()
+
+    report = {'meta': environment_metadata(), 'results': results}
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Results saved to {args.output}")
+    if args.save:
+        from coolify_bench_store import BenchmarkStore
+        store = BenchmarkStore()
+        print(f"💾 Stored run {store.save(report, args.label)} in {store.path} "
+              f"(compare with: python3 coolify_bench_store.py compare)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
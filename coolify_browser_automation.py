@@ -4,7 +4,6 @@ Coolify Browser Automation Tool
 Uses web scraping to simulate browser interactions for deployment automation
 """
 
-import requests
 import re
 import json
 import sys
@@ -12,11 +11,12 @@ import time
 import argparse
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
+from coolify_http import create_session
 
 class CoolifyBrowserAutomation:
     def __init__(self, base_url="https://coolify.247420.xyz"):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.verify = False
         # Set browser-like headers
         self.session.headers.update({
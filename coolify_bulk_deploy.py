@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Coolify Bulk Deployment Executor
+Runs many deploy jobs over one session with priority scheduling and aging
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import deque
+
+# Lower value = more urgent
+PRIORITIES = {
+    'urgent': 0,
+    'high': 1,
+    'normal': 2,
+    'low': 3,
+}
+
+
+def parse_priority(value):
+    """Accept a priority name ('urgent') or number (0)"""
+    if isinstance(value, int):
+        return value
+    value = str(value).strip().lower()
+    if value in PRIORITIES:
+        return PRIORITIES[value]
+    return int(value)
+
+
+def priority_name(priority):
+    for name, value in PRIORITIES.items():
+        if value == priority:
+            return name
+    return str(priority)
+
+
+class DeployJob:
+    """One deploy request in a bulk run"""
+
+    def __init__(self, app_id, branch="main", force_rebuild=False, priority='normal', name=None, delay=0.0):
+        self.app_id = app_id
+        self.branch = branch
+        self.force_rebuild = force_rebuild
+        self.priority = parse_priority(priority)
+        self.name = name or str(app_id)
+        self.delay = delay  # Seconds after the run starts before the job is enqueued
+        self.enqueued_at = None
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            app_id=data['app_id'],
+            branch=data.get('branch', 'main'),
+            force_rebuild=data.get('force_rebuild', data.get('force', False)),
+            priority=data.get('priority', 'normal'),
+            name=data.get('name'),
+            delay=float(data.get('delay', 0.0)),
+        )
+
+    @property
+    def wait_time(self):
+        if self.enqueued_at is None or self.started_at is None:
+            return None
+        return self.started_at - self.enqueued_at
+
+    def to_dict(self):
+        return {
+            'app_id': self.app_id,
+            'name': self.name,
+            'branch': self.branch,
+            'priority': priority_name(self.priority),
+            'wait_seconds': self.wait_time,
+            'run_seconds': (self.finished_at - self.started_at) if self.finished_at else None,
+            'success': self.error is None and self.result is not None,
+            'error': self.error,
+        }
+
+
+class PriorityDeployQueue:
+    """Priority queue with aging: one FIFO per priority level
+
+    A job's effective priority improves by one level for every
+    ``aging_interval`` seconds it waits, so low-priority jobs still finish
+    during a long stream of urgent ones. Aging only reorders jobs that were
+    enqueued at different times; jobs put at the same moment age alike.
+    Picking the next job only compares the head of each level, so ``get``
+    is O(number of levels).
+    """
+
+    def __init__(self, aging_interval=30.0):
+        self.aging_interval = aging_interval
+        self._levels = {}
+        self._seq = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def put(self, job):
+        with self._cond:
+            job.enqueued_at = time.monotonic()
+            self._seq += 1
+            self._levels.setdefault(job.priority, deque()).append((self._seq, job))
+            self._cond.notify()
+
+    def close(self):
+        """Let get() return None once the queue drains"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def __len__(self):
+        with self._cond:
+            return sum(len(level) for level in self._levels.values())
+
+    def depth_by_priority(self):
+        with self._cond:
+            return {priority: len(level) for priority, level in self._levels.items() if level}
+
+    def _effective(self, priority, job, now):
+        if not self.aging_interval:
+            return priority
+        return priority - (now - job.enqueued_at) / self.aging_interval
+
+    def get(self):
+        """Block until a job is available; None when closed and empty"""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                best = None
+                for priority, level in self._levels.items():
+                    if not level:
+                        continue
+                    seq, job = level[0]
+                    key = (self._effective(priority, job, now), seq)
+                    if best is None or key < best[0]:
+                        best = (key, priority)
+                if best is not None:
+                    _, job = self._levels[best[1]].popleft()
+                    return job
+                if self._closed:
+                    return None
+                self._cond.wait()
+
+
+class BulkDeployExecutor:
+    """Worker pool that drains a PriorityDeployQueue"""
+
+    def __init__(self, deploy_func, workers=4, aging_interval=30.0):
+        self.deploy_func = deploy_func
+        self.workers = workers
+        self.queue = PriorityDeployQueue(aging_interval)
+        self.completed = []
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def submit(self, job):
+        self.queue.put(job)
+        return job
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"deploy-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def join(self):
+        """Close the queue and wait for all submitted jobs"""
+        self.queue.close()
+        for thread in self._threads:
+            thread.join()
+        return self.completed
+
+    def run(self, jobs):
+        """Start the workers, then enqueue each job once its delay has passed"""
+        self.start()
+        started = time.monotonic()
+        for job in sorted(jobs, key=lambda job: job.delay):
+            pause = started + job.delay - time.monotonic()
+            if pause > 0:
+                time.sleep(pause)
+            self.submit(job)
+        return self.join()
+
+    def _worker(self):
+        while True:
+            job = self.queue.get()
+            if job is None:
+                return
+            job.started_at = time.monotonic()
+            print(f"🚀 [{priority_name(job.priority)}] {job.name} waited {job.wait_time:.2f}s")
+            try:
+                job.result = self.deploy_func(job)
+                if job.result is None:
+                    job.error = "Deployment did not start"
+            except Exception as e:
+                job.error = str(e)
+            job.finished_at = time.monotonic()
+            with self._lock:
+                self.completed.append(job)
+
+    def publish_metrics(self, registry):
+        """Expose the queue depth per priority as a gauge"""
+        registry.gauge('coolify_deploy_queue_depth', 'Deploy jobs waiting per priority', ('priority',),
+                       func=lambda: {(priority_name(p),): n for p, n in self.queue.depth_by_priority().items()})
+
+    def wait_stats(self):
+        """Queue wait time per priority: count, mean, p50, p95, max"""
+        by_priority = {}
+        for job in self.completed:
+            by_priority.setdefault(job.priority, []).append(job.wait_time)
+
+        stats = {}
+        for priority in sorted(by_priority):
+            waits = sorted(by_priority[priority])
+            count = len(waits)
+            stats[priority_name(priority)] = {
+                'count': count,
+                'mean': sum(waits) / count,
+                'p50': waits[int(0.5 * (count - 1))],
+                'p95': waits[int(0.95 * (count - 1))],
+                'max': waits[-1],
+            }
+        return stats
+
+    def print_report(self):
+        print("\n=== Queue Wait Time by Priority ===")
+        for name, s in self.wait_stats().items():
+            print(f"   {name:<8} n={s['count']:<4} mean={s['mean']:.2f}s "
+                  f"p50={s['p50']:.2f}s p95={s['p95']:.2f}s max={s['max']:.2f}s")
+        failed = [job for job in self.completed if job.error]
+        print(f"✅ Succeeded: {len(self.completed) - len(failed)}  ❌ Failed: {len(failed)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Coolify bulk deploy with priorities')
+    parser.add_argument('jobs', help='JSON file with a list of {"app_id", "branch", "priority", "delay"} jobs '
+                                     '("-" for stdin); delay is seconds after the start before a job is queued')
+    parser.add_argument('--email', default='admin@247420.xyz', help='Email for login')
+    parser.add_argument('--password', default='123,slam123,slam', help='Password for login')
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent deploys')
+    parser.add_argument('--aging', type=float, default=30.0,
+                        help='Seconds of waiting that promote a job by one priority level (0 disables); '
+                             'only reorders jobs queued at different times, see "delay"')
+    parser.add_argument('--output', help='Write per-job results and wait stats as JSON')
+    parser.add_argument('--metrics-port', type=int, help='Serve OpenMetrics on this localhost port while running')
+    args = parser.parse_args()
+
+    from coolify_final_deploy import CoolifyAPI
+
+    if args.jobs == '-':
+        raw_jobs = json.load(sys.stdin)
+    else:
+        with open(args.jobs) as f:
+            raw_jobs = json.load(f)
+    jobs = [DeployJob.from_dict(item) for item in raw_jobs]
+
+    api = CoolifyAPI()
+    if not api.login(args.email, args.password):
+        sys.exit(1)
+
+    def deploy(job):
+        return api.deploy_application(job.app_id, job.branch, job.force_rebuild)
+
+    executor = BulkDeployExecutor(deploy, workers=args.workers, aging_interval=args.aging)
+    if args.metrics_port is not None:
+        from coolify_metrics import get_metrics, start_metrics_server
+        executor.publish_metrics(get_metrics())
+        start_metrics_server(args.metrics_port)
+    executor.run(jobs)
+    executor.print_report()
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'jobs': [job.to_dict() for job in executor.completed],
+                'wait_stats': executor.wait_stats(),
+            }, f, indent=2)
+        print(f"📁 Results saved to {args.output}")
+
+    sys.exit(0 if all(job.error is None for job in executor.completed) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Coolify Endpoint Capability Discovery
+Probes candidate endpoints concurrently once per instance and version, then remembers the winner
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+DEFAULT_STORE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'coolify-cli', 'capabilities.json')
+
+# Candidate endpoints per capability, in order of preference
+CAPABILITY_CANDIDATES = {
+    'servers': ['/api/v1/servers', '/api/servers', '/servers'],
+    'applications': ['/api/v1/applications', '/api/applications', '/applications'],
+    'resources': ['/api/v1/resources', '/api/resources'],
+}
+
+
+class CapabilityStore:
+    """Per-instance JSON record of what works, discarded when the Coolify version changes
+
+    Nothing is read or written while the version is unknown (None): such a
+    record could not be tied to a release and would evict the real one.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.environ.get('COOLIFY_CAPABILITIES_FILE', DEFAULT_STORE_PATH)
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _modify(self, func):
+        """Read-modify-write the store under a thread lock and an flock"""
+        with self._lock:
+            with open(f"{self.path}.lock", 'a') as lock_file:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                data = self._read()
+                result = func(data)
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, 'w') as f:
+                    json.dump(data, f, indent=2)
+                os.replace(tmp_path, self.path)
+                return result
+
+    def section(self, instance, version, name):
+        """Stored entries for one section, or {} if recorded under another version"""
+        if version is None:
+            return {}
+        entry = self._read().get(instance)
+        if not entry or entry.get('version') != version:
+            return {}
+        return entry.get(name, {})
+
+    def get(self, instance, version, name, key):
+        return self.section(instance, version, name).get(key)
+
+    def set(self, instance, version, name, key, value):
+        if version is None:
+            return
+
+        def apply(data):
+            entry = data.get(instance)
+            if not entry or entry.get('version') != version:
+                entry = data[instance] = {'version': version}
+            entry.setdefault(name, {})[key] = value
+        self._modify(apply)
+
+    def update(self, instance, version, name, key, func):
+        """Replace a stored value with func(current value or None)"""
+        if version is None:
+            return
+
+        def apply(data):
+            entry = data.get(instance)
+            if not entry or entry.get('version') != version:
+                entry = data[instance] = {'version': version}
+            section = entry.setdefault(name, {})
+            section[key] = func(section.get(key))
+        self._modify(apply)
+
+    def delete(self, instance, version, name, key):
+        if version is None:
+            return
+
+        def apply(data):
+            entry = data.get(instance)
+            if entry and entry.get('version') == version:
+                entry.get(name, {}).pop(key, None)
+        self._modify(apply)
+
+
+def looks_like_json_list(response):
+    """True for a 200 whose body is a JSON array or a paginated {"data": [...]} object"""
+    if response.status_code != 200:
+        return False
+    if 'html' in response.headers.get('Content-Type', '').lower():
+        return False
+    for chunk in response.iter_content(1024):
+        chunk = chunk.lstrip()
+        if chunk:
+            return chunk.startswith(b'[') or chunk.startswith(b'{')
+    return False
+
+
+class CapabilityProber:
+    """Find the working endpoint for a capability with one concurrent probe"""
+
+    def __init__(self, session, base_url, store=None):
+        self.session = session
+        self.base_url = base_url
+        self.store = store or get_capability_store()
+
+    @property
+    def version(self):
+        return getattr(self.session, 'coolify_version', None)
+
+    def _check(self, endpoint, validate):
+        try:
+            response = self.session.get(f"{self.base_url}{endpoint}", stream=True, allow_redirects=False)
+        except Exception:
+            return False
+        try:
+            return validate(response)
+        finally:
+            response.close()
+
+    def probe(self, candidates, validate=looks_like_json_list):
+        """Check every candidate in parallel; return the preferred one that works"""
+        with ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+            results = list(pool.map(lambda endpoint: self._check(endpoint, validate), candidates))
+        for endpoint, ok in zip(candidates, results):
+            if ok:
+                return endpoint
+        return None
+
+    def resolve(self, capability, candidates=None, validate=looks_like_json_list, refresh=False):
+        """Return the stored endpoint for a capability, probing only if unknown"""
+        if not refresh:
+            endpoint = self.store.get(self.base_url, self.version, 'endpoints', capability)
+            if endpoint:
+                return endpoint
+
+        candidates = candidates or CAPABILITY_CANDIDATES[capability]
+        endpoint = self.probe(candidates, validate)
+        if endpoint:
+            self.store.set(self.base_url, self.version, 'endpoints', capability, endpoint)
+        return endpoint
+
+    def invalidate(self, capability):
+        """Forget a stored endpoint after it stopped working"""
+        self.store.delete(self.base_url, self.version, 'endpoints', capability)
+
+
+class StrategyMemory:
+    """Remembers which of several equivalent strategies works for an operation
+
+    The winner is tried first on later runs and strategies that proved
+    unsupported are skipped, until the instance's Coolify version changes.
+    """
+
+    def __init__(self, session, base_url, operation, store=None):
+        self.session = session
+        self.base_url = base_url
+        self.operation = operation
+        self.store = store or get_capability_store()
+
+    @property
+    def version(self):
+        return getattr(self.session, 'coolify_version', None)
+
+    def _memory(self):
+        return self.store.get(self.base_url, self.version, 'strategies', self.operation) or {}
+
+    def order(self, strategies):
+        """Strategies to try: last winner first, known-bad ones left out"""
+        memory = self._memory()
+        bad = set(memory.get('bad', []))
+        ordered = [name for name in strategies if name not in bad]
+        winner = memory.get('winner')
+        if winner in ordered:
+            ordered.remove(winner)
+            ordered.insert(0, winner)
+        return ordered
+
+    def record_success(self, strategy):
+        def apply(memory):
+            memory = memory or {}
+            memory['winner'] = strategy
+            memory['bad'] = [name for name in memory.get('bad', []) if name != strategy]
+            return memory
+        self.store.update(self.base_url, self.version, 'strategies', self.operation, apply)
+
+    def record_failure(self, strategy):
+        """Mark a strategy as unsupported on this version (use for definite failures only)"""
+        def apply(memory):
+            memory = memory or {}
+            if memory.get('winner') == strategy:
+                memory.pop('winner')
+            bad = memory.setdefault('bad', [])
+            if strategy not in bad:
+                bad.append(strategy)
+            return memory
+        self.store.update(self.base_url, self.version, 'strategies', self.operation, apply)
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_capability_store():
+    """Return the process-wide capability store"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = CapabilityStore()
+        return _default_store
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Coolify Record/Replay Transport
+Records real request/response pairs into a cassette file and replays them offline at repeatable speed
+"""
+
+import base64
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from http.client import parse_headers
+
+import requests
+from urllib3 import HTTPResponse
+
+from coolify_timing import TimingAdapter
+
+CASSETTE_MODES = ('record', 'replay')
+
+# Hop-by-hop and encoding headers that no longer describe the stored (decoded) body
+STRIPPED_HEADERS = {'content-encoding', 'transfer-encoding', 'content-length', 'connection', 'keep-alive'}
+
+
+class CassetteMiss(requests.ConnectionError):
+    """Raised in replay mode for a request the cassette has no answer for"""
+
+
+def body_digest(body):
+    if not body:
+        return None
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    elif not isinstance(body, bytes):
+        return None  # Streaming upload bodies are matched on method and URL only
+    return hashlib.sha256(body).hexdigest()[:16]
+
+
+def encode_body(content):
+    try:
+        return {'text': content.decode('utf-8')}
+    except UnicodeDecodeError:
+        return {'base64': base64.b64encode(content).decode('ascii')}
+
+
+def decode_body(stored):
+    if 'base64' in stored:
+        return base64.b64decode(stored['base64'])
+    return stored.get('text', '').encode('utf-8')
+
+
+def parse_latency(value):
+    """None (no delay), 'recorded' (replay recorded timings) or a fixed number of seconds"""
+    if value in (None, '', 'none', '0'):
+        return None
+    if value == 'recorded':
+        return value
+    return float(value)
+
+
+class _OriginalResponse:
+    """Just enough of http.client.HTTPResponse for requests' cookie extraction"""
+
+    def __init__(self, msg):
+        self.msg = msg
+
+    def isclosed(self):
+        return True
+
+    def close(self):
+        pass
+
+
+class Cassette:
+    """A JSONL file of interactions, one line per request
+
+    Replay matches on method, URL and body digest, then falls back to
+    method and URL, handing out recorded answers in order; once a key's
+    answers run out the last one repeats (polling loops keep working).
+    """
+
+    def __init__(self, path, mode='replay', latency=None):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode {mode!r} (expected record or replay)")
+        self.path = path
+        self.mode = mode
+        self.latency = parse_latency(latency) if isinstance(latency, str) else latency
+        self._lock = threading.Lock()
+        self._file = None
+        self._exact = {}
+        self._loose = {}
+        self._cursor = {}
+        if mode == 'replay':
+            self._load()
+        else:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(path, 'w', encoding='utf-8')
+
+    def _load(self):
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    interaction = json.loads(line)
+                except ValueError:
+                    continue  # Last line of an interrupted recording
+                request = interaction['request']
+                self._exact.setdefault((request['method'], request['url'], request.get('body')), []).append(interaction)
+                self._loose.setdefault((request['method'], request['url']), []).append(interaction)
+
+    def __len__(self):
+        return sum(len(interactions) for interactions in self._loose.values())
+
+    def record(self, request, response, elapsed):
+        raw = getattr(response.raw, '_original_response', None)
+        headers = list(raw.msg.items()) if raw is not None else list(response.headers.items())
+        interaction = {
+            'request': {'method': request.method, 'url': request.url, 'body': body_digest(request.body)},
+            'response': {
+                'status': response.status_code,
+                'reason': response.reason,
+                'headers': [(k, v) for k, v in headers if k.lower() not in STRIPPED_HEADERS],
+                'body': encode_body(response.content),
+            },
+            'elapsed': round(elapsed, 6),
+        }
+        with self._lock:
+            self._file.write(json.dumps(interaction) + '\n')
+            self._file.flush()
+
+    def _next(self, table, key):
+        interactions = table.get(key)
+        if not interactions:
+            return None
+        index = self._cursor.get(key, 0)
+        self._cursor[key] = index + 1
+        return interactions[min(index, len(interactions) - 1)]
+
+    def match(self, request):
+        with self._lock:
+            interaction = self._next(self._exact, (request.method, request.url, body_digest(request.body)))
+            if interaction is None:
+                interaction = self._next(self._loose, (request.method, request.url))
+        if interaction is None:
+            raise CassetteMiss(f"No recorded response for {request.method} {request.url} in {self.path}",
+                               request=request)
+        return interaction
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class CassetteAdapter(TimingAdapter):
+    """Transport adapter that records through the network (timed) or replays from a cassette"""
+
+    def __init__(self, cassette, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if self.cassette.mode == 'record':
+            start = time.perf_counter()
+            response = super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert,
+                                    proxies=proxies)
+            response.content  # Read the body now so it can be stored; iter_content still works
+            self.cassette.record(request, response, time.perf_counter() - start)
+            return response
+        return self._replay(request)
+
+    def _replay(self, request):
+        interaction = self.cassette.match(request)
+        stored = interaction['response']
+        latency = self.cassette.latency
+        if latency == 'recorded':
+            time.sleep(interaction.get('elapsed', 0))
+        elif latency:
+            time.sleep(latency)
+
+        body = decode_body(stored['body'])
+        header_lines = ''.join(f"{k}: {v}\r\n" for k, v in stored['headers'])
+        header_lines += f"Content-Length: {len(body)}\r\n\r\n"
+        msg = parse_headers(io.BytesIO(header_lines.encode('latin-1')))
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers=list(msg.items()),
+            status=stored['status'],
+            reason=stored.get('reason'),
+            preload_content=False,
+            decode_content=False,
+            original_response=_OriginalResponse(msg),
+            request_method=request.method,
+            request_url=request.url,
+        )
+        return self.build_response(request, raw)
+
+
+def mount_cassette(session, cassette):
+    """Route every http(s) request of a session through the cassette"""
+    adapter = CassetteAdapter(cassette)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+_cassettes = {}
+_cassettes_lock = threading.Lock()
+
+
+def cassette_from_env():
+    """Process-wide cassette named by COOLIFY_CASSETTE, or None
+
+    COOLIFY_CASSETTE_MODE is record or replay (default replay) and
+    COOLIFY_CASSETTE_LATENCY is 'recorded' or a fixed delay in seconds.
+    """
+    path = os.environ.get('COOLIFY_CASSETTE')
+    if not path:
+        return None
+    mode = os.environ.get('COOLIFY_CASSETTE_MODE', 'replay')
+    with _cassettes_lock:
+        cassette = _cassettes.get((path, mode))
+        if cassette is None:
+            cassette = Cassette(path, mode, os.environ.get('COOLIFY_CASSETTE_LATENCY'))
+            _cassettes[(path, mode)] = cassette
+        return cassette
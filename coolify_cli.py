@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Unified Coolify CLI
+One entry point with subcommands; heavy modules (requests, bs4) are imported only by the subcommand that needs them
+"""
+
+import argparse
+import os
+import sys
+
+DEFAULT_URL = 'https://coolify.247420.xyz'
+
+
+def _api(args):
+    from coolify_final_deploy import CoolifyAPI
+    return CoolifyAPI(args.url, refresh=getattr(args, 'refresh', False))
+
+
+def _cached(args, kind):
+    """Records of a fresh inventory kind, or None (reads SQLite only; no HTTP stack imported)"""
+    if getattr(args, 'refresh', False):
+        return None
+    from coolify_inventory import get_inventory
+    inventory = get_inventory()
+    if not inventory.is_fresh(args.url, kind):
+        return None
+    return inventory.iter_records(args.url, kind)
+
+
+def _via_agent(args, command, **params):
+    """Reply from a running coolify agent, or None to fall back to doing the work here"""
+    if args.no_agent:
+        return None
+    from coolify_agent import agent_call
+    return agent_call(command, url=args.url, email=args.email, password=args.password, **params)
+
+
+def _print_servers(servers, source=''):
+    count = 0
+    for server in servers:
+        count += 1
+        print(f"   - {server.get('name', 'Unknown')} ({server.get('ip', 'No IP')}) - "
+              f"Status: {server.get('status', 'Unknown')}")
+    print(f"✅ Found {count} servers{source}")
+
+
+def _print_apps(apps, source=''):
+    count = 0
+    for app in apps:
+        count += 1
+        print(f"   - {app.get('name', 'Unknown')} ({app.get('git_repository', 'No repo')}) - "
+              f"Status: {app.get('status', 'Unknown')}")
+    print(f"✅ Found {count} applications{source}")
+
+
+def _print_matches(matches):
+    print(f"✅ Found {len(matches)} matching applications")
+    for app in matches:
+        print(f"   - {app.get('name', 'Unknown')} ({app.get('uuid', 'No UUID')}) - {app.get('fqdn', 'No domain')}")
+
+
+def cmd_login(args):
+    api = _api(args)
+    if not api.login(args.email, args.password):
+        return 1
+    return 0 if api.test_authentication() else 1
+
+
+def cmd_servers(args):
+    reply = _via_agent(args, 'servers', refresh=args.refresh)
+    if reply is not None:
+        if not reply['ok']:
+            print(f"❌ {reply['error']}")
+            return 1
+        _print_servers(reply['items'], ' (agent)')
+        return 0
+    servers = _cached(args, 'servers')
+    if servers is not None:
+        _print_servers(servers, ' (cached)')
+        return 0
+    api = _api(args)
+    if not api.login(args.email, args.password):
+        return 1
+    api.get_servers(keep=False)
+    return 0
+
+
+def cmd_apps(args):
+    if args.find:
+        reply = _via_agent(args, 'find', query=args.find, refresh=args.refresh)
+        if reply is not None and reply['ok']:
+            matches = reply['items']
+        else:
+            if reply is not None:
+                print(f"❌ {reply['error']}")
+                return 1
+            api = _api(args)
+            if not api.has_fresh_inventory('applications') and not api.login(args.email, args.password):
+                return 1
+            matches = api.find_applications(args.find)
+        _print_matches(matches)
+        return 0 if matches else 1
+
+    reply = _via_agent(args, 'applications', refresh=args.refresh)
+    if reply is not None:
+        if not reply['ok']:
+            print(f"❌ {reply['error']}")
+            return 1
+        _print_apps(reply['items'], ' (agent)')
+        return 0
+    apps = _cached(args, 'applications')
+    if apps is not None:
+        _print_apps(apps, ' (cached)')
+        return 0
+    api = _api(args)
+    if not api.login(args.email, args.password):
+        return 1
+    api.get_applications(keep=False)
+    return 0
+
+
+def cmd_deploy(args):
+    reply = _via_agent(args, 'deploy', app=args.app, branch=args.branch, force=args.force)
+    if reply is not None:
+        if not reply['ok']:
+            print(f"❌ {reply['error']}")
+            return 1
+        print("✅ Deployment started successfully! (agent)")
+        print(f"   Deployment ID: {(reply['result'] or {}).get('id', 'Unknown')}")
+        return 0
+    api = _api(args)
+    if not api.login(args.email, args.password):
+        return 1
+    matches = api.find_applications(args.app)
+    if len(matches) != 1:
+        print(f"❌ '{args.app}' matches {len(matches)} applications, expected exactly one")
+        return 1
+    app_id = matches[0].get('uuid') or matches[0].get('id')
+    return 0 if api.deploy_application(app_id, args.branch, args.force) else 1
+
+
+def cmd_agent(args):
+    from coolify_agent import main as agent_main
+    return agent_main([args.action] + args.agent_args)
+
+
+def cmd_batch(args):
+    from coolify_batch import main as batch_main
+    return batch_main([args.input, '--url', args.url, '--email', args.email, '--password', args.password,
+                       '--concurrency', str(args.concurrency)])
+
+
+def cmd_monitor(args):
+    from coolify_metrics import MonitorDaemon, start_metrics_server
+
+    server = start_metrics_server(args.port, args.host)
+    print(f"📈 Metrics at http://{args.host}:{server.server_address[1]}/metrics")
+    daemon = MonitorDaemon(args.url, args.email, args.password, args.interval)
+    try:
+        if args.once:
+            return 0 if daemon.poll_once() else 1
+        daemon.run()
+    except KeyboardInterrupt:
+        print("\n👋 Stopping monitor")
+    finally:
+        server.shutdown()
+    return 0
+
+
+def cmd_test(args):
+    from coolify_test_runner import main as runner_main
+
+    argv = ['--url', args.url, '--email', args.email, '--password', args.password, '--jobs', str(args.jobs)]
+    for suite in args.suite or []:
+        argv += ['--suite', suite]
+    if args.output:
+        argv += ['--output', args.output]
+    return runner_main(argv)
+
+
+def cmd_simulate(args):
+    from deployment_simulation import CoolifyDeploymentSimulator
+
+    simulator = CoolifyDeploymentSimulator(args.network_log) if args.network_log else CoolifyDeploymentSimulator()
+    simulator.base_url = args.url
+    simulator.username = args.email
+    simulator.password = args.password
+    return 0 if simulator.run_simulation() else 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='coolify', description='Coolify command line tools')
+    parser.add_argument('--url', default=os.environ.get('COOLIFY_URL', DEFAULT_URL), help='Coolify base URL')
+    parser.add_argument('--email', default=os.environ.get('COOLIFY_EMAIL', 'admin@247420.xyz'), help='Email for login')
+    parser.add_argument('--password', default=os.environ.get('COOLIFY_PASSWORD', '123,slam123,slam'),
+                        help='Password for login')
+    parser.add_argument('--no-agent', action='store_true', help='Do not hand commands to a running coolify agent')
+    parser.add_argument('--profile', nargs='?', const='deterministic', choices=('deterministic', 'sampling'),
+                        help='Profile the command (see coolify_profiling)')
+    commands = parser.add_subparsers(dest='command', metavar='command', required=True)
+
+    login = commands.add_parser('login', help='Log in and check the session')
+    login.set_defaults(func=cmd_login)
+
+    servers = commands.add_parser('servers', help='List servers (served from the local cache while fresh)')
+    servers.add_argument('--refresh', action='store_true', help='Ignore the local inventory cache')
+    servers.set_defaults(func=cmd_servers)
+
+    apps = commands.add_parser('apps', help='List applications (served from the local cache while fresh)')
+    apps.add_argument('--find', metavar='QUERY', help='Only applications matching a UUID, name, repository or domain')
+    apps.add_argument('--refresh', action='store_true', help='Ignore the local inventory cache')
+    apps.set_defaults(func=cmd_apps)
+
+    deploy = commands.add_parser('deploy', help='Deploy one application')
+    deploy.add_argument('app', help='Application UUID, name, repository or domain')
+    deploy.add_argument('--branch', default='main', help='Git branch')
+    deploy.add_argument('--force', action='store_true', help='Force rebuild')
+    deploy.add_argument('--refresh', action='store_true', help='Ignore the local inventory cache')
+    deploy.set_defaults(func=cmd_deploy)
+
+    agent = commands.add_parser('agent', help='Start, stop or query the warm background agent')
+    agent.add_argument('action', choices=['serve', 'start', 'stop', 'status'])
+    agent.add_argument('agent_args', nargs=argparse.REMAINDER, help='Options for coolify_agent.py')
+    agent.set_defaults(func=cmd_agent)
+
+    batch = commands.add_parser('batch', help='Run NDJSON operations (list, create, deploy, monitor) from a file or stdin')
+    batch.add_argument('input', nargs='?', default='-', help='Operations file (default: stdin)')
+    batch.add_argument('--concurrency', type=int, default=8, help='Operations in flight')
+    batch.set_defaults(func=cmd_batch)
+
+    monitor = commands.add_parser('monitor', help='Poll the instance and serve OpenMetrics')
+    monitor.add_argument('--host', default='127.0.0.1', help='Address to serve /metrics on')
+    monitor.add_argument('--port', type=int, default=9464)
+    monitor.add_argument('--interval', type=float, default=30.0, help='Seconds between polls')
+    monitor.add_argument('--once', action='store_true', help='Poll once and exit')
+    monitor.set_defaults(func=cmd_monitor)
+
+    test = commands.add_parser('test', help='Run the live diagnostic checks (independent checks in parallel)')
+    test.add_argument('--suite', action='append', choices=['cli', 'complete', 'simple', 'comprehensive', 'all'],
+                      help='Suite to run (repeatable; default: cli)')
+    test.add_argument('--jobs', type=int, default=8, help='Checks run at once (1: serial)')
+    test.add_argument('--output', help='Write per-check timings and statuses as JSON to this file')
+    test.set_defaults(func=cmd_test)
+
+    simulate = commands.add_parser('simulate', help='Run the recorded deployment simulation')
+    simulate.add_argument('--network-log', help='JSONL file for the recorded requests')
+    simulate.set_defaults(func=cmd_simulate)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.profile:
+        from coolify_profiling import Profiler
+        with Profiler(args.profile):
+            return args.func(args)
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        print("\n❌ Operation cancelled")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
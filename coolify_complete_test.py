@@ -12,13 +12,15 @@ import subprocess
 import sys
 import re
 from urllib.parse import urljoin
+from coolify_capabilities import CapabilityProber
+from coolify_http import create_session
 
 class CoolifyCompleteTest:
     def __init__(self):
         self.base_url = "https://coolify.247420.xyz"
         self.username = os.getenv("COOLIFY_USERNAME", "admin@247420.xyz")
         self.password = os.getenv("COOLIFY_PASSWORD", "123,slam123,slam")
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.verify = False
         self.test_results = {}
         self.authenticated = False
@@ -114,22 +116,12 @@ class CoolifyCompleteTest:
             self.log("resources_access", "success" if resources_response.status_code == 200 else "failed",
                     f"Status: {resources_response.status_code}")
             
-            # Test API endpoints if available
-            api_endpoints = [
-                "/api/v1/servers",
-                "/api/servers", 
-                "/api/v1/resources",
-                "/api/resources"
-            ]
-            
-            for endpoint in api_endpoints:
-                try:
-                    api_response = self.session.get(urljoin(self.base_url, endpoint))
-                    self.log(f"api_{endpoint.replace('/', '_')}", 
-                            "success" if api_response.status_code == 200 else "failed",
-                            f"Status: {api_response.status_code}")
-                except:
-                    self.log(f"api_{endpoint.replace('/', '_')}", "failed", "Request failed")
+            # Find the working API endpoints with one concurrent probe (cached per instance/version)
+            prober = CapabilityProber(self.session, self.base_url)
+            for capability in ('servers', 'resources'):
+                endpoint = prober.resolve(capability)
+                self.log(f"api_{capability}", "success" if endpoint else "failed",
+                        f"Endpoint: {endpoint}" if endpoint else "No working endpoint")
             
             return True
             
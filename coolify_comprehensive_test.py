@@ -4,12 +4,12 @@ Comprehensive Coolify Deployment Test
 Tests login, server access, and creates a test deployment
 """
 
-import requests
 import json
 import sys
 import time
 import urllib3
 from urllib.parse import urljoin
+from coolify_http import create_session
 
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -17,7 +17,7 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 class CoolifyComprehensiveTest:
     def __init__(self, base_url="https://coolify.247420.xyz"):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.verify = False
         # Set proper headers
         self.session.headers.update({
@@ -53,7 +53,7 @@ class CoolifyComprehensiveTest:
             patterns = [
                 r'name="_token"[^>]*value="([^"]*)"',
                 r'name="csrf-token"[^>]*content="([^"]*)"',
-                r'csrfToken: '([^']*)'',
+                r"csrfToken: '([^']*)'",
                 r'"_token":"([^"]*)"'
             ]
             
@@ -223,34 +223,29 @@ class CoolifyComprehensiveTest:
         results = {}
         
         # Test 1: Login
-        print("
-1️⃣ LOGIN TEST")
+        print("\n1️⃣ LOGIN TEST")
         print("-" * 30)
         login_success, login_message = self.test_login(email, password)
         results['login'] = {'success': login_success, 'message': login_message}
         
         if not login_success:
-            print("
-❌ Login failed - stopping tests")
+            print("\n❌ Login failed - stopping tests")
             return results
         
         # Test 2: API Endpoints
-        print("
-2️⃣ API ENDPOINTS TEST")
+        print("\n2️⃣ API ENDPOINTS TEST")
         print("-" * 30)
         successful_endpoints = self.test_api_endpoints()
         results['api_endpoints'] = {'successful': successful_endpoints, 'count': len(successful_endpoints)}
         
         # Test 3: Application Creation
-        print("
-3️⃣ APPLICATION CREATION TEST")
+        print("\n3️⃣ APPLICATION CREATION TEST")
         print("-" * 30)
         app_creation_success, app_creation_message = self.test_create_application()
         results['app_creation'] = {'success': app_creation_success, 'message': app_creation_message}
         
         # Summary
-        print("
-" + "=" * 60)
+        print("\n" + "=" * 60)
         print("📊 TEST RESULTS SUMMARY")
         print("=" * 60)
         print(f"✅ Login: {'SUCCESS' if login_success else 'FAILED'}")
@@ -274,8 +269,7 @@ def main():
     with open('coolify_test_results.json', 'w') as f:
         json.dump(results, f, indent=2)
     
-    print(f"
-📁 Results saved to coolify_test_results.json")
+    print(f"\n📁 Results saved to coolify_test_results.json")
 
 if __name__ == "__main__":
     main()
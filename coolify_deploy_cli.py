@@ -4,16 +4,16 @@ Coolify Deployment CLI Tool
 Based on workflow analysis from https://coolify.247420.xyz
 """
 
-import requests
 import json
 import sys
 import time
 from urllib.parse import urljoin
+from coolify_http import create_session
 
 class CoolifyDeployer:
     def __init__(self, base_url="https://coolify.247420.xyz"):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.verify = False  # For SSL issues
         
     def login(self, email, password):
@@ -4,21 +4,33 @@ Coolify Application Deployment Tool
 Deploys AnEntrypoint/nixpacks-test-app to Coolify
 """
 
-import requests
 import json
 import sys
 import time
 import urllib3
 import re
-from urllib.parse import urljoin
+from urllib.parse import urljoin, unquote, urlparse
+from coolify_capabilities import StrategyMemory
+from coolify_http import create_session
+from coolify_profiling import profile_main
+from coolify_tracing import traced
 
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Ways to create an application, in the order they are tried on a fresh instance
+CREATION_STRATEGIES = [
+    '/applications',
+    '/api/v1/applications',
+    '/livewire/update',
+    '/new-application',
+    'livewire',
+]
+
 class CoolifyApplicationDeployer:
     def __init__(self, base_url="https://coolify.247420.xyz"):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.verify = False
         
         # Browser-like headers
@@ -29,7 +41,9 @@ class CoolifyApplicationDeployer:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
+        self.creation_strategies = StrategyMemory(self.session, self.base_url, 'create_application')
 
+    @traced()
     def login(self, email, password):
         """Login to Coolify"""
         print(f"🔐 Logging in to {self.base_url}")
@@ -62,6 +76,7 @@ class CoolifyApplicationDeployer:
         except Exception as e:
             return False, f"Login error: {e}"
 
+    @traced()
     def get_servers(self):
         """Get available servers for deployment"""
         print("🖥️ Getting available servers...")
@@ -80,8 +95,8 @@ class CoolifyApplicationDeployer:
                 server_patterns = [
                     r'data-server-id="([^"]*)"',
                     r'data-server-uuid="([^"]*)"',
-                    r'wire:id=["']([^"']*)["'].*server',
-                    r'server.*?uuid["']?\s*[:=]\s*["']([^"']*)["']',
+                    r'wire:id=["\']([^"\']*)["\'].*server',
+                    r'server.*?uuid["\']?\s*[:=]\s*["\']([^"\']*)["\']',
                 ]
                 
                 servers = []
@@ -105,6 +120,7 @@ class CoolifyApplicationDeployer:
             print(f"   ❌ Error getting servers: {e}")
             return []
 
+    @traced()
     def deploy_application(self, repo_url, app_name=None, server_uuid=None):
         """Deploy an application from GitHub repository"""
         print(f"🚀 Deploying application from {repo_url}")
@@ -128,7 +144,7 @@ class CoolifyApplicationDeployer:
             content = response.text
             
             # Extract any tokens or form data
-            csrf_match = re.search(r'name=["']_token["']\s*value=["']([^"']+)["']', content)
+            csrf_match = re.search(r'name=["\']_token["\']\s*value=["\']([^"\']+)["\']', content)
             csrf_token = csrf_match.group(1) if csrf_match else None
             
             if csrf_token:
@@ -155,118 +171,147 @@ class CoolifyApplicationDeployer:
             if csrf_token:
                 app_data['_token'] = csrf_token
             
-            # Try different form submission approaches
-            submission_endpoints = [
-                '/applications',
-                '/api/v1/applications', 
-                '/livewire/update',
-                '/new-application',
-            ]
+            # Try the strategy that worked last time first, skipping ones known not to exist
+            strategies = self.creation_strategies.order(CREATION_STRATEGIES)
             
-            for endpoint in submission_endpoints:
-                try:
-                    print(f"   Trying endpoint: {endpoint}")
-                    
-                    submit_response = self.session.post(
-                        f"{self.base_url}{endpoint}",
-                        data=app_data,
-                        allow_redirects=False
-                    )
-                    
-                    print(f"     Response status: {submit_response.status_code}")
-                    
-                    if submit_response.status_code in [200, 201, 302]:
-                        print(f"     ✅ Application creation successful via {endpoint}")
-                        
-                        # Check response for application ID
-                        try:
-                            if submit_response.headers.get('Content-Type', '').startswith('application/json'):
-                                result = submit_response.json()
-                                app_id = result.get('uuid') or result.get('id')
-                                if app_id:
-                                    print(f"     ✅ Application ID: {app_id}")
-                                    return True, f"Application created with ID: {app_id}"
-                            else:
-                                # Look for UUID in HTML response
-                                uuid_match = re.search(r'([a-f0-9-]{36})', submit_response.text)
-                                if uuid_match:
-                                    app_id = uuid_match.group(1)
-                                    print(f"     ✅ Application ID: {app_id}")
-                                    return True, f"Application created with ID: {app_id}"
-                        except:
-                            pass
-                        
-                        print(f"     ✅ Application created (no ID extracted)")
-                        return True, f"Application created via {endpoint}"
-                    
-                    elif submit_response.status_code == 419:
-                        print("     ⚠️  CSRF token expired")
-                    else:
-                        print(f"     ❌ Failed with status {submit_response.status_code}")
-                        if submit_response.status_code not in [404, 405]:
-                            print(f"     Response preview: {submit_response.text[:200]}")
+            for strategy in strategies:
+                if strategy == 'livewire':
+                    success, message, unsupported = self._create_via_livewire(content, app_data, csrf_token)
+                else:
+                    success, message, unsupported = self._create_via_form(strategy, app_data)
                 
-                except Exception as e:
-                    print(f"     ❌ Error with {endpoint}: {e}")
+                if success:
+                    self.creation_strategies.record_success(strategy)
+                    return True, message
+                if unsupported:
+                    self.creation_strategies.record_failure(strategy)
+            
+            return False, "All application creation methods failed"
+            
+        except Exception as e:
+            return False, f"Deployment error: {e}"
+
+    @traced()
+    def _create_via_form(self, endpoint, app_data):
+        """POST the creation form to one endpoint; returns (success, message, unsupported)"""
+        try:
+            print(f"   Trying endpoint: {endpoint}")
             
-            # Step 4: Try Livewire approach if regular form submission fails
-            if 'livewire' in content.lower():
-                print("3. Trying Livewire approach...")
+            submit_response = self.session.post(
+                f"{self.base_url}{endpoint}",
+                data=app_data,
+                allow_redirects=False
+            )
+            
+            print(f"     Response status: {submit_response.status_code}")
+            
+            # An expired session answers with a redirect to (or the body of) the login page
+            location = urljoin(f"{self.base_url}{endpoint}", submit_response.headers.get('Location', ''))
+            if ((submit_response.status_code == 302 and urlparse(location).path.startswith('/login'))
+                    or (submit_response.status_code == 200 and 'name="password"' in submit_response.text)):
+                print("     ❌ Sent back to the login page; the session is not logged in")
+                return False, "Not logged in", False
+            
+            if submit_response.status_code in [200, 201, 302]:
+                print(f"     ✅ Application creation successful via {endpoint}")
                 
-                # Extract Livewire component data
-                livewire_pattern = r'wire:initial-data=["']([^"']*)["']'
-                livewire_match = re.search(livewire_pattern, content)
+                # Check response for application ID
+                try:
+                    if submit_response.headers.get('Content-Type', '').startswith('application/json'):
+                        result = submit_response.json()
+                        app_id = result.get('uuid') or result.get('id')
+                        if app_id:
+                            print(f"     ✅ Application ID: {app_id}")
+                            return True, f"Application created with ID: {app_id}", False
+                    else:
+                        # Look for UUID in HTML response
+                        uuid_match = re.search(r'([a-f0-9-]{36})', submit_response.text)
+                        if uuid_match:
+                            app_id = uuid_match.group(1)
+                            print(f"     ✅ Application ID: {app_id}")
+                            return True, f"Application created with ID: {app_id}", False
+                except:
+                    pass
                 
-                if livewire_match:
-                    try:
-                        livewire_data = json.loads(urllib.parse.unquote(livewire_match.group(1)))
-                        print("   ✅ Livewire data extracted")
-                        
-                        # Prepare Livewire request
-                        livewire_payload = {
-                            'fingerprint': livewire_data.get('fingerprint', {}),
-                            'serverMemo': livewire_data.get('serverMemo', {}),
-                            'updates': [
-                                {
-                                    'type': 'callMethod',
-                                    'payload': {
-                                        'method': 'submit',
-                                        'params': [app_data]
-                                    }
-                                }
-                            ]
-                        }
-                        
-                        livewire_headers = {
-                            'Content-Type': 'application/json',
-                            'Accept': 'text/html,application/xhtml+xml',
-                            'X-Livewire': 'true',
-                            'X-Requested-With': 'XMLHttpRequest',
+                print(f"     ✅ Application created (no ID extracted)")
+                return True, f"Application created via {endpoint}", False
+            
+            elif submit_response.status_code == 419:
+                print("     ⚠️  CSRF token expired")
+            else:
+                print(f"     ❌ Failed with status {submit_response.status_code}")
+                if submit_response.status_code not in [404, 405]:
+                    print(f"     Response preview: {submit_response.text[:200]}")
+            
+            # 404/405 mean the route does not exist on this version; anything else may be transient
+            return False, f"HTTP {submit_response.status_code}", submit_response.status_code in [404, 405]
+        
+        except Exception as e:
+            print(f"     ❌ Error with {endpoint}: {e}")
+            return False, str(e), False
+
+    @traced()
+    def _create_via_livewire(self, content, app_data, csrf_token):
+        """Submit through the page's Livewire component; returns (success, message, unsupported)"""
+        if 'livewire' not in content.lower():
+            return False, "No Livewire on page", False
+        
+        print("3. Trying Livewire approach...")
+        
+        # Extract Livewire component data
+        livewire_pattern = r'wire:initial-data=["\']([^"\']*)["\']'
+        livewire_match = re.search(livewire_pattern, content)
+        
+        if not livewire_match:
+            return False, "No Livewire component data", False
+        
+        try:
+            livewire_data = json.loads(unquote(livewire_match.group(1)))
+            print("   ✅ Livewire data extracted")
+            
+            # Prepare Livewire request
+            livewire_payload = {
+                'fingerprint': livewire_data.get('fingerprint', {}),
+                'serverMemo': livewire_data.get('serverMemo', {}),
+                'updates': [
+                    {
+                        'type': 'callMethod',
+                        'payload': {
+                            'method': 'submit',
+                            'params': [app_data]
                         }
-                        
-                        if csrf_token:
-                            livewire_headers['X-CSRF-TOKEN'] = csrf_token
-                        
-                        livewire_response = self.session.post(
-                            f"{self.base_url}/livewire/update",
-                            json=livewire_payload,
-                            headers=livewire_headers
-                        )
-                        
-                        print(f"   Livewire response status: {livewire_response.status_code}")
-                        
-                        if livewire_response.status_code == 200:
-                            print("   ✅ Livewire application creation successful")
-                            return True, "Application created via Livewire"
-                        
-                    except Exception as e:
-                        print(f"   ❌ Livewire approach error: {e}")
+                    }
+                ]
+            }
             
-            return False, "All application creation methods failed"
+            livewire_headers = {
+                'Content-Type': 'application/json',
+                'Accept': 'text/html,application/xhtml+xml',
+                'X-Livewire': 'true',
+                'X-Requested-With': 'XMLHttpRequest',
+            }
+            
+            if csrf_token:
+                livewire_headers['X-CSRF-TOKEN'] = csrf_token
+            
+            livewire_response = self.session.post(
+                f"{self.base_url}/livewire/update",
+                json=livewire_payload,
+                headers=livewire_headers
+            )
+            
+            print(f"   Livewire response status: {livewire_response.status_code}")
+            
+            if livewire_response.status_code == 200:
+                print("   ✅ Livewire application creation successful")
+                return True, "Application created via Livewire", False
+            return False, f"HTTP {livewire_response.status_code}", livewire_response.status_code in [404, 405]
             
         except Exception as e:
-            return False, f"Deployment error: {e}"
+            print(f"   ❌ Livewire approach error: {e}")
+            return False, str(e), False
 
+    @traced()
     def monitor_deployment(self, app_id=None):
         """Monitor deployment status"""
         print("📊 Monitoring deployment...")
@@ -307,6 +352,7 @@ class CoolifyApplicationDeployer:
                 'message': f"Monitoring error: {e}"
             }
 
+    @traced()
     def full_deployment_test(self, email, password, repo_url, app_name=None):
         """Run full deployment test"""
         print("=" * 80)
@@ -374,7 +420,7 @@ class CoolifyApplicationDeployer:
 
 def main():
     if len(sys.argv) < 4:
-        print("Usage: python3 coolify_deploy_tool.py <email> <password> <repo_url> [app_name]")
+        print("Usage: python3 coolify_deploy_tool.py <email> <password> <repo_url> [app_name] [--profile[=sampling]]")
         print("Example: python3 coolify_deploy_tool.py admin@247420.xyz password https://github.com/AnEntrypoint/nixpacks-test-app.git nixpacks-test")
         sys.exit(1)
 
@@ -393,4 +439,4 @@ def main():
     print(f"\n📁 Results saved to coolify_deployment_results.json")
 
 if __name__ == "__main__":
-    main()
+    profile_main(main)
@@ -5,31 +5,29 @@ Tests deployment of AnEntrypoint/nixpacks-test-app to coolify.247420.xyz
 Captures all network communications and Livewire interactions
 """
 
-import requests
 import json
-import time
+import os
 from urllib.parse import urljoin
+from coolify_http import create_session
+from coolify_recorder import NetworkRecorder
+from coolify_request_log import RequestLog
+
+DEFAULT_NETWORK_LOG = "network_log.jsonl"  # In the working directory unless COOLIFY_NETWORK_LOG is set
 
 class CoolifyDeploymentTester:
-    def __init__(self):
+    def __init__(self, network_log_path=None):
         self.base_url = "https://coolify.247420.xyz"
-        self.session = requests.Session()
+        self.session = create_session()
         self.username = "admin@247420.xyz"
         self.password = "123,slam123,slam"
-        self.network_log = []
+        self.recorder = NetworkRecorder(network_log_path or os.environ.get('COOLIFY_NETWORK_LOG', DEFAULT_NETWORK_LOG),
+                                        body_limit=1000)
+        self.request_log = RequestLog()
         
     def log_request(self, method, url, data=None, response=None):
         """Log all network requests"""
-        log_entry = {
-            'timestamp': time.time(),
-            'method': method,
-            'url': url,
-            'data': data,
-            'response_status': response.status_code if response else None,
-            'response_headers': dict(response.headers) if response else None,
-            'response_data': response.text[:1000] if response and hasattr(response, 'text') else None
-        }
-        self.network_log.append(log_entry)
+        content_length = self.recorder.record(method, url, data, response=response)
+        self.request_log.log_response(method, url, response, content_length)
         print(f"📡 {method} {url} -> {response.status_code if response else 'N/A'}")
         
     def get_login_page(self):
@@ -190,10 +188,9 @@ class CoolifyDeploymentTester:
         
     def save_network_log(self):
         """Save network log to file"""
-        log_file = "/mnt/c/dev/setdomain/network_log.json"
-        with open(log_file, 'w') as f:
-            json.dump(self.network_log, f, indent=2)
-        print(f"💾 Network log saved to {log_file}")
+        self.recorder.flush()
+        print(f"💾 Network log saved to {self.recorder.path} ({self.recorder.count} requests)")
+        self.request_log.print_summary()
         
 if __name__ == "__main__":
     tester = CoolifyDeploymentTester()
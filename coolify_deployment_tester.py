@@ -1,13 +1,13 @@
-import requests
 import re
 import time
 import json
 from urllib.parse import urljoin
+from coolify_http import create_session
 
 class CoolifyDeploymentTester:
     def __init__(self, base_url="https://coolify.247420.xyz"):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -1,31 +1,26 @@
-import requests
 import re
 import json
 import time
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
+from coolify_http import create_session
+from coolify_resolver import EnvironmentResolver
 
 class CoolifyDeploymentTool:
     """Complete working Coolify deployment tool with real UUIDs"""
     
-    def __init__(self, base_url="https://coolify.247420.xyz"):
+    def __init__(self, base_url="https://coolify.247420.xyz", project=None):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = create_session()
         self.csrf_token = None
         
-        # Real UUIDs from reverse engineering
-        self.project_uuids = [
-            "ckgkgcwo00sc4ks4okcwgoww",
-            "gs4gc8css0sc0g8808kccow0"
-        ]
-        self.environment_uuids = [
-            "jsso4kwcwgw0oss0co8k4888", 
-            "ng000gkg0cccs80w8cc0ooos"
-        ]
-        
-        # Use the first project/environment pair
-        self.project_uuid = self.project_uuids[0]
-        self.environment_uuid = self.environment_uuids[0]
+        # Discovered from the dashboard once and stored per instance
+        self.resolver = EnvironmentResolver(self.session, base_url)
+        self.project = project  # Project name or UUID to deploy into (default: first)
+        self.project_uuids = []
+        self.environment_uuids = []
+        self.project_uuid = None
+        self.environment_uuid = None
         
         # Set proper headers
         self.session.headers.update({
@@ -100,6 +95,14 @@ class CoolifyDeploymentTool:
         except Exception as e:
             return False, f"Login error: {str(e)}"
     
+    def use_environment(self, env):
+        """Target a resolved project/environment pair"""
+        environments = self.resolver.environments()
+        self.project_uuids = [e['project_uuid'] for e in environments]
+        self.environment_uuids = [e['environment_uuid'] for e in environments]
+        self.project_uuid = env['project_uuid']
+        self.environment_uuid = env['environment_uuid']
+    
     def navigate_to_resource_creation(self):
         """Navigate to resource creation page with real UUIDs"""
         print(f"🚀 Navigating to resource creation page...")
@@ -184,8 +187,15 @@ class CoolifyDeploymentTool:
         if not success:
             return False, f"Login failed: {result}"
         
-        # Step 2: Navigate to resource creation
-        success, result = self.navigate_to_resource_creation()
+        # Step 2: Navigate to resource creation (rescanning the dashboard only if the stored IDs fail)
+        def navigate(env):
+            self.use_environment(env)
+            return self.navigate_to_resource_creation()
+        
+        env, outcome = self.resolver.call_with_revalidation(navigate, self.project)
+        if env is None:
+            return False, "Environment lookup failed: no project/environment found on dashboard"
+        success, result = outcome
         if not success:
             return False, f"Navigation failed: {result}"
         
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Coolify Multi-Instance Fan-Out
+Runs the same read or deploy operation against several Coolify instances in parallel
+"""
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class FanOutError(Exception):
+    """An operation that did not succeed on one instance"""
+
+
+def list_servers(api):
+    return list(api.iter_servers())
+
+
+def list_applications(api):
+    return list(api.iter_applications())
+
+
+def deploy_operation(app_id=None, branch="main", force_rebuild=False, app=None):
+    """Operation deploying app_id, or the one application app matches on each instance"""
+    def deploy(api):
+        target = app_id
+        if target is None:
+            matches = api.find_applications(app)
+            if len(matches) != 1:
+                raise FanOutError(f"'{app}' matches {len(matches)} applications, expected exactly one")
+            target = matches[0].get('uuid') or matches[0].get('id')
+        result = api.deploy_application(target, branch, force_rebuild)
+        if result is None:
+            raise FanOutError("Deployment did not start")
+        return result
+    return deploy
+
+
+class FanOutRunner:
+    """Run one operation per instance, each with its own client and session
+
+    An operation signals failure by raising; its return value is the result.
+    """
+
+    def __init__(self, instances, client_factory=None, max_workers=None):
+        # instances: list of {'base_url', 'email', 'password'} dicts
+        self.instances = instances
+        if client_factory is None:
+            from coolify_final_deploy import CoolifyAPI
+            client_factory = CoolifyAPI
+        self.client_factory = client_factory
+        self.max_workers = max_workers or max(1, len(instances))
+
+    def _run_one(self, instance, operation):
+        start = time.monotonic()
+        outcome = {'base_url': instance['base_url'], 'success': False, 'result': None, 'error': None}
+        try:
+            client = self.client_factory(instance['base_url'])
+            if not client.login(instance['email'], instance['password']):
+                outcome['error'] = "Login failed"
+            else:
+                outcome['result'] = operation(client)
+                outcome['success'] = True
+        except Exception as e:
+            outcome['error'] = str(e)
+        outcome['elapsed'] = time.monotonic() - start
+        return outcome
+
+    def run(self, operation):
+        """Run operation(client) on every instance; returns {base_url: outcome}"""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [(instance['base_url'], pool.submit(self._run_one, instance, operation))
+                       for instance in self.instances]
+            return {base_url: future.result() for base_url, future in futures}
+
+
+def merge_results(outcomes):
+    """Flatten list results from every instance, tagging items with their base_url
+
+    Errors stay separate, keyed by instance, so one failing instance never
+    hides the data returned by the others.
+    """
+    items = []
+    errors = {}
+    for base_url, outcome in outcomes.items():
+        if not outcome['success']:
+            errors[base_url] = outcome['error']
+            continue
+        result = outcome['result']
+        if isinstance(result, list):
+            for item in result:
+                if isinstance(item, dict):
+                    item = dict(item, instance=base_url)
+                items.append(item)
+        elif result is not None:
+            items.append({'instance': base_url, 'result': result})
+    return {'items': items, 'errors': errors}
+
+
+def load_instances(args):
+    if args.instances_file:
+        with open(args.instances_file) as f:
+            instances = json.load(f)
+    else:
+        instances = []
+    for base_url in args.instance or []:
+        instances.append({'base_url': base_url.rstrip('/')})
+    for instance in instances:
+        instance.setdefault('email', args.email)
+        instance.setdefault('password', args.password)
+    return instances
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a Coolify operation against many instances')
+    parser.add_argument('command', choices=['servers', 'apps', 'deploy'], help='Operation to fan out')
+    parser.add_argument('--instance', action='append', help='Instance base URL (repeatable)')
+    parser.add_argument('--instances-file',
+                        help='JSON list of {"base_url", "email", "password"} objects')
+    parser.add_argument('--email', default='admin@247420.xyz', help='Default email for login')
+    parser.add_argument('--password', default='123,slam123,slam', help='Default password for login')
+    parser.add_argument('--app-id', help='Application UUID or ID for deployment')
+    parser.add_argument('--app', help='Application UUID, name, repository or domain, looked up on each instance')
+    parser.add_argument('--branch', default='main', help='Git branch')
+    parser.add_argument('--force', action='store_true', help='Force rebuild')
+    parser.add_argument('--output', help='Write merged results as JSON')
+    args = parser.parse_args()
+
+    instances = load_instances(args)
+    if not instances:
+        print("❌ Give at least one --instance or --instances-file")
+        sys.exit(1)
+
+    if args.command == 'servers':
+        operation = list_servers
+    elif args.command == 'apps':
+        operation = list_applications
+    else:
+        if not args.app_id and not args.app:
+            print("❌ --app-id or --app is required for deploy command")
+            sys.exit(1)
+        operation = deploy_operation(args.app_id, args.branch, args.force, app=args.app)
+
+    start = time.monotonic()
+    outcomes = FanOutRunner(instances).run(operation)
+    wall = time.monotonic() - start
+
+    print("\n=== Fan-Out Results ===")
+    for base_url, outcome in outcomes.items():
+        status = "✅" if outcome['success'] else "❌"
+        detail = f" - {outcome['error']}" if outcome['error'] else ""
+        print(f"   {status} {base_url} ({outcome['elapsed']:.2f}s){detail}")
+    slowest = max(outcome['elapsed'] for outcome in outcomes.values())
+    print(f"⏱️  Wall time {wall:.2f}s (slowest instance {slowest:.2f}s)")
+
+    merged = merge_results(outcomes)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(merged, f, indent=2)
+        print(f"📁 Results saved to {args.output}")
+
+    sys.exit(1 if merged['errors'] else 0)
+
+
+if __name__ == "__main__":
+    main()
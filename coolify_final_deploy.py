@@ -9,15 +9,30 @@ import re
 import json
 import sys
 import argparse
+import threading
 from urllib.parse import urljoin
+from coolify_http import create_session, iter_resources
+from coolify_index import ApplicationIndex
+from coolify_inventory import get_inventory
+from coolify_profiling import add_profile_arguments, profiler_from_args
 
 class CoolifyAPI:
-    def __init__(self, base_url="https://coolify.247420.xyz"):
+    def __init__(self, base_url="https://coolify.247420.xyz", refresh=False):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.verify = False  # Ignore SSL warnings
         self.csrf_token = None
+        self.inventory = get_inventory()
+        self.refresh = refresh  # Bypass the inventory cache
+        self.index = None
+        self._index_lock = threading.Lock()
         
+    def close(self):
+        """Stop following inventory refreshes and release pooled connections"""
+        if self.index is not None:
+            self.index.detach()
+        self.session.close()
+    
     def login(self, email, password):
         """Login and establish session"""
         print(f"🔐 Logging in to {self.base_url}...")
@@ -80,45 +95,80 @@ class CoolifyAPI:
             print(f"❌ Authentication test failed: {e}")
             return False
     
-    def get_servers(self):
-        """Get list of servers"""
+    def has_fresh_inventory(self, kind):
+        """True if a cached lookup can be served without logging in"""
+        return not self.refresh and self.inventory.is_fresh(self.base_url, kind)
+
+    def iter_servers(self):
+        """Yield servers one at a time (paged or stream-decoded, cached locally)"""
+        return self.inventory.iter_through(
+            self.base_url, 'servers',
+            lambda: iter_resources(self.session, f"{self.base_url}/api/v1/servers"),
+            refresh=self.refresh)
+
+    def iter_applications(self):
+        """Yield applications one at a time (paged or stream-decoded, cached locally)"""
+        return self.inventory.iter_through(
+            self.base_url, 'applications',
+            lambda: iter_resources(self.session, f"{self.base_url}/api/v1/applications"),
+            refresh=self.refresh)
+
+    def get_servers(self, keep=True):
+        """Get list of servers (keep=False only prints, for flat memory)"""
+        servers = []
+        count = 0
         try:
-            response = self.session.get(f"{self.base_url}/api/v1/servers")
-            if response.status_code == 200:
-                servers = response.json()
-                print(f"✅ Found {len(servers)} servers")
-                for server in servers:
-                    name = server.get('name', 'Unknown')
-                    ip = server.get('ip', 'No IP')
-                    status = server.get('status', 'Unknown')
-                    print(f"   - {name} ({ip}) - Status: {status}")
-                return servers
-            else:
-                print(f"❌ Failed to get servers: {response.status_code}")
-                return []
+            for server in self.iter_servers():
+                count += 1
+                name = server.get('name', 'Unknown')
+                ip = server.get('ip', 'No IP')
+                status = server.get('status', 'Unknown')
+                print(f"   - {name} ({ip}) - Status: {status}")
+                if keep:
+                    servers.append(server)
+            print(f"✅ Found {count} servers")
+            return servers
+        except requests.HTTPError as e:
+            print(f"❌ Failed to get servers: {e.response.status_code}")
+            return servers
         except Exception as e:
             print(f"❌ Error getting servers: {e}")
-            return []
+            return servers
     
-    def get_applications(self):
-        """Get list of applications"""
+    def get_applications(self, keep=True):
+        """Get list of applications (keep=False only prints, for flat memory)"""
+        apps = []
+        count = 0
         try:
-            response = self.session.get(f"{self.base_url}/api/v1/applications")
-            if response.status_code == 200:
-                apps = response.json()
-                print(f"✅ Found {len(apps)} applications")
-                for app in apps:
-                    name = app.get('name', 'Unknown')
-                    repo = app.get('git_repository', 'No repo')
-                    status = app.get('status', 'Unknown')
-                    print(f"   - {name} ({repo}) - Status: {status}")
-                return apps
-            else:
-                print(f"❌ Failed to get applications: {response.status_code}")
-                return []
+            for app in self.iter_applications():
+                count += 1
+                name = app.get('name', 'Unknown')
+                repo = app.get('git_repository', 'No repo')
+                status = app.get('status', 'Unknown')
+                print(f"   - {name} ({repo}) - Status: {status}")
+                if keep:
+                    apps.append(app)
+            print(f"✅ Found {count} applications")
+            return apps
+        except requests.HTTPError as e:
+            print(f"❌ Failed to get applications: {e.response.status_code}")
+            return apps
         except Exception as e:
             print(f"❌ Error getting applications: {e}")
-            return []
+            return apps
+    
+    def find_applications(self, query):
+        """Look up applications by UUID, name, repository or domain"""
+        # Held while refreshing: the snapshot turns fresh just before the index is updated,
+        # so a concurrent lookup must not read the index in between
+        with self._index_lock:
+            if self.index is None:
+                self.index = ApplicationIndex().attach(self.inventory, self.base_url)
+            if self.refresh or not self.has_fresh_inventory('applications'):
+                # Streaming the list refreshes the inventory, which updates the index
+                for _ in self.iter_applications():
+                    pass
+        return self.index.find(query)
     
     def deploy_application(self, app_id, branch="main", force_rebuild=False):
         """Deploy an application"""
@@ -168,6 +218,7 @@ class CoolifyAPI:
             
             if response.status_code in [200, 201]:
                 result = response.json()
+                self.inventory.invalidate(self.base_url, 'applications')
                 print("✅ Application created successfully!")
                 print(f"   Application ID: {result.get('id', 'Unknown')}")
                 return result
@@ -182,19 +233,25 @@ class CoolifyAPI:
 
 def main():
     parser = argparse.ArgumentParser(description='Coolify Deployment CLI')
-    parser.add_argument('command', choices=['login', 'test', 'servers', 'apps', 'deploy', 'create'], 
+    parser.add_argument('command', choices=['login', 'test', 'servers', 'apps', 'find', 'deploy', 'create'], 
                        help='Command to execute')
     parser.add_argument('--email', default='admin@247420.xyz', help='Email for login')
     parser.add_argument('--password', default='123,slam123,slam', help='Password for login')
     parser.add_argument('--app-id', type=int, help='Application ID for deployment')
+    parser.add_argument('--app', help='Application UUID, name, repository or domain (for find/deploy)')
     parser.add_argument('--branch', default='main', help='Git branch')
     parser.add_argument('--name', help='Application name (for create)')
     parser.add_argument('--repo', help='Git repository URL (for create)')
     parser.add_argument('--force', action='store_true', help='Force rebuild')
+    parser.add_argument('--refresh', action='store_true', help='Ignore the local inventory cache')
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
-    
-    api = CoolifyAPI()
+    with profiler_from_args(args):
+        run(args)
+
+def run(args):
+    api = CoolifyAPI(refresh=args.refresh)
     
     try:
         if args.command == 'login':
@@ -210,24 +267,45 @@ def main():
                 sys.exit(1)
                 
         elif args.command == 'servers':
-            if api.login(args.email, args.password):
-                api.get_servers()
+            if api.has_fresh_inventory('servers') or api.login(args.email, args.password):
+                api.get_servers(keep=False)
             else:
                 sys.exit(1)
                 
         elif args.command == 'apps':
-            if api.login(args.email, args.password):
-                api.get_applications()
+            if api.has_fresh_inventory('applications') or api.login(args.email, args.password):
+                api.get_applications(keep=False)
+            else:
+                sys.exit(1)
+                
+        elif args.command == 'find':
+            if not args.app:
+                print("❌ --app is required for find command")
+                sys.exit(1)
+                
+            if api.has_fresh_inventory('applications') or api.login(args.email, args.password):
+                matches = api.find_applications(args.app)
+                print(f"✅ Found {len(matches)} matching applications")
+                for app in matches:
+                    print(f"   - {app.get('name', 'Unknown')} ({app.get('uuid', 'No UUID')}) - {app.get('fqdn', 'No domain')}")
+                sys.exit(0 if matches else 1)
             else:
                 sys.exit(1)
                 
         elif args.command == 'deploy':
-            if not args.app_id:
-                print("❌ --app-id is required for deploy command")
+            if not args.app_id and not args.app:
+                print("❌ --app-id or --app is required for deploy command")
                 sys.exit(1)
                 
             if api.login(args.email, args.password):
-                api.deploy_application(args.app_id, args.branch, args.force)
+                app_id = args.app_id
+                if not app_id:
+                    matches = api.find_applications(args.app)
+                    if len(matches) != 1:
+                        print(f"❌ '{args.app}' matches {len(matches)} applications, expected exactly one")
+                        sys.exit(1)
+                    app_id = matches[0].get('uuid') or matches[0].get('id')
+                api.deploy_application(app_id, args.branch, args.force)
             else:
                 sys.exit(1)
                 
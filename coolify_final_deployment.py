@@ -1,21 +1,25 @@
-import requests
 import re
 import json
 import time
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
+from coolify_http import create_session
+from coolify_resolver import EnvironmentResolver
+from coolify_tracing import span, traced
 
 class CoolifyFinalDeployment:
     """Final working deployment tool with correct resource IDs"""
     
-    def __init__(self, base_url="https://coolify.247420.xyz"):
+    def __init__(self, base_url="https://coolify.247420.xyz", project=None):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = create_session()
         self.csrf_token = None
         
-        # Real UUIDs from analysis
-        self.project_uuid = "ckgkgcwo00sc4ks4okcwgoww"
-        self.environment_uuid = "jsso4kwcwgw0oss0co8k4888"
+        # Discovered from the dashboard once and stored per instance
+        self.resolver = EnvironmentResolver(self.session, base_url)
+        self.project = project  # Project name or UUID to deploy into (default: first)
+        self.project_uuid = None
+        self.environment_uuid = None
         
         # Found application resource IDs
         self.application_resource_ids = [
@@ -33,6 +37,7 @@ class CoolifyFinalDeployment:
             'Upgrade-Insecure-Requests': '1'
         })
     
+    @traced()
     def login(self, email, password):
         """Authenticate with Coolify"""
         print(f"🔐 Authenticating...")
@@ -70,6 +75,13 @@ class CoolifyFinalDeployment:
             print(f"   ❌ Login error: {e}")
             return False
     
+    def use_environment(self, env):
+        """Target a resolved project/environment pair"""
+        self.project_uuid = env['project_uuid']
+        self.environment_uuid = env['environment_uuid']
+        print(f"   ✅ Using project {env.get('project_name') or self.project_uuid} / environment {self.environment_uuid}")
+    
+    @traced()
     def extract_main_component_id(self):
         """Extract the main component ID from the resource creation page"""
         print("🔍 Extracting main component ID...")
@@ -78,6 +90,9 @@ class CoolifyFinalDeployment:
             # Get resource creation page
             resource_url = f"{self.base_url}/project/{self.project_uuid}/environment/{self.environment_uuid}/new"
             response = self.session.get(resource_url)
+            if response.status_code != 200:
+                print(f"   ❌ Resource page not accessible: {response.status_code}")
+                return None
             
             # Extract component ID
             component_match = re.search(r'wire:id="([^"]+)"', response.text)
@@ -93,6 +108,7 @@ class CoolifyFinalDeployment:
             print(f"   ❌ Error extracting component ID: {e}")
             return None
     
+    @traced()
     def select_application_type(self, component_id, resource_id):
         """Select application resource type using Livewire"""
         print(f"📱 Selecting application resource type...")
@@ -139,6 +155,7 @@ class CoolifyFinalDeployment:
             print(f"   ❌ Error selecting resource: {e}")
             return False, None
     
+    @traced()
     def create_application_simple(self, app_name, repo_url, domain_name):
         """Simple application creation by submitting form data"""
         print(f"🏗️ Creating application: {app_name}")
@@ -257,6 +274,7 @@ class CoolifyFinalDeployment:
         except Exception as e:
             return False, f"Application creation error: {str(e)}"
     
+    @traced()
     def deploy_application(self, app_name, repo_url, domain_name=None):
         """Complete deployment workflow"""
         print(f"🚀 Starting deployment of {app_name}")
@@ -268,8 +286,16 @@ class CoolifyFinalDeployment:
         if not self.login("admin@247420.xyz", "123,slam123,slam"):
             return False, "Authentication failed"
         
-        # Step 2: Get main component ID
-        component_id = self.extract_main_component_id()
+        # Step 2: Get main component ID (rescanning the dashboard only if the stored IDs fail)
+        def component_for(env):
+            self.use_environment(env)
+            return self.extract_main_component_id()
+        
+        with span('resolve_environment', **{'coolify.project': self.project}) as resolving:
+            env, component_id = self.resolver.call_with_revalidation(component_for, self.project)
+            resolving.set_attribute('coolify.component_found', bool(component_id))
+        if env is None:
+            return False, "Could not resolve project/environment"
         if not component_id:
             return False, "Could not extract component ID"
         
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Synthetic Coolify Fleet Generator
+Builds scaled dashboards, environment pages and /api/v1 responses from the captured page structure
+"""
+
+import argparse
+import html
+import json
+import os
+import random
+import re
+
+from coolify_standin_server import FIXTURE_DIR, FIXTURE_ORIGIN, FIXTURE_PAGES, RESOURCE_PAGE, new_uuid
+
+# Box markup as it appears in the captured dashboard (deployment__resources.html)
+PROJECT_BOX = """                                    <div class="relative gap-2 cursor-pointer box group">
+                        <a href="{origin}/project/{project_uuid}/environment/{environment_uuid}" class="absolute inset-0"></a>
+                        <div class="flex flex-1 mx-6">
+                            <div class="flex flex-col justify-center flex-1">
+                                <div class="box-title">{name}</div>
+                                <div class="box-description">
+                                    {description}
+                                </div>
+                            </div>
+                            <div class="relative z-10 flex items-center justify-center gap-4 text-xs font-bold">
+                                                                                                            <a class="hover:underline"
+                                            href="{origin}/project/{project_uuid}/environment/{environment_uuid}/new">
+                                            + Add Resource
+                                        </a>
+                                                                                                                                        <a class="hover:underline"
+                                        href="{origin}/project/{project_uuid}/edit">
+                                        Settings
+                                    </a>
+                                                            </div>
+                        </div>
+                    </div>
+"""
+SERVER_BOX = """                                    <a href="{origin}/server/{uuid}"
+                        class="gap-2 border cursor-pointer box group">
+                        <div class="flex flex-col justify-center mx-6">
+                            <div class="box-title">
+                                {name}
+                            </div>
+                            <div class="box-description">
+                                {description}</div>
+                            <div class="flex gap-1 text-xs text-error">
+                                                                                                                            </div>
+                        </div>
+                        <div class="flex-1"></div>
+                    </a>
+"""
+APPLICATION_BOX = """                                    <a href="{origin}/project/{project_uuid}/environment/{environment_uuid}/application/{uuid}"
+                        class="gap-2 border cursor-pointer box group">
+                        <div class="flex flex-col justify-center mx-6">
+                            <div class="box-title">{name}</div>
+                            <div class="box-description">{fqdn}</div>
+                            <div class="text-xs">{status}</div>
+                        </div>
+                    </a>
+"""
+SECTION = """    <section>
+        <h3 class="pb-2">{title}</h3>
+                    <div class="grid grid-cols-1 gap-4 xl:grid-cols-2">
+{boxes}                            </div>
+            </section>
+"""
+
+WORDS = ['api', 'web', 'worker', 'shop', 'blog', 'auth', 'billing', 'search', 'media', 'chat', 'docs',
+         'admin', 'gateway', 'metrics', 'mailer', 'cron', 'cdn', 'feed', 'notify', 'ledger']
+STATUSES = ['running:healthy'] * 8 + ['running:unhealthy', 'exited:unhealthy', 'restarting:unknown']
+ENVIRONMENT_NAMES = ['production', 'staging', 'development', 'preview']
+ENVIRONMENT_PATH_PATTERN = re.compile(r'^/project/([a-z0-9]+)/environment/([a-z0-9]+)$')
+
+
+def scaled_counts(applications):
+    """Project and server counts in proportion to an application count"""
+    return max(1, applications // 20), max(1, applications // 100)
+
+
+class Fleet:
+    """Projects (with environments), servers and applications of one synthetic instance"""
+
+    def __init__(self, projects, servers, applications):
+        self.projects = projects
+        self.servers = servers
+        self.applications = applications
+
+    @classmethod
+    def generate(cls, applications=100, projects=None, environments=1, servers=None, seed=0):
+        rng = random.Random(seed)
+        default_projects, default_servers = scaled_counts(applications)
+        projects = default_projects if projects is None else projects
+        servers = default_servers if servers is None else servers
+
+        server_list = [{'uuid': new_uuid(rng), 'name': 'localhost' if i == 0 else f"server-{i:04d}",
+                        'description': "This is the server where Coolify is running on. Don't delete this!"
+                        if i == 0 else f"Build and runtime host {i}",
+                        'ip': f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}", 'user': 'root', 'port': 22,
+                        'is_reachable': True, 'is_usable': True}
+                       for i in range(servers)]
+        project_list = []
+        for i in range(projects):
+            name = f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{i}"
+            project_list.append({
+                'uuid': new_uuid(rng), 'name': name, 'description': f"{name} project",
+                'environments': [{'uuid': new_uuid(rng), 'name': ENVIRONMENT_NAMES[j % len(ENVIRONMENT_NAMES)]
+                                  + ('' if j < len(ENVIRONMENT_NAMES) else f"-{j}")}
+                                 for j in range(environments)],
+            })
+
+        app_list = []
+        for i in range(applications):
+            project = project_list[i % len(project_list)]
+            environment = project['environments'][i // len(project_list) % len(project['environments'])]
+            uuid = new_uuid(rng)
+            name = f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{i}"
+            app_list.append({
+                'uuid': uuid,
+                'name': name,
+                'git_repository': f"https://github.com/org-{i % 97}/{name}",
+                'git_branch': rng.choice(['main', 'main', 'master', 'develop']),
+                'build_pack': rng.choice(['nixpacks', 'nixpacks', 'dockerfile', 'static']),
+                'ports_exposes': '3000',
+                'fqdn': f"https://{name}.apps.example.com",
+                'project_uuid': project['uuid'],
+                'environment_uuid': environment['uuid'],
+                'environment_name': environment['name'],
+                'server_uuid': server_list[i % len(server_list)]['uuid'],
+                'status': rng.choice(STATUSES),
+            })
+        return cls(project_list, server_list, app_list)
+
+    def environment_apps(self):
+        grouped = {}
+        for app in self.applications:
+            grouped.setdefault((app['project_uuid'], app['environment_uuid']), []).append(app)
+        return grouped
+
+
+class FleetSite:
+    """Stand-in server site (see coolify_standin_server.FixtureSite) serving a generated fleet"""
+
+    origin = FIXTURE_ORIGIN
+
+    def __init__(self, fleet, template_dir=FIXTURE_DIR):
+        self.fleet = fleet
+        self.template_dir = template_dir
+        self._environment_apps = fleet.environment_apps()
+        self._pages = {}
+        with open(os.path.join(template_dir, FIXTURE_PAGES['/']), encoding='utf-8') as f:
+            dashboard = f.read()
+        # Everything around the dashboard's <section> blocks is reused as the page shell
+        first = dashboard.index('    <section>')
+        last = dashboard.rindex('</section>') + len('</section>\n')
+        self._shell = (dashboard[:first], dashboard[last:])
+
+    def _wrap(self, *sections):
+        return self._shell[0] + ''.join(sections) + self._shell[1]
+
+    def _projects_section(self):
+        boxes = ''.join(PROJECT_BOX.format(origin=self.origin, project_uuid=p['uuid'],
+                                           environment_uuid=p['environments'][0]['uuid'],
+                                           name=html.escape(p['name']), description=html.escape(p['description']))
+                        for p in self.fleet.projects)
+        return SECTION.format(title='Projects', boxes=boxes)
+
+    def _servers_section(self):
+        boxes = ''.join(SERVER_BOX.format(origin=self.origin, uuid=s['uuid'], name=html.escape(s['name']),
+                                          description=html.escape(s['description']))
+                        for s in self.fleet.servers)
+        return SECTION.format(title='Servers', boxes=boxes)
+
+    def _environment_section(self, project_uuid, environment_uuid):
+        apps = self._environment_apps.get((project_uuid, environment_uuid), [])
+        boxes = ''.join(APPLICATION_BOX.format(origin=self.origin, project_uuid=project_uuid,
+                                               environment_uuid=environment_uuid, uuid=app['uuid'],
+                                               name=html.escape(app['name']), fqdn=html.escape(app['fqdn']),
+                                               status=app['status'])
+                        for app in apps)
+        return SECTION.format(title='Resources', boxes=boxes)
+
+    def _render(self, path):
+        if path in ('/', '/dashboard'):
+            return self._wrap(self._projects_section(), '\n', self._servers_section())
+        if path == '/projects':
+            return self._wrap(self._projects_section())
+        if path == '/servers':
+            return self._wrap(self._servers_section())
+        if path.endswith('/new'):
+            with open(os.path.join(self.template_dir, RESOURCE_PAGE), encoding='utf-8') as f:
+                return f.read()
+        match = ENVIRONMENT_PATH_PATTERN.match(path)
+        if match and match.groups() in self._environment_apps:
+            return self._wrap(self._environment_section(*match.groups()))
+        if path == '/login':
+            with open(os.path.join(self.template_dir, FIXTURE_PAGES['/login']), encoding='utf-8') as f:
+                return f.read()
+        return None
+
+    def page(self, path):
+        if path not in self._pages:
+            self._pages[path] = self._render(path)
+        return self._pages[path]
+
+    def servers(self):
+        return [dict(server) for server in self.fleet.servers]
+
+    def applications(self):
+        return [dict(app) for app in self.fleet.applications]
+
+
+def write_fleet(site, output_dir):
+    """Write the dashboard, one environment page and the API responses to a directory"""
+    os.makedirs(output_dir, exist_ok=True)
+    files = {
+        'dashboard.html': site.page('/'),
+        'servers.json': json.dumps(site.servers()),
+        'applications.json': json.dumps(site.applications()),
+    }
+    if site.fleet.projects:
+        project = site.fleet.projects[0]
+        files['environment.html'] = site.page(
+            f"/project/{project['uuid']}/environment/{project['environments'][0]['uuid']}")
+    for name, content in files.items():
+        with open(os.path.join(output_dir, name), 'w', encoding='utf-8') as f:
+            f.write(content)
+    return sorted(files)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic Coolify fleet')
+    parser.add_argument('--applications', type=int, default=1000)
+    parser.add_argument('--projects', type=int, help='Default: one per 20 applications')
+    parser.add_argument('--environments', type=int, default=1, help='Environments per project')
+    parser.add_argument('--servers', type=int, help='Default: one per 100 applications')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Write pages and API responses to this directory')
+    parser.add_argument('--serve', action='store_true', help='Serve the fleet with the stand-in server')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args()
+
+    fleet = Fleet.generate(args.applications, args.projects, args.environments, args.servers, args.seed)
+    site = FleetSite(fleet)
+    print(f"🏭 Generated {len(fleet.projects)} projects, {len(fleet.servers)} servers, "
+          f"{len(fleet.applications)} applications")
+
+    if args.output:
+        for name in write_fleet(site, args.output):
+            print(f"   📁 {os.path.join(args.output, name)}")
+
+    if args.serve:
+        from coolify_standin_server import StandInServer
+        server = StandInServer(port=args.port, site=site)
+        print(f"🧪 Serving fleet at {server.base_url}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 Stopping stand-in server")
+        finally:
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()
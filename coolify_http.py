@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP layer for the Coolify tools
+Rate-limited sessions shared across threads and, via lock files, across processes
+"""
+
+import codecs
+import itertools
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+import requests
+
+from coolify_cassette import cassette_from_env, mount_cassette
+from coolify_timing import TimingAdapter
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process limiting only
+    fcntl = None
+
+# Bucket settings: (initial rate/s, burst capacity, min rate/s, max rate/s)
+BUCKET_SETTINGS = {
+    'login': (0.5, 2, 0.05, 2.0),
+    'livewire': (5.0, 5, 0.2, 20.0),
+    'api': (10.0, 10, 0.5, 50.0),
+}
+
+DEFAULT_LOCK_DIR = os.path.join(tempfile.gettempdir(), 'coolify-ratelimit')
+MAX_429_RETRIES = 5
+
+
+def bucket_kind(url):
+    """Classify a URL into the login, livewire or api bucket"""
+    path = urlparse(url).path
+    if path.startswith('/login') or path.startswith('/logout'):
+        return 'login'
+    if path.startswith('/livewire'):
+        return 'livewire'
+    return 'api'
+
+
+def parse_retry_after(value):
+    """Parse a Retry-After header (seconds or HTTP date) into seconds"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class TokenBucket:
+    """Adaptive token bucket whose state lives in a shared lock file
+
+    Rewards are only counted in memory and folded into the shared state the
+    next time it is locked anyway (acquire, penalize), so an accepted
+    request costs no extra file I/O.
+    """
+
+    def __init__(self, name, rate, capacity, min_rate, max_rate, lock_dir=None):
+        self.name = name
+        self.capacity = capacity
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.initial_rate = rate
+        self._lock = threading.Lock()
+        self._rewards = 0
+        self._rewards_lock = threading.Lock()
+        self._state = {'tokens': float(capacity), 'updated': time.time(),
+                       'rate': rate, 'blocked_until': 0.0}
+        self._path = None
+        if lock_dir and fcntl is not None:
+            os.makedirs(lock_dir, exist_ok=True)
+            safe_name = name.replace(':', '_').replace('/', '_')
+            self._path = os.path.join(lock_dir, f"{safe_name}.bucket")
+
+    def _update(self, func):
+        """Apply func to the bucket state under the thread and file locks"""
+        with self._lock:
+            if self._path is None:
+                self._apply_rewards(self._state)
+                return func(self._state)
+
+            with open(self._path, 'a+') as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    raw = f.read()
+                    if raw:
+                        try:
+                            self._state = json.loads(raw)
+                        except ValueError:
+                            pass
+                    self._apply_rewards(self._state)
+                    result = func(self._state)
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(self._state))
+                    f.flush()
+                    return result
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _apply_rewards(self, state):
+        with self._rewards_lock:
+            rewards, self._rewards = self._rewards, 0
+        if rewards:
+            step = self.initial_rate * 0.05
+            state['rate'] = min(self.max_rate, state['rate'] + rewards * step)
+
+    def _refill(self, state, now):
+        elapsed = max(0.0, now - state['updated'])
+        state['tokens'] = min(self.capacity, state['tokens'] + elapsed * state['rate'])
+        state['updated'] = now
+
+    def _try_take(self, state):
+        """Take a token if possible, otherwise return seconds to wait"""
+        now = time.time()
+        if now < state['blocked_until']:
+            return state['blocked_until'] - now
+        self._refill(state, now)
+        if state['tokens'] >= 1:
+            state['tokens'] -= 1
+            return 0.0
+        return (1 - state['tokens']) / state['rate']
+
+    def acquire(self):
+        """Block until a token is available"""
+        while True:
+            wait = self._update(self._try_take)
+            if wait <= 0:
+                return
+            time.sleep(min(wait, 5.0))
+
+    def penalize(self, retry_after=None):
+        """Halve the rate and pause the bucket after a 429"""
+        def apply(state):
+            state['rate'] = max(self.min_rate, state['rate'] / 2)
+            state['tokens'] = 0.0
+            pause = retry_after if retry_after is not None else 1.0 / state['rate']
+            state['blocked_until'] = max(state['blocked_until'], time.time() + pause)
+            return state['rate']
+        return self._update(apply)
+
+    def reward(self):
+        """Additively raise the rate after a request the server accepted (applied on the next update)"""
+        with self._rewards_lock:
+            self._rewards += 1
+
+    @property
+    def rate(self):
+        return self._update(lambda state: state['rate'])
+
+
+class RateLimiter:
+    """Per-instance login/livewire/api buckets"""
+
+    def __init__(self, lock_dir=DEFAULT_LOCK_DIR, settings=None):
+        self.lock_dir = lock_dir
+        self.settings = settings or BUCKET_SETTINGS
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, url):
+        """Return the bucket for a URL, keyed by host and request kind"""
+        kind = bucket_kind(url)
+        name = f"{urlparse(url).netloc}:{kind}"
+        with self._lock:
+            bucket = self._buckets.get(name)
+            if bucket is None:
+                rate, capacity, min_rate, max_rate = self.settings[kind]
+                bucket = TokenBucket(name, rate, capacity, min_rate, max_rate, self.lock_dir)
+                self._buckets[name] = bucket
+            return bucket
+
+
+_default_limiter = None
+_default_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """Return the process-wide rate limiter (None if disabled via COOLIFY_RATE_LIMIT=0)"""
+    global _default_limiter
+    if os.environ.get('COOLIFY_RATE_LIMIT', '1') == '0':
+        return None
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            lock_dir = os.environ.get('COOLIFY_RATE_LIMIT_DIR', DEFAULT_LOCK_DIR)
+            _default_limiter = RateLimiter(lock_dir)
+        return _default_limiter
+
+
+VERSION_PATTERN = re.compile(r'/build/assets/app-([A-Za-z0-9_-]+)\.js')
+
+
+def detect_version(html):
+    """Release fingerprint of a Coolify page: the hashed app bundle changes with every release"""
+    match = VERSION_PATTERN.search(html)
+    return match.group(1) if match else None
+
+
+class CoolifySession(requests.Session):
+    """requests.Session that waits for a rate-limit token and backs off on 429"""
+
+    def __init__(self, rate_limiter=None, max_retries=MAX_429_RETRIES):
+        super().__init__()
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.coolify_version = None  # Fingerprint seen on the last login page
+
+    def request(self, method, url, *args, **kwargs):
+        response = self._request_limited(method, url, *args, **kwargs)
+        if (method.upper() == 'GET' and response.status_code == 200 and not kwargs.get('stream')
+                and urlparse(url).path.startswith('/login')):
+            self.coolify_version = detect_version(response.text) or self.coolify_version
+        return response
+
+    def _request_limited(self, method, url, *args, **kwargs):
+        if self.rate_limiter is None:
+            return super().request(method, url, *args, **kwargs)
+
+        bucket = self.rate_limiter.bucket_for(url)
+        attempt = 0
+        while True:
+            bucket.acquire()
+            response = super().request(method, url, *args, **kwargs)
+            if response.status_code != 429:
+                bucket.reward()
+                return response
+
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            rate = bucket.penalize(retry_after)
+            attempt += 1
+            if attempt > self.max_retries:
+                return response
+            print(f"   ⏳ 429 from {bucket.name}, slowing to {rate:.2f} req/s")
+
+
+def create_session(rate_limiter=None, cassette=None):
+    """Create a session wired into the shared rate limiter
+
+    With a cassette (or COOLIFY_CASSETTE set) requests are recorded to or
+    replayed from it; replaying skips the rate limiter since nothing
+    reaches a server.
+    """
+    if cassette is None:
+        cassette = cassette_from_env()
+    if rate_limiter is None and not (cassette is not None and cassette.mode == 'replay'):
+        rate_limiter = get_rate_limiter()
+    session = CoolifySession(rate_limiter=rate_limiter)
+    if cassette is not None:
+        mount_cassette(session, cassette)
+    else:
+        # Every request feeds the per-endpoint timing histograms (see coolify_timing)
+        adapter = TimingAdapter()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+    return session
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+DEFAULT_PAGE_SIZE = 100
+
+
+def iter_json_array(chunks):
+    """Incrementally decode a top-level JSON array, yielding one element at a time
+
+    chunks is an iterable of bytes (e.g. response.iter_content()); only the
+    element being decoded is buffered, so memory stays flat for huge arrays.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    chunks = iter(chunks)
+    buffer = ''
+    pos = 0
+    eof = False
+
+    def more():
+        nonlocal buffer, pos, eof
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            eof = True
+            buffer = buffer[pos:] + utf8.decode(b'', final=True)
+            pos = 0
+            return
+        buffer = buffer[pos:] + utf8.decode(chunk)
+        pos = 0
+
+    def skip_ws():
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+                pos += 1
+            if pos < len(buffer) or eof:
+                return
+            more()
+
+    skip_ws()
+    if pos >= len(buffer) or buffer[pos] != '[':
+        raise ValueError("Response is not a JSON array")
+    pos += 1
+
+    expect_value = True
+    while True:
+        skip_ws()
+        if pos >= len(buffer):
+            raise ValueError("Unterminated JSON array")
+        char = buffer[pos]
+        if char == ']':
+            return
+        if char == ',' and not expect_value:
+            pos += 1
+            expect_value = True
+            continue
+        if not expect_value:
+            raise ValueError("Malformed JSON array: missing ','")
+
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            more()
+            continue
+        # A number split across chunks decodes short ("12" -> "1", "-500." -> "-500"), so only
+        # accept the value once the ',' or ']' after it is in the buffer
+        after = end
+        while after < len(buffer) and buffer[after] in ' \t\r\n':
+            after += 1
+        if not eof and (after == len(buffer) or buffer[after] not in ',]'):
+            more()
+            continue
+        pos = end
+        expect_value = False
+        yield value
+
+
+def next_page_url(page, url):
+    """Next-page URL from a Laravel-style paginated body, or None"""
+    links = page.get('links')
+    if isinstance(links, dict) and links.get('next'):
+        return links['next']
+    if page.get('next_page_url'):
+        return page['next_page_url']
+    meta = page.get('meta') if isinstance(page.get('meta'), dict) else page
+    current, last = meta.get('current_page'), meta.get('last_page')
+    if current is not None and last is not None and current < last:
+        parts = urlparse(url)
+        query = dict(parse_qsl(parts.query))
+        query['page'] = str(current + 1)
+        return urlunparse(parts._replace(query=urlencode(query)))
+    return None
+
+
+def iter_resources(session, url, page_size=DEFAULT_PAGE_SIZE):
+    """Yield API resources one at a time from a list endpoint
+
+    Paginated responses ({"data": [...], "links": {"next": ...}}) are
+    followed page by page; a plain JSON array is stream-decoded. Raises
+    requests.HTTPError on a non-2xx status and ValueError on non-JSON.
+    """
+    separator = '&' if '?' in url else '?'
+    next_url = f"{url}{separator}per_page={page_size}"
+    while next_url:
+        response = session.get(next_url, stream=True)
+        try:
+            response.raise_for_status()
+            chunks = response.iter_content(STREAM_CHUNK_SIZE)
+            first = b''
+            for chunk in chunks:
+                first = chunk.lstrip()
+                if first:
+                    break
+            if first.startswith(b'['):
+                yield from iter_json_array(itertools.chain([first], chunks))
+                return
+            if not first.startswith(b'{'):
+                raise ValueError("Response is not JSON")
+            page = json.loads(b''.join(itertools.chain([first], chunks)))
+        finally:
+            response.close()
+
+        yield from page.get('data', [])
+        next_url = next_page_url(page, next_url)
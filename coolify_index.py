@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Coolify Application Index
+In-memory multi-key index (UUID, name, repository, domain, project) over the inventory
+"""
+
+import re
+import threading
+from urllib.parse import urlparse
+
+
+def normalize_repo(repo):
+    """Reduce https/ssh/.git variants of a repository URL to host/owner/name"""
+    if not repo:
+        return None
+    repo = repo.strip().lower()
+    ssh_match = re.match(r'^[\w.-]+@([^:]+):(.+)$', repo)
+    if ssh_match:
+        host, path = ssh_match.groups()
+    elif '://' in repo:
+        parts = urlparse(repo)
+        host, path = parts.hostname or '', parts.path
+    else:
+        # "owner/name" or "github.com/owner/name"
+        host, _, path = repo.partition('/') if '.' in repo.split('/')[0] else ('github.com', '', repo)
+    path = path.strip('/')
+    if path.endswith('.git'):
+        path = path[:-4]
+    return f"{host}/{path}"
+
+
+def normalize_domain(domain):
+    """Host part of a domain or URL, lowercased"""
+    domain = domain.strip().lower()
+    if not domain:
+        return None
+    if '://' not in domain:
+        domain = f"//{domain}"
+    return urlparse(domain).hostname
+
+
+def app_domains(app):
+    """All hosts an application serves (Coolify stores fqdn as a comma-separated list)"""
+    fqdn = app.get('fqdn') or app.get('domains') or ''
+    if isinstance(fqdn, list):
+        fqdn = ','.join(fqdn)
+    return [host for host in (normalize_domain(d) for d in fqdn.split(',')) if host]
+
+
+def app_project(app):
+    project = app.get('project_uuid') or app.get('project')
+    if isinstance(project, dict):
+        project = project.get('uuid') or project.get('name')
+    return project
+
+
+def app_uuid(app):
+    value = app.get('uuid') or app.get('id')
+    return str(value) if value is not None else None
+
+
+class ApplicationIndex:
+    """O(1) lookups over applications by uuid, name, repository, domain and project"""
+
+    def __init__(self, apps=None):
+        self._apps = {}
+        self._fingerprints = {}
+        self._by_name = {}
+        self._by_repo = {}
+        self._by_domain = {}
+        self._by_project = {}
+        self._lock = threading.RLock()
+        self._subscription = None
+        if apps:
+            self.update(apps)
+
+    def __len__(self):
+        return len(self._apps)
+
+    def _keys(self, app):
+        name = app.get('name')
+        return {
+            '_by_name': [name.lower()] if name else [],
+            '_by_repo': [key for key in [normalize_repo(app.get('git_repository'))] if key],
+            '_by_domain': app_domains(app),
+            '_by_project': [app_project(app)] if app_project(app) else [],
+        }
+
+    def _fingerprint(self, app):
+        # Exactly the keys the secondary indexes are built from, so any change that re-keys an app is seen
+        return tuple(tuple(keys) for _, keys in sorted(self._keys(app).items()))
+
+    def _add(self, uuid, app):
+        self._apps[uuid] = app
+        self._fingerprints[uuid] = self._fingerprint(app)
+        for attr, keys in self._keys(app).items():
+            table = getattr(self, attr)
+            for key in keys:
+                table.setdefault(key, {})[uuid] = None
+
+    def _discard(self, uuid):
+        app = self._apps.pop(uuid, None)
+        self._fingerprints.pop(uuid, None)
+        if app is None:
+            return
+        for attr, keys in self._keys(app).items():
+            table = getattr(self, attr)
+            for key in keys:
+                bucket = table.get(key)
+                if bucket is not None:
+                    bucket.pop(uuid, None)
+                    if not bucket:
+                        del table[key]
+
+    def upsert(self, app):
+        uuid = app_uuid(app)
+        if uuid is None:
+            return
+        with self._lock:
+            if uuid in self._apps:
+                if self._fingerprints[uuid] == self._fingerprint(app):
+                    self._apps[uuid] = app
+                    return
+                self._discard(uuid)
+            self._add(uuid, app)
+
+    def remove(self, uuid):
+        with self._lock:
+            self._discard(str(uuid))
+
+    def update(self, apps):
+        """Apply a full inventory snapshot incrementally
+
+        Unchanged applications keep their index entries; only added, removed
+        or re-keyed applications touch the secondary indexes.
+        """
+        with self._lock:
+            seen = set()
+            for app in apps:
+                uuid = app_uuid(app)
+                if uuid is None:
+                    continue
+                seen.add(uuid)
+                self.upsert(app)
+            for uuid in [uuid for uuid in self._apps if uuid not in seen]:
+                self._discard(uuid)
+
+    def attach(self, inventory, instance):
+        """Keep the index in sync with every applications refresh of the inventory (until detach())"""
+        self.detach()
+        cached = inventory.get(instance, 'applications')
+        if cached is not None:
+            self.update(cached)
+
+        def on_refresh(refreshed_instance, items):
+            if refreshed_instance == instance:
+                self.update(items)
+
+        inventory.subscribe('applications', on_refresh)
+        self._subscription = (inventory, on_refresh)
+        return self
+
+    def detach(self):
+        """Stop following the inventory this index was attached to"""
+        if self._subscription is not None:
+            inventory, callback = self._subscription
+            inventory.unsubscribe('applications', callback)
+            self._subscription = None
+
+    def _lookup(self, table, key):
+        if key is None:
+            return []
+        with self._lock:
+            return [self._apps[uuid] for uuid in table.get(key, ())]
+
+    def by_uuid(self, uuid):
+        return self._apps.get(str(uuid))
+
+    def by_name(self, name):
+        return self._lookup(self._by_name, name.lower() if name else None)
+
+    def by_repo(self, repo):
+        return self._lookup(self._by_repo, normalize_repo(repo))
+
+    def by_domain(self, domain):
+        return self._lookup(self._by_domain, normalize_domain(domain or ''))
+
+    def by_project(self, project):
+        return self._lookup(self._by_project, project)
+
+    def find(self, query):
+        """Match a query against uuid, then name, repository and domain"""
+        app = self.by_uuid(query)
+        if app is not None:
+            return [app]
+        return self.by_name(query) or self.by_repo(query) or self.by_domain(query)
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Local Coolify Inventory Cache
+SQLite-backed, TTL-based read-through cache for servers, projects, environments and apps
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+DEFAULT_DB_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'coolify-cli', 'inventory.db')
+
+# Seconds before each kind of record is considered stale
+DEFAULT_TTLS = {
+    'servers': 300,
+    'applications': 60,
+    'projects': 600,
+    'environments': 600,
+    'project_structure': 600,
+}
+
+ENVIRONMENT_LINK_PATTERN = re.compile(
+    r'href="[^"]*/project/([a-z0-9]+)/environment/([a-z0-9]+)"[^>]*>\s*</a>'
+    r'(?:(?!/project/).)*?box-title">\s*([^<]*?)\s*<',
+    re.S,
+)
+ENVIRONMENT_HREF_PATTERN = re.compile(r'/project/([a-z0-9]+)/environment/([a-z0-9]+)')
+
+
+def parse_environments(html):
+    """Extract project/environment pairs (and project names) from dashboard HTML"""
+    environments = []
+    seen = set()
+    for project_uuid, environment_uuid, name in ENVIRONMENT_LINK_PATTERN.findall(html):
+        if (project_uuid, environment_uuid) not in seen:
+            seen.add((project_uuid, environment_uuid))
+            environments.append({'project_uuid': project_uuid, 'environment_uuid': environment_uuid,
+                                 'project_name': name})
+    # Pages without the dashboard boxes still link to /project/.../environment/...
+    for project_uuid, environment_uuid in ENVIRONMENT_HREF_PATTERN.findall(html):
+        if (project_uuid, environment_uuid) not in seen:
+            seen.add((project_uuid, environment_uuid))
+            environments.append({'project_uuid': project_uuid, 'environment_uuid': environment_uuid,
+                                 'project_name': None})
+    return environments
+
+
+def fetch_environments(session, base_url):
+    """Fetch the dashboard and return its project/environment pairs"""
+    response = session.get(base_url)
+    if response.status_code != 200:
+        return None
+    # An empty result is treated as a failed lookup so it is never cached
+    return parse_environments(response.text) or None
+
+
+def record_key(kind, item, position):
+    """Stable per-record key used as the primary key inside a kind"""
+    if isinstance(item, dict):
+        for field in ('uuid', 'id', 'environment_uuid', 'page'):
+            if item.get(field) is not None:
+                return str(item[field])
+    return str(position)
+
+
+class InventoryCache:
+    """Read-through cache of Coolify inventory, one SQLite file shared by all tools"""
+
+    def __init__(self, path=None, ttls=None):
+        self.path = path or os.environ.get('COOLIFY_INVENTORY_DB', DEFAULT_DB_PATH)
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+        self._listeners = {}
+        self._listeners_lock = threading.Lock()
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._init_schema()
+
+    def _conn(self):
+        # sqlite3 connections are per-thread
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        conn = self._conn()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS records (
+                instance TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                key TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (instance, kind, key)
+            );
+            CREATE TABLE IF NOT EXISTS snapshots (
+                instance TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (instance, kind)
+            );
+        """)
+        conn.commit()
+
+    def fetched_at(self, instance, kind):
+        row = self._conn().execute(
+            'SELECT fetched_at FROM snapshots WHERE instance = ? AND kind = ?',
+            (instance, kind)).fetchone()
+        return row[0] if row else None
+
+    def is_fresh(self, instance, kind, ttl=None):
+        fetched_at = self.fetched_at(instance, kind)
+        if fetched_at is None:
+            return False
+        ttl = self.ttls.get(kind, 300) if ttl is None else ttl
+        return time.time() - fetched_at < ttl
+
+    def get(self, instance, kind):
+        """Cached records for a kind (possibly stale), or None if never fetched"""
+        if self.fetched_at(instance, kind) is None:
+            return None
+        rows = self._conn().execute(
+            'SELECT data FROM records WHERE instance = ? AND kind = ? ORDER BY position',
+            (instance, kind)).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def subscribe(self, kind, callback):
+        """Call callback(instance, items) whenever a kind is refreshed"""
+        with self._listeners_lock:
+            self._listeners.setdefault(kind, []).append(callback)
+
+    def unsubscribe(self, kind, callback):
+        with self._listeners_lock:
+            listeners = self._listeners.get(kind, [])
+            if callback in listeners:
+                listeners.remove(callback)
+
+    def _notify(self, instance, kind, items=None):
+        with self._listeners_lock:
+            listeners = list(self._listeners.get(kind, ()))
+        if not listeners:
+            return
+        if items is None:
+            items = list(self.iter_records(instance, kind))
+        for callback in listeners:
+            callback(instance, items)
+
+    def iter_records(self, instance, kind):
+        """Stream cached records from a cursor, one at a time"""
+        cursor = self._conn().execute(
+            'SELECT data FROM records WHERE instance = ? AND kind = ? ORDER BY position',
+            (instance, kind))
+        for row in cursor:
+            yield json.loads(row[0])
+
+    def put_stream(self, instance, kind, items, batch_size=500):
+        """Yield items through while writing them to the cache in batches
+
+        Rows are written under a staging kind and swapped in, with the
+        snapshot marked fresh, only once the iterator is exhausted; an
+        interrupted stream leaves the last good copy in place.
+        """
+        conn = self._conn()
+        staging = f"{kind}:staging:{os.getpid()}:{threading.get_ident()}"
+        insert = 'INSERT OR REPLACE INTO records (instance, kind, key, position, data) VALUES (?, ?, ?, ?, ?)'
+        with conn:
+            conn.execute('DELETE FROM records WHERE instance = ? AND kind = ?', (instance, staging))
+        complete = False
+        try:
+            batch = []
+            for position, item in enumerate(items):
+                batch.append((instance, staging, record_key(kind, item, position), position, json.dumps(item)))
+                if len(batch) >= batch_size:
+                    with conn:
+                        conn.executemany(insert, batch)
+                    batch = []
+                yield item
+            with conn:
+                conn.executemany(insert, batch)
+                conn.execute('DELETE FROM records WHERE instance = ? AND kind = ?', (instance, kind))
+                conn.execute('UPDATE records SET kind = ? WHERE instance = ? AND kind = ?', (kind, instance, staging))
+                conn.execute(
+                    'INSERT OR REPLACE INTO snapshots (instance, kind, fetched_at) VALUES (?, ?, ?)',
+                    (instance, kind, time.time()))
+            complete = True
+        finally:
+            if not complete:
+                with conn:
+                    conn.execute('DELETE FROM records WHERE instance = ? AND kind = ?', (instance, staging))
+        self._notify(instance, kind)
+
+    def put(self, instance, kind, items):
+        """Replace the cached records for a kind"""
+        conn = self._conn()
+        with conn:
+            conn.execute('DELETE FROM records WHERE instance = ? AND kind = ?', (instance, kind))
+            conn.executemany(
+                'INSERT OR REPLACE INTO records (instance, kind, key, position, data) VALUES (?, ?, ?, ?, ?)',
+                [(instance, kind, record_key(kind, item, i), i, json.dumps(item))
+                 for i, item in enumerate(items)])
+            conn.execute(
+                'INSERT OR REPLACE INTO snapshots (instance, kind, fetched_at) VALUES (?, ?, ?)',
+                (instance, kind, time.time()))
+        self._notify(instance, kind, items)
+
+    def invalidate(self, instance, kind=None):
+        conn = self._conn()
+        with conn:
+            if kind is None:
+                conn.execute('DELETE FROM snapshots WHERE instance = ?', (instance,))
+            else:
+                conn.execute('DELETE FROM snapshots WHERE instance = ? AND kind = ?', (instance, kind))
+
+    def _refresh(self, instance, kind, fetch):
+        items = fetch()
+        if items is not None:
+            self.put(instance, kind, items)
+        return items
+
+    def _refresh_in_background(self, instance, kind, fetch):
+        with self._refresh_lock:
+            if (instance, kind) in self._refreshing:
+                return
+            self._refreshing.add((instance, kind))
+
+        def run():
+            try:
+                self._refresh(instance, kind, fetch)
+            except Exception as e:
+                print(f"   ⚠️  Background refresh of {kind} failed: {e}")
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard((instance, kind))
+
+        threading.Thread(target=run, name=f"inventory-refresh-{kind}", daemon=True).start()
+
+    def read_through(self, instance, kind, fetch, refresh=False, background=False, ttl=None):
+        """Return cached records, calling fetch() when missing, stale or refresh=True
+
+        fetch() returns a list of records, or None on failure (the stale
+        copy is then kept). With background=True a stale copy is returned
+        immediately and refreshed on a daemon thread.
+        """
+        if not refresh:
+            if self.is_fresh(instance, kind, ttl):
+                self.hits += 1
+                return self.get(instance, kind)
+            if background:
+                cached = self.get(instance, kind)
+                if cached is not None:
+                    self.hits += 1
+                    self._refresh_in_background(instance, kind, fetch)
+                    return cached
+
+        self.misses += 1
+        items = self._refresh(instance, kind, fetch)
+        if items is None:
+            return self.get(instance, kind)
+        return items
+
+    def iter_through(self, instance, kind, stream, refresh=False, ttl=None):
+        """Streaming read_through: yield cached records, or stream() them from the server"""
+        if not refresh and self.is_fresh(instance, kind, ttl):
+            self.hits += 1
+            yield from self.iter_records(instance, kind)
+            return
+        self.misses += 1
+        yield from self.put_stream(instance, kind, stream())
+
+    def start_background_refresh(self, instance, fetchers, interval=60):
+        """Periodically refresh each {kind: fetch} on a daemon thread"""
+        stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                for kind, fetch in fetchers.items():
+                    if not self.is_fresh(instance, kind):
+                        try:
+                            self._refresh(instance, kind, fetch)
+                        except Exception as e:
+                            print(f"   ⚠️  Background refresh of {kind} failed: {e}")
+
+        threading.Thread(target=run, name="inventory-refresher", daemon=True).start()
+        return stop
+
+
+_default_inventory = None
+_default_inventory_lock = threading.Lock()
+
+
+def get_inventory():
+    """Return the process-wide inventory cache"""
+    global _default_inventory
+    with _default_inventory_lock:
+        if _default_inventory is None:
+            _default_inventory = InventoryCache()
+        return _default_inventory
@@ -4,13 +4,14 @@ Coolify Livewire-based Deployment Tool
 Uses the same communication patterns as the browser
 """
 
-import requests
 import json
 import sys
 import time
 import urllib3
 import re
 from urllib.parse import urljoin
+from coolify_http import create_session
+from coolify_profiling import profile_main
 
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -18,7 +19,7 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 class CoolifyLivewireDeployer:
     def __init__(self, base_url="https://coolify.247420.xyz"):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.verify = False
         
         # Set proper browser-like headers
@@ -49,7 +50,7 @@ class CoolifyLivewireDeployer:
 
             # Step 2: Extract CSRF token
             csrf_token = None
-            csrf_match = re.search(r'name=["\']_token["\'] value=["\']([^"\']+)["\']'', response.text)
+            csrf_match = re.search(r'name=["\']_token["\'] value=["\']([^"\']+)["\']', response.text)
             if csrf_match:
                 csrf_token = csrf_match.group(1)
                 print(f"   ✅ CSRF Token found: {csrf_token[:20]}...")
@@ -304,7 +305,7 @@ class CoolifyLivewireDeployer:
 
 def main():
     if len(sys.argv) < 3:
-        print("Usage: python3 coolify_livewire_deployer.py <email> <password>")
+        print("Usage: python3 coolify_livewire_deployer.py <email> <password> [--profile[=sampling]]")
         sys.exit(1)
 
     email = sys.argv[1]
@@ -320,4 +321,4 @@ def main():
     print(f"\n📁 Results saved to coolify_livewire_test_results.json")
 
 if __name__ == "__main__":
-    main()
+    profile_main(main)
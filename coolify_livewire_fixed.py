@@ -4,13 +4,13 @@ Coolify Livewire-based Deployment Tool
 Uses the same communication patterns as the browser
 """
 
-import requests
 import json
 import sys
 import time
 import urllib3
 import re
 from urllib.parse import urljoin
+from coolify_http import create_session
 
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -18,7 +18,7 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 class CoolifyLivewireDeployer:
     def __init__(self, base_url="https://coolify.247420.xyz"):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.verify = False
         
         # Set proper browser-like headers
@@ -104,9 +104,9 @@ class CoolifyLivewireDeployer:
             
             # Look for Livewire components in the HTML
             livewire_patterns = [
-                r'wire:initial-data=["']([^"']*)["']',
-                r'wire:id=["']([^"']*)["']',
-                r'livewire:[^=]*=["']([^"']*)["']',
+                r'wire:initial-data=["\']([^"\']*)["\']',
+                r'wire:id=["\']([^"\']*)["\']',
+                r'livewire:[^=]*=["\']([^"\']*)["\']',
             ]
             
             found_components = []
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Coolify Load Generator
+Replays the Livewire deployment flow as N concurrent virtual users and reports per-step latency and errors
+"""
+
+import argparse
+import html
+import json
+import re
+import sys
+import threading
+import time
+from urllib.parse import urlparse
+
+from coolify_http import create_session
+from coolify_inventory import parse_environments
+from coolify_request_log import percentile
+
+STEPS = ('login_page', 'login', 'dashboard', 'resource_page', 'set_type', 'select_resource_type', 'submit',
+         'deploy')
+
+# Application resource ID used by CoolifyFinalDeployment.select_application_type
+DEFAULT_RESOURCE_ID = '848ed38f09cb40e780a5f10186155e346d17'
+
+CSRF_PATTERN = re.compile(r'<meta name="csrf-token" content="([^"]*)"')
+COMPONENT_PATTERN = re.compile(r'wire:snapshot="([^"]*)"[^>]*?wire:id="([^"]+)"|wire:id="([^"]+)"')
+APPLICATION_UUID_PATTERN = re.compile(r'/application/([a-z0-9]{20,})')
+
+
+class StepFailed(Exception):
+    """A flow step got an answer it cannot continue from"""
+
+
+class LoadStats:
+    """Thread-safe per-step latencies, outcomes and error kinds"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = {step: [] for step in STEPS}
+        self.errors = {step: {} for step in STEPS}
+        self.flows = 0
+        self.failed_flows = 0
+
+    def record(self, step, elapsed, error=None):
+        with self._lock:
+            self.latencies[step].append(elapsed)
+            if error is not None:
+                self.errors[step][error] = self.errors[step].get(error, 0) + 1
+
+    def finish_flow(self, ok):
+        with self._lock:
+            self.flows += 1
+            if not ok:
+                self.failed_flows += 1
+
+    def summary(self, wall):
+        steps = {}
+        with self._lock:
+            for step in STEPS:
+                values = sorted(self.latencies[step])
+                if not values:
+                    continue
+                failed = sum(self.errors[step].values())
+                steps[step] = {
+                    'count': len(values),
+                    'errors': failed,
+                    'error_rate': failed / len(values),
+                    'throughput': len(values) / wall if wall else None,
+                    'p50': percentile(values, 0.50),
+                    'p90': percentile(values, 0.90),
+                    'p95': percentile(values, 0.95),
+                    'p99': percentile(values, 0.99),
+                    'max': values[-1],
+                    'error_kinds': dict(self.errors[step]),
+                }
+            return {
+                'wall': wall,
+                'flows': self.flows,
+                'failed_flows': self.failed_flows,
+                'flows_per_second': self.flows / wall if wall else None,
+                'steps': steps,
+            }
+
+
+class VirtualUser:
+    """One automation session walking login → resource page → Livewire calls → submit → deploy"""
+
+    def __init__(self, number, base_url, email, password, repo_url, stats, steps=STEPS,
+                 resource_id=DEFAULT_RESOURCE_ID, rate_limited=False):
+        self.number = number
+        self.base_url = base_url.rstrip('/')
+        self.email = email
+        self.password = password
+        self.repo_url = repo_url
+        self.stats = stats
+        self.steps = steps
+        self.resource_id = resource_id
+        self.session = create_session()
+        if not rate_limited:
+            self.session.rate_limiter = None  # Measure the server, not our own throttle
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        })
+        self.iteration = 0
+        self._reset()
+
+    def _reset(self):
+        self.csrf_token = None
+        self.environment = None
+        self.component_id = None
+        self.snapshot = None
+        self.app_uuid = None
+
+    def run_flow(self):
+        """One pass through the flow; a failed step ends the pass"""
+        self.iteration += 1
+        self.session.cookies.clear()
+        self._reset()
+        for step in self.steps:
+            start = time.perf_counter()
+            try:
+                getattr(self, step)()
+            except StepFailed as e:
+                self.stats.record(step, time.perf_counter() - start, str(e))
+                self.stats.finish_flow(False)
+                return False
+            except Exception as e:
+                self.stats.record(step, time.perf_counter() - start, type(e).__name__)
+                self.stats.finish_flow(False)
+                return False
+            self.stats.record(step, time.perf_counter() - start)
+        self.stats.finish_flow(True)
+        return True
+
+    def _expect(self, response, *statuses):
+        if response.status_code not in statuses:
+            raise StepFailed(f"HTTP {response.status_code}")
+        return response
+
+    def _csrf_from(self, text):
+        match = CSRF_PATTERN.search(text)
+        if match:
+            self.csrf_token = match.group(1)
+
+    # -- steps ------------------------------------------------------------
+
+    def login_page(self):
+        response = self._expect(self.session.get(f"{self.base_url}/login"), 200)
+        self._csrf_from(response.text)
+        if not self.csrf_token:
+            raise StepFailed("no CSRF token")
+
+    def login(self):
+        response = self.session.post(f"{self.base_url}/login", allow_redirects=False, data={
+            'email': self.email,
+            'password': self.password,
+            '_token': self.csrf_token,
+        })
+        self._expect(response, 302)
+        if urlparse(response.headers.get('Location', '')).path.startswith('/login'):
+            raise StepFailed("credentials rejected")
+
+    def dashboard(self):
+        response = self._expect(self.session.get(self.base_url), 200)
+        environments = parse_environments(response.text)
+        if not environments:
+            raise StepFailed("no environments")
+        self.environment = environments[0]
+
+    def resource_page(self):
+        env = self.environment
+        url = f"{self.base_url}/project/{env['project_uuid']}/environment/{env['environment_uuid']}/new"
+        response = self._expect(self.session.get(url), 200)
+        self._csrf_from(response.text)
+        match = COMPONENT_PATTERN.search(response.text)
+        if not match:
+            raise StepFailed("no Livewire component")
+        if match.group(2):
+            self.snapshot, self.component_id = html.unescape(match.group(1)), match.group(2)
+        else:
+            self.component_id = match.group(3)
+
+    def _livewire(self, calls, updates=None):
+        component = {'id': self.component_id, 'updates': updates or {}, 'calls': calls}
+        if self.snapshot:
+            component['snapshot'] = self.snapshot
+        response = self.session.post(f"{self.base_url}/livewire/update", json={
+            '_token': self.csrf_token,
+            'components': [component],
+        }, headers={
+            'X-CSRF-TOKEN': self.csrf_token,
+            'X-Livewire': 'true',
+            'Content-Type': 'application/json',
+        })
+        self._expect(response, 200)
+        try:
+            components = response.json().get('components') or []
+        except ValueError:
+            raise StepFailed("non-JSON Livewire response")
+        if components and components[0].get('snapshot'):
+            self.snapshot = components[0]['snapshot']
+        return components[0].get('effects', {}) if components else {}
+
+    def set_type(self):
+        self._livewire([{'method': 'setType', 'params': [self.resource_id]}])
+
+    def select_resource_type(self):
+        self._livewire([{'method': 'selectResourceType', 'params': ['application']}])
+
+    def submit(self):
+        name = f"load-{self.number}-{self.iteration}"
+        effects = self._livewire([{'method': 'submit', 'params': []}], {
+            'name': name,
+            'git_repository': self.repo_url,
+            'git_branch': 'main',
+            'build_pack': 'nixpacks',
+            'domains': f"https://{name}.247420.xyz",
+        })
+        for returned in effects.get('returns') or []:
+            if isinstance(returned, dict) and returned.get('uuid'):
+                self.app_uuid = returned['uuid']
+        match = APPLICATION_UUID_PATTERN.search(effects.get('redirect') or '')
+        if match:
+            self.app_uuid = match.group(1)
+
+    def deploy(self):
+        if not self.app_uuid:
+            raise StepFailed("no application uuid")
+        response = self.session.post(f"{self.base_url}/api/v1/applications/{self.app_uuid}/deploy",
+                                     json={'branch': 'main', 'force_rebuild': False})
+        self._expect(response, 200, 201, 202)
+
+
+class LoadGenerator:
+    """Starts virtual users spread over the ramp-up period and keeps them cycling"""
+
+    def __init__(self, base_url, email, password, repo_url, users=10, ramp_up=10.0, duration=60.0,
+                 iterations=None, think_time=0.0, steps=STEPS, rate_limited=False):
+        self.base_url = base_url
+        self.email = email
+        self.password = password
+        self.repo_url = repo_url
+        self.users = users
+        self.ramp_up = ramp_up
+        self.duration = duration
+        self.iterations = iterations
+        self.think_time = think_time
+        self.steps = steps
+        self.rate_limited = rate_limited
+        self.stats = LoadStats()
+        self._stop = threading.Event()
+        self.active = 0
+        self._active_lock = threading.Lock()
+
+    def _user(self, number, deadline):
+        delay = self.ramp_up * number / self.users if self.users else 0
+        if self._stop.wait(delay):
+            return
+        user = VirtualUser(number, self.base_url, self.email, self.password, self.repo_url, self.stats,
+                           self.steps, rate_limited=self.rate_limited)
+        with self._active_lock:
+            self.active += 1
+        try:
+            while not self._stop.is_set() and time.monotonic() < deadline:
+                user.run_flow()
+                if self.iterations and user.iteration >= self.iterations:
+                    break
+                if self.think_time and self._stop.wait(self.think_time):
+                    break
+        finally:
+            user.session.close()
+            with self._active_lock:
+                self.active -= 1
+
+    def run(self, progress=True):
+        start = time.monotonic()
+        deadline = start + self.duration
+        threads = [threading.Thread(target=self._user, args=(n, deadline), name=f"vu-{n}", daemon=True)
+                   for n in range(self.users)]
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                alive = [thread for thread in threads if thread.is_alive()]
+                if not alive:
+                    break
+                alive[0].join(timeout=1.0)
+                if progress:
+                    elapsed = time.monotonic() - start
+                    print(f"   ⏱️  {elapsed:5.1f}s  users {self.active:3d}  flows {self.stats.flows} "
+                          f"({self.stats.failed_flows} failed)")
+        except KeyboardInterrupt:
+            print("\n⏹️  Stopping virtual users...")
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+        return self.stats.summary(time.monotonic() - start)
+
+
+def print_report(summary):
+    print("\n📊 LOAD TEST RESULTS")
+    print("=" * 96)
+    print(f"Flows: {summary['flows']} ({summary['failed_flows']} failed) in {summary['wall']:.1f}s "
+          f"→ {summary['flows_per_second'] or 0:.2f} flows/s")
+    print(f"{'step':<22}{'count':>7}{'err %':>8}{'req/s':>8}{'p50 ms':>9}{'p90 ms':>9}{'p95 ms':>9}"
+          f"{'p99 ms':>9}{'max ms':>9}")
+    for step, entry in summary['steps'].items():
+        print(f"{step:<22}{entry['count']:>7}{entry['error_rate'] * 100:>7.1f}%{entry['throughput']:>8.2f}"
+              + ''.join(f"{entry[key] * 1000:>9.1f}" for key in ('p50', 'p90', 'p95', 'p99', 'max')))
+    for step, entry in summary['steps'].items():
+        for kind, count in sorted(entry['error_kinds'].items(), key=lambda item: -item[1]):
+            print(f"   ❌ {step}: {kind} ×{count}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Concurrent virtual users replaying the Coolify deployment flow')
+    parser.add_argument('--url', help='Coolify base URL (default: an in-process stand-in server)')
+    parser.add_argument('--email', default='admin@247420.xyz')
+    parser.add_argument('--password', default='123,slam123,slam')
+    parser.add_argument('--repo', default='https://github.com/AnEntrypoint/nixpacks-test-app.git')
+    parser.add_argument('--users', type=int, default=10, help='Virtual users')
+    parser.add_argument('--ramp-up', type=float, default=10.0, help='Seconds over which users are started')
+    parser.add_argument('--duration', type=float, default=60.0, help='Seconds to keep users cycling')
+    parser.add_argument('--iterations', type=int, help='Stop each user after this many flows')
+    parser.add_argument('--think-time', type=float, default=0.0, help='Pause between a user\'s flows')
+    parser.add_argument('--steps', default=','.join(STEPS),
+                        help='Comma-separated steps to run, in flow order (default: all)')
+    parser.add_argument('--rate-limit', action='store_true', help='Keep the client-side rate limiter on')
+    parser.add_argument('--latency', type=float, default=0.0, help='Stand-in only: seconds added per response')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Stand-in only: injected failure rate')
+    parser.add_argument('--output', help='Write the summary as JSON')
+    args = parser.parse_args()
+
+    steps = tuple(step.strip() for step in args.steps.split(',') if step.strip())
+    unknown = [step for step in steps if step not in STEPS]
+    if unknown:
+        print(f"❌ Unknown steps: {', '.join(unknown)} (available: {', '.join(STEPS)})")
+        sys.exit(1)
+    steps = tuple(step for step in STEPS if step in steps)
+
+    server = None
+    base_url = args.url
+    if base_url is None:
+        from coolify_standin_server import StandInServer
+        server = StandInServer(credentials={args.email: args.password}, latency=args.latency,
+                               failure_rate=args.failure_rate).start()
+        base_url = server.base_url
+        print(f"🧪 Using stand-in server at {base_url}")
+    elif 'submit' in steps:
+        print("⚠️  Every completed flow creates (and deploys) an application on this instance")
+
+    print(f"🚀 {args.users} virtual users over {args.ramp_up:g}s ramp-up, {args.duration:g}s run against {base_url}")
+    generator = LoadGenerator(base_url, args.email, args.password, args.repo, args.users, args.ramp_up,
+                              args.duration, args.iterations, args.think_time, steps, args.rate_limit)
+    try:
+        summary = generator.run()
+    finally:
+        if server is not None:
+            server.stop()
+
+    print_report(summary)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(summary, f, indent=2)
+        print(f"\n📁 Results saved to {args.output}")
+    sys.exit(0 if summary['flows'] and not summary['failed_flows'] else 1)
+
+
+if __name__ == "__main__":
+    main()
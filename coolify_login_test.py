@@ -1,16 +1,16 @@
-import requests
 import re
 import json
 import time
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
+from coolify_http import create_session
 
 class CoolifyAPI:
     """Fixed Coolify API wrapper with better login detection"""
     
     def __init__(self, base_url="https://coolify.247420.xyz"):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = create_session()
         self.csrf_token = None
         self.project_uuid = None
         self.environment_uuid = None
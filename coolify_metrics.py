@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""
+Coolify Metrics
+Lock-free counters and histograms exported as OpenMetrics, plus a monitor daemon that serves them on localhost
+"""
+
+import argparse
+import bisect
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from coolify_timing import BUCKET_BOUNDS, PHASES, add_timing_hook
+
+CONTENT_TYPE = 'application/openmetrics-text; version=1.0.0; charset=utf-8'
+DEFAULT_PORT = 9464
+DEFAULT_POLL_INTERVAL = 30
+
+
+class _Cells:
+    """Per-thread value slots: each thread only writes its own list, so updates need no lock
+
+    A lock is taken once per thread (when its slot is created) and when
+    collecting. Slots of finished threads are folded into a base slot and
+    dropped, so totals never go back and short-lived threads do not pile up.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self._local = threading.local()
+        self._base = [0] * size
+        self._cells = []  # (thread, cell) for each live writer
+        self._lock = threading.Lock()
+
+    def _fold_finished(self):
+        # Called under the lock; a finished thread can no longer write to its cell
+        live = []
+        for thread, cell in self._cells:
+            if thread.is_alive():
+                live.append((thread, cell))
+            else:
+                self._base = [a + b for a, b in zip(self._base, cell)]
+        self._cells = live
+
+    def cell(self):
+        cell = getattr(self._local, 'cell', None)
+        if cell is None:
+            cell = self._local.cell = [0] * self.size
+            with self._lock:
+                self._fold_finished()
+                self._cells.append((threading.current_thread(), cell))
+        return cell
+
+    def totals(self):
+        with self._lock:
+            self._fold_finished()
+            cells = [self._base] + [cell for _, cell in self._cells]
+        return [sum(column) for column in zip(*cells)]
+
+
+class _Family:
+    """A named metric with optional labels; children are created on first use"""
+
+    kind = None
+
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._default = self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values):
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def children(self):
+        with self._lock:
+            return list(self._children.items())
+
+
+class _CounterChild:
+    __slots__ = ('_cells',)
+
+    def __init__(self):
+        self._cells = _Cells(1)
+
+    def inc(self, amount=1):
+        self._cells.cell()[0] += amount
+
+    @property
+    def value(self):
+        return self._cells.totals()[0]
+
+
+class Counter(_Family):
+    """Counter incremented directly, or read at scrape time from func like Gauge
+
+    func must return monotonic totals: a number, or {label values tuple: number}.
+    """
+
+    kind = 'counter'
+
+    def __init__(self, name, help, labelnames=(), func=None):
+        self.func = func
+        super().__init__(name, help, labelnames)
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount=1):
+        self._default.inc(amount)
+
+    def samples(self):
+        if self.func is None:
+            for values, child in self.children():
+                yield '_total', values, (), child.value
+            return
+        result = self.func()
+        if isinstance(result, dict):
+            for values, value in result.items():
+                yield '_total', values if isinstance(values, tuple) else (values,), (), value
+        elif result is not None:
+            yield '_total', (), (), result
+
+
+class _HistogramChild:
+    __slots__ = ('_cells', '_bounds')
+
+    def __init__(self, bounds):
+        self._bounds = bounds
+        # One slot per bucket (last is +Inf), then the sum
+        self._cells = _Cells(len(bounds) + 2)
+
+    def observe(self, value):
+        cell = self._cells.cell()
+        cell[bisect.bisect_left(self._bounds, value)] += 1
+        cell[-1] += value
+
+    def snapshot(self):
+        totals = self._cells.totals()
+        return totals[:-1], totals[-1]
+
+
+class Histogram(_Family):
+    kind = 'histogram'
+
+    def __init__(self, name, help, labelnames=(), bounds=BUCKET_BOUNDS):
+        self.bounds = tuple(bounds)
+        super().__init__(name, help, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.bounds)
+
+    def observe(self, value):
+        self._default.observe(value)
+
+    def samples(self):
+        for values, child in self.children():
+            counts, total = child.snapshot()
+            cumulative = 0
+            for bound, count in zip(self.bounds + (float('inf'),), counts):
+                cumulative += count
+                yield '_bucket', values, (('le', '+Inf' if bound == float('inf') else repr(float(bound))),), cumulative
+            yield '_count', values, (), cumulative
+            yield '_sum', values, (), total
+
+
+class Gauge(_Family):
+    """Gauge that is either set directly or computed at scrape time by func
+
+    func returns a number, or {label values tuple: number} for labelled gauges.
+    """
+
+    kind = 'gauge'
+
+    def __init__(self, name, help, labelnames=(), func=None):
+        self.func = func
+        super().__init__(name, help, labelnames)
+
+    def _new_child(self):
+        return [0]
+
+    def set(self, value, *values):
+        self.labels(*values)[0] = value
+
+    def samples(self):
+        if self.func is None:
+            for values, child in self.children():
+                yield '', values, (), child[0]
+            return
+        result = self.func()
+        if isinstance(result, dict):
+            for values, value in result.items():
+                yield '', values if isinstance(values, tuple) else (values,), (), value
+        elif result is not None:
+            yield '', (), (), result
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        return repr(value) if value == value and value not in (float('inf'), float('-inf')) else str(value)
+    return str(value)
+
+
+class MetricsRegistry:
+    """Holds metric families and renders them in the OpenMetrics text format"""
+
+    def __init__(self):
+        self._families = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name, *args, **kwargs):
+        with self._lock:
+            family = self._families.get(name)
+            if family is None:
+                family = self._families[name] = cls(name, *args, **kwargs)
+            elif cls in (Gauge, Counter) and kwargs.get('func') is not None:
+                family.func = kwargs['func']
+            return family
+
+    def counter(self, name, help, labelnames=(), func=None):
+        return self._register(Counter, name, help, labelnames, func=func)
+
+    def histogram(self, name, help, labelnames=(), bounds=BUCKET_BOUNDS):
+        return self._register(Histogram, name, help, labelnames, bounds=bounds)
+
+    def gauge(self, name, help, labelnames=(), func=None):
+        return self._register(Gauge, name, help, labelnames, func=func)
+
+    def render(self):
+        lines = []
+        with self._lock:
+            families = list(self._families.values())
+        for family in families:
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            lines.append(f"# HELP {family.name} {_escape(family.help)}")
+            for suffix, values, extra, value in family.samples():
+                labels = list(zip(family.labelnames, values)) + list(extra)
+                label_text = '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in labels) + '}' if labels else ''
+                lines.append(f"{family.name}{suffix}{label_text} {_format_value(value)}")
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+
+def _install_default_metrics(registry):
+    """Feed HTTP timings and inventory cache counters into the registry"""
+    requests_total = registry.counter('coolify_http_requests', 'HTTP requests by endpoint template and status',
+                                      ('method', 'endpoint', 'status'))
+    durations = registry.histogram('coolify_http_request_duration_seconds',
+                                   'HTTP request latency by endpoint template and phase',
+                                   ('method', 'endpoint', 'phase'))
+    logins = registry.counter('coolify_logins', 'Login form submissions (first logins and re-logins)')
+
+    def on_timing(timing):
+        method, endpoint = timing['method'], timing['endpoint']
+        status = timing.get('error') or str(timing['status'])
+        requests_total.labels(method, endpoint, status).inc()
+        for phase in PHASES:
+            value = timing.get(phase)
+            if value is not None:
+                durations.labels(method, endpoint, phase).observe(value)
+        if method == 'POST' and endpoint == '/login':
+            logins.inc()
+
+    add_timing_hook(on_timing)
+
+    def inventory():
+        from coolify_inventory import _default_inventory
+        return _default_inventory
+
+    def cache_counts():
+        cache = inventory()
+        return {('hit',): cache.hits, ('miss',): cache.misses} if cache is not None else {}
+
+    def cache_ratio():
+        cache = inventory()
+        if cache is None or not cache.hits + cache.misses:
+            return None
+        return cache.hits / (cache.hits + cache.misses)
+
+    registry.counter('coolify_inventory_cache_lookups', 'Inventory cache lookups by result', ('result',),
+                     func=cache_counts)
+    registry.gauge('coolify_inventory_cache_hit_ratio', 'Fraction of inventory lookups served from cache',
+                   func=cache_ratio)
+
+
+_default_registry = None
+_default_registry_lock = threading.Lock()
+
+
+def get_metrics():
+    """Process-wide registry; creating it starts feeding HTTP timings into it"""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            _default_registry = MetricsRegistry()
+            _install_default_metrics(_default_registry)
+        return _default_registry
+
+
+def deployment_phase_histogram():
+    return get_metrics().histogram('coolify_deployment_phase_duration_seconds',
+                                   'Time deployments spent in each status', ('phase',),
+                                   bounds=(1, 5, 10, 30, 60, 120, 300, 600, 1200, 1800, 3600))
+
+
+class DeploymentPhaseTracker:
+    """Turns successive deployment status observations into phase durations"""
+
+    def __init__(self, histogram=None):
+        self.histogram = histogram or deployment_phase_histogram()
+        self._current = {}  # deployment id -> (status, since)
+
+    def observe(self, deployment_id, status, now=None):
+        now = now or time.time()
+        previous = self._current.get(deployment_id)
+        if previous is not None and previous[0] == status:
+            return
+        if previous is not None:
+            self.histogram.labels(previous[0]).observe(now - previous[1])
+        self._current[deployment_id] = (status, now)
+
+    def finish_missing(self, active_ids, now=None):
+        """Close the phase of deployments that are no longer reported"""
+        now = now or time.time()
+        for deployment_id in [d for d in self._current if d not in active_ids]:
+            status, since = self._current.pop(deployment_id)
+            self.histogram.labels(status).observe(now - since)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+        body = self.server.registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_metrics_server(port=DEFAULT_PORT, host='127.0.0.1', registry=None):
+    """Serve /metrics on a daemon thread and return the server"""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    server.registry = registry or get_metrics()
+    threading.Thread(target=server.serve_forever, name='coolify-metrics', daemon=True).start()
+    return server
+
+
+class MonitorDaemon:
+    """Polls an instance's applications and deployments and publishes them as metrics"""
+
+    def __init__(self, base_url, email, password, interval=DEFAULT_POLL_INTERVAL, registry=None):
+        from coolify_final_deploy import CoolifyAPI
+        self.api = CoolifyAPI(base_url, refresh=True)
+        self.email = email
+        self.password = password
+        self.interval = interval
+        self.registry = registry or get_metrics()
+        self.phases = DeploymentPhaseTracker()
+        self.logged_in = False
+        self.relogins = self.registry.counter('coolify_session_relogins', 'Re-logins after the session expired')
+        self.polls = self.registry.counter('coolify_monitor_polls', 'Monitor poll cycles by result', ('result',))
+        self.app_status = self.registry.gauge('coolify_applications', 'Applications by status', ('status',))
+        self.active = self.registry.gauge('coolify_deployments_active', 'Deployments queued or in progress')
+
+    def _list(self, path):
+        """Every item of an API list across all pages, logging in again once if the session has expired"""
+        import requests
+        from coolify_http import iter_resources
+
+        url = f"{self.api.base_url}{path}"
+        try:
+            return list(iter_resources(self.api.session, url))
+        except (requests.HTTPError, ValueError) as e:
+            # An expired session answers 401/419, or redirects to the HTML login page
+            status = getattr(getattr(e, 'response', None), 'status_code', None)
+            if status not in (None, 401, 419):
+                return None
+        print("🔐 Session expired, logging in again")
+        self.relogins.inc()
+        if not self.api.login(self.email, self.password):
+            return None
+        try:
+            return list(iter_resources(self.api.session, url))
+        except (requests.HTTPError, ValueError):
+            return None
+
+    def poll_once(self):
+        if not self.logged_in:
+            self.logged_in = self.api.login(self.email, self.password)
+            if not self.logged_in:
+                self.polls.labels('login_failed').inc()
+                return False
+
+        applications = self._list('/api/v1/applications')
+        deployments = self._list('/api/v1/deployments')
+        if applications is None and deployments is None:
+            self.polls.labels('error').inc()
+            return False
+
+        if applications is not None:
+            counts = {}
+            for app in applications:
+                status = str(app.get('status') or 'unknown').split(':')[0]
+                counts[status] = counts.get(status, 0) + 1
+            for values, child in self.app_status.children():
+                child[0] = 0
+            for status, count in counts.items():
+                self.app_status.set(count, status)
+
+        if deployments is not None:
+            now = time.time()
+            active = set()
+            seen = set()
+            for deployment in deployments:
+                deployment_id = deployment.get('deployment_uuid') or deployment.get('id')
+                status = deployment.get('status', 'unknown')
+                seen.add(deployment_id)
+                if status in ('queued', 'in_progress'):
+                    active.add(deployment_id)
+                self.phases.observe(deployment_id, status, now)
+            self.phases.finish_missing(seen, now)
+            self.active.set(len(active))
+
+        self.polls.labels('ok').inc()
+        return True
+
+    def run(self, stop=None):
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                print(f"   ⚠️  Poll failed: {e}")
+                self.polls.labels('error').inc()
+            stop.wait(self.interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Coolify monitor daemon with an OpenMetrics endpoint')
+    parser.add_argument('--base-url', default=os.environ.get('COOLIFY_URL', 'https://coolify.247420.xyz'))
+    parser.add_argument('--email', default=os.environ.get('COOLIFY_EMAIL', 'admin@247420.xyz'), help='Email for login')
+    parser.add_argument('--password', default=os.environ.get('COOLIFY_PASSWORD', '123,slam123,slam'),
+                        help='Password for login')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to serve /metrics on')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--interval', type=float, default=DEFAULT_POLL_INTERVAL, help='Seconds between polls')
+    args = parser.parse_args()
+
+    server = start_metrics_server(args.port, args.host)
+    print(f"📈 Metrics at http://{args.host}:{server.server_address[1]}/metrics")
+    daemon = MonitorDaemon(args.base_url, args.email, args.password, args.interval)
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        print("\n👋 Stopping monitor")
+    finally:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
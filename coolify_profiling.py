@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Coolify Profiling Switch
+--profile for every entry point: deterministic (cProfile) or sampling profiles with a hot-function summary
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+PROFILE_MODES = ('deterministic', 'sampling')
+DEFAULT_TOP = 25
+DEFAULT_INTERVAL = 0.005  # Sampling period in seconds
+
+
+def add_profile_arguments(parser):
+    """Add --profile, --profile-output, --profile-top and --profile-interval to an argparse parser"""
+    group = parser.add_argument_group('profiling')
+    group.add_argument('--profile', nargs='?', const='deterministic', choices=PROFILE_MODES,
+                       help='Profile the run (default mode: deterministic)')
+    group.add_argument('--profile-output', help='Profile file (default: <script>.<mode>.prof)')
+    group.add_argument('--profile-top', type=int, default=DEFAULT_TOP, help='Hot functions to list')
+    group.add_argument('--profile-interval', type=float, default=DEFAULT_INTERVAL,
+                       help='Sampling period in seconds (sampling mode)')
+    return parser
+
+
+def pop_profile_args(argv):
+    """Strip the profiling options out of a positional argv in place; returns Profiler or None"""
+    options = {}
+    remaining = [argv[0]]
+    args = iter(argv[1:])
+    for arg in args:
+        name, _, value = arg.partition('=')
+        if name == '--profile':
+            options['mode'] = value or 'deterministic'
+        elif name in ('--profile-output', '--profile-top', '--profile-interval'):
+            options[name[len('--profile-'):]] = value or next(args, None)
+        else:
+            remaining.append(arg)
+    argv[:] = remaining
+    if 'mode' not in options:
+        return None
+    if options['mode'] not in PROFILE_MODES:
+        print(f"❌ Unknown profile mode {options['mode']!r} (expected {' or '.join(PROFILE_MODES)})")
+        sys.exit(2)
+    return Profiler(options['mode'], options.get('output'), int(options.get('top') or DEFAULT_TOP),
+                    float(options.get('interval') or DEFAULT_INTERVAL))
+
+
+def profiler_from_args(args):
+    """Profiler for parsed argparse options, or a do-nothing context when --profile is absent"""
+    if not getattr(args, 'profile', None):
+        return _NoProfiler()
+    return Profiler(args.profile, args.profile_output, args.profile_top, args.profile_interval)
+
+
+def profile_main(main, argv=None):
+    """Run a positional-argument main() under --profile if it was given"""
+    profiler = pop_profile_args(sys.argv if argv is None else argv)
+    if profiler is None:
+        return main()
+    with profiler:
+        return main()
+
+
+def _label(code_key):
+    filename, line, name = code_key
+    if filename == '~':
+        return name  # Builtins such as <method 're.Pattern.search'>
+    return f"{os.path.basename(filename)}:{line}({name})"
+
+
+class _NoProfiler:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class StackSampler:
+    """Wall-clock sampler: a background thread snapshots every thread's stack each interval
+
+    Much cheaper than cProfile on call-heavy code and unaffected by its
+    per-call overhead, at the cost of statistical counts.
+    """
+
+    def __init__(self, interval=DEFAULT_INTERVAL):
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='coolify-profiler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                    frame = frame.f_back
+                stack.reverse()
+                self.stacks[(names.get(ident, str(ident)),) + tuple(stack)] += 1
+            self.samples += 1
+
+    def rows(self):
+        """(function, self samples, cumulative samples) per function"""
+        own, cumulative = Counter(), Counter()
+        for stack, count in self.stacks.items():
+            frames = stack[1:]
+            if not frames:
+                continue
+            own[frames[-1]] += count
+            for frame in set(frames):
+                cumulative[frame] += count
+        return [(func, own[func], cumulative[func]) for func in cumulative]
+
+    def write_folded(self, path):
+        """Collapsed stacks ("thread;f;g;h count"), the input format of flamegraph tools"""
+        with open(path, 'w') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(';'.join([stack[0]] + [_label(frame) for frame in stack[1:]]) + f" {count}\n")
+
+
+class Profiler:
+    """Context manager that profiles its body and writes the profile plus a top-N summary"""
+
+    def __init__(self, mode='deterministic', output=None, top=DEFAULT_TOP, interval=DEFAULT_INTERVAL):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode {mode!r}")
+        self.mode = mode
+        script = os.path.splitext(os.path.basename(sys.argv[0] or ''))[0].lstrip('-') or 'coolify'
+        suffix = 'prof' if mode == 'deterministic' else 'folded'
+        self.output = output or f"{script}.{mode}.{suffix}"
+        self.top = top
+        self.interval = interval
+        self._profile = None
+        self._sampler = None
+        self._started = None
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        if self.mode == 'deterministic':
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._sampler = StackSampler(self.interval)
+            self._sampler.start()
+        return self
+
+    def __exit__(self, *exc):
+        wall = time.perf_counter() - self._started
+        if self.mode == 'deterministic':
+            self._profile.disable()
+            self._profile.dump_stats(self.output)
+            stats = pstats.Stats(self._profile).stats
+            rows = [(func, tt, ct, nc) for func, (cc, nc, tt, ct, callers) in stats.items()]
+            summary = self._summary(rows, wall, f"{len(stats)} functions")
+        else:
+            self._sampler.stop()
+            self._sampler.write_folded(self.output)
+            scale = self.interval
+            rows = [(func, own * scale, cumulative * scale, None)
+                    for func, own, cumulative in self._sampler.rows()]
+            summary = self._summary(rows, wall, f"{self._sampler.samples} samples every {self.interval * 1000:g} ms")
+
+        with open(self.output + '.txt', 'w') as f:
+            f.write(summary + '\n')
+        print(summary, file=sys.stderr)
+        print(f"📁 Profile written to {self.output} (summary in {self.output}.txt)", file=sys.stderr)
+        return False
+
+    def _summary(self, rows, wall, detail):
+        lines = [f"🔥 Top {self.top} functions by self time ({self.mode}, {wall:.3f}s wall, {detail})",
+                 f"   {'self s':>9} {'self %':>7} {'cum s':>9} {'calls':>8}  function"]
+        total = sum(row[1] for row in rows) or 1.0
+        for func, own, cumulative, calls in sorted(rows, key=lambda row: -row[1])[:self.top]:
+            calls = '' if calls is None else calls
+            lines.append(f"   {own:9.4f} {own / total * 100:6.1f}% {cumulative:9.4f} {calls:>8}  {_label(func)}")
+        return '\n'.join(lines)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Coolify Network Recorder
+Streams one JSON line per request to disk with buffered writes, so long runs stay flat in memory
+"""
+
+import atexit
+import json
+import os
+import random
+import threading
+from datetime import datetime
+
+# Body policies: keep nothing, the first body_limit bytes, or the whole body
+BODY_POLICIES = ('none', 'truncate', 'full')
+DEFAULT_BODY_LIMIT = 2000
+DEFAULT_FLUSH_INTERVAL = 1.0
+DEFAULT_BUFFER_BYTES = 64 * 1024
+
+
+def response_body(response, limit=None):
+    """Decode at most limit bytes of a response body without decoding all of it"""
+    content = response.content or b''
+    if limit is not None:
+        content = content[:limit]
+    return content.decode(response.encoding or 'utf-8', errors='replace')
+
+
+class NetworkRecorder:
+    """Append-only JSONL request log
+
+    Entries are serialized immediately and only the encoded lines are
+    buffered; the buffer is flushed when it grows past buffer_bytes, by a
+    timer at most flush_interval after the first buffered line, and at
+    interpreter exit, so a crash loses at most the last interval. The file
+    is created on the first flush, never by the constructor. With
+    max_bytes set the file is rotated to "<path>.1" so hour-long monitoring
+    runs cannot fill the disk.
+    """
+
+    def __init__(self, path, body_policy='truncate', body_limit=DEFAULT_BODY_LIMIT, sample_rate=1.0,
+                 include_headers=True, flush_interval=DEFAULT_FLUSH_INTERVAL,
+                 buffer_bytes=DEFAULT_BUFFER_BYTES, max_bytes=None):
+        if body_policy not in BODY_POLICIES:
+            raise ValueError(f"Unknown body policy {body_policy!r} (expected one of {', '.join(BODY_POLICIES)})")
+        self.path = path
+        self.body_policy = body_policy
+        self.body_limit = body_limit
+        self.sample_rate = sample_rate
+        self.include_headers = include_headers
+        self.flush_interval = flush_interval
+        self.buffer_bytes = buffer_bytes
+        self.max_bytes = max_bytes
+        self.count = 0
+        self._lock = threading.Lock()
+        self._buffer = []
+        self._buffered = 0
+        self._file = None
+        self._closed = False
+        self._timer = None
+        atexit.register(self.close)
+
+    def _keep_body(self, status):
+        if self.body_policy == 'none':
+            return False
+        # Failures are always worth a body; successes are sampled
+        if status is not None and status >= 400:
+            return True
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def record(self, method, url, data=None, headers=None, response=None, **extra):
+        """Write one entry and return the response size in bytes"""
+        status = response.status_code if response is not None else None
+        content_length = len(response.content) if response is not None else 0
+        entry = {
+            'timestamp': datetime.now().isoformat(),
+            'method': method,
+            'url': url,
+            'data': data,
+            'response_status': status,
+            'content_length': content_length,
+        }
+        if headers:
+            entry['headers'] = headers
+        if response is not None:
+            entry['content_type'] = response.headers.get('content-type', '')
+            if self.include_headers:
+                entry['response_headers'] = dict(response.headers)
+            if self._keep_body(status):
+                limit = self.body_limit if self.body_policy == 'truncate' else None
+                entry['response_data'] = response_body(response, limit)
+                entry['truncated'] = limit is not None and content_length > limit
+        entry.update(extra)
+        self.write(entry)
+        return content_length
+
+    def write(self, entry):
+        line = json.dumps(entry, default=str).encode('utf-8') + b'\n'
+        with self._lock:
+            if self._closed:
+                return
+            self._buffer.append(line)
+            self._buffered += len(line)
+            self.count += 1
+            if self._buffered >= self.buffer_bytes:
+                self._flush_locked()
+            elif self._timer is None:
+                # Buffered lines reach the disk within flush_interval even if writes stop
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _open(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, 'ab')
+
+    def _flush_locked(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._buffer:
+            return
+        if self._file is None:
+            self._open()
+        self._file.write(b''.join(self._buffer))
+        self._buffer = []
+        self._buffered = 0
+        self._file.flush()
+        if self.max_bytes and self._file.tell() >= self.max_bytes:
+            self._file.close()
+            os.replace(self.path, f"{self.path}.1")
+            self._file = open(self.path, 'ab')
+
+    def flush(self):
+        with self._lock:
+            if not self._closed:
+                self._flush_locked()
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._closed = True
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_entries(path):
+    """Read a recording back, skipping a line cut short by a crash"""
+    with open(path, 'rb') as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Coolify Request Log
+Fixed-memory request log: array-backed ring buffer, reservoir sample of older entries and running aggregates
+"""
+
+import random
+import re
+import threading
+import time
+from array import array
+from urllib.parse import urlparse
+
+DEFAULT_CAPACITY = 4096
+DEFAULT_SAMPLE_SIZE = 1024
+
+# Path segments that identify a resource rather than an endpoint
+ID_SEGMENT_PATTERN = re.compile(
+    r'^(?:\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|(?=[a-z]*\d)[a-z0-9]{20,32})$')
+
+
+def endpoint_template(url):
+    """Collapse resource IDs in a URL path: /api/v1/applications/abc.../deploy -> /api/v1/applications/{id}/deploy"""
+    path = urlparse(url).path or '/'
+    return '/'.join('{id}' if ID_SEGMENT_PATTERN.match(segment) else segment for segment in path.split('/'))
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+class RequestRecord:
+    """One logged request, materialized only when read back"""
+
+    __slots__ = ('timestamp', 'endpoint', 'status', 'size', 'latency')
+
+    def __init__(self, timestamp, endpoint, status, size, latency):
+        self.timestamp = timestamp
+        self.endpoint = endpoint
+        self.status = status
+        self.size = size
+        self.latency = latency
+
+    def to_dict(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+class _Columns:
+    """Parallel typed arrays: timestamp, endpoint id, status, size, latency"""
+
+    def __init__(self, capacity):
+        self.timestamp = array('d', bytes(8 * capacity))
+        self.endpoint = array('I', bytes(4 * capacity))
+        self.status = array('H', bytes(2 * capacity))
+        self.size = array('Q', bytes(8 * capacity))
+        self.latency = array('f', bytes(4 * capacity))
+
+    def set(self, i, timestamp, endpoint_id, status, size, latency):
+        self.timestamp[i] = timestamp
+        self.endpoint[i] = endpoint_id
+        self.status[i] = status
+        self.size[i] = size
+        self.latency[i] = latency
+
+    def copy(self, i, other, j):
+        other.set(j, self.timestamp[i], self.endpoint[i], self.status[i], self.size[i], self.latency[i])
+
+
+class RequestLog:
+    """Bounded request log for long-running monitors
+
+    The newest `capacity` requests live in a ring buffer; entries pushed out
+    of it are reservoir-sampled (Algorithm R) into `sample_size` slots, so
+    older traffic stays represented without growing memory. Per-endpoint
+    counts, errors, bytes and latency totals are kept as running aggregates
+    over every request ever added.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, sample_size=DEFAULT_SAMPLE_SIZE, seed=None):
+        self.capacity = capacity
+        self.sample_size = sample_size
+        self._ring = _Columns(capacity)
+        self._sample = _Columns(sample_size)
+        self._next = 0
+        self._evicted = 0
+        self.total = 0
+        self._endpoints = []
+        self._endpoint_ids = {}
+        # endpoint id -> [count, errors, bytes, latency sum, latency max]
+        self._aggregates = []
+        self._statuses = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def _endpoint_id(self, endpoint):
+        endpoint_id = self._endpoint_ids.get(endpoint)
+        if endpoint_id is None:
+            endpoint_id = self._endpoint_ids[endpoint] = len(self._endpoints)
+            self._endpoints.append(endpoint)
+            self._aggregates.append([0, 0, 0, 0.0, 0.0])
+        return endpoint_id
+
+    def add(self, method, url, status=None, size=0, latency=0.0, timestamp=None):
+        """Record one request; url may already be an endpoint template"""
+        status = status or 0
+        with self._lock:
+            endpoint_id = self._endpoint_id(f"{method} {endpoint_template(url)}")
+            slot = self._next
+            if self.total >= self.capacity:
+                self._retire(slot)
+            self._ring.set(slot, timestamp or time.time(), endpoint_id, status, size, latency)
+            self._next = (slot + 1) % self.capacity
+            self.total += 1
+
+            aggregate = self._aggregates[endpoint_id]
+            aggregate[0] += 1
+            aggregate[1] += status == 0 or status >= 400
+            aggregate[2] += size
+            aggregate[3] += latency
+            aggregate[4] = max(aggregate[4], latency)
+            self._statuses[status] = self._statuses.get(status, 0) + 1
+
+    def log_response(self, method, url, response=None, size=None):
+        """add() from a requests.Response (size may be passed if already known)"""
+        if response is None:
+            self.add(method, url)
+            return
+        if size is None:
+            size = len(response.content)
+        self.add(method, url, response.status_code, size, response.elapsed.total_seconds())
+
+    def _retire(self, slot):
+        """Reservoir-sample the ring entry about to be overwritten"""
+        seen = self._evicted
+        self._evicted += 1
+        if seen < self.sample_size:
+            self._ring.copy(slot, self._sample, seen)
+            return
+        j = self._rng.randrange(seen + 1)
+        if j < self.sample_size:
+            self._ring.copy(slot, self._sample, j)
+
+    def _record(self, columns, i):
+        return RequestRecord(columns.timestamp[i], self._endpoints[columns.endpoint[i]], columns.status[i],
+                             columns.size[i], columns.latency[i])
+
+    def recent(self, limit=None):
+        """Newest-first records from the ring buffer"""
+        with self._lock:
+            count = len(self) if limit is None else min(limit, len(self))
+            return [self._record(self._ring, (self._next - 1 - k) % self.capacity) for k in range(count)]
+
+    def sample(self):
+        """Reservoir sample of requests that have left the ring buffer"""
+        with self._lock:
+            return [self._record(self._sample, i) for i in range(min(self._evicted, self.sample_size))]
+
+    def _latencies(self):
+        """Latencies by endpoint id across the ring and the reservoir"""
+        latencies = {}
+        for columns, count in ((self._ring, len(self)), (self._sample, min(self._evicted, self.sample_size))):
+            for i in range(count):
+                latencies.setdefault(columns.endpoint[i], []).append(columns.latency[i])
+        return latencies
+
+    def stats(self):
+        """Aggregated statistics; percentiles come from the ring plus the reservoir sample"""
+        with self._lock:
+            latencies = self._latencies()
+            endpoints = {}
+            for endpoint_id, (count, errors, size, latency_sum, latency_max) in enumerate(self._aggregates):
+                values = sorted(latencies.get(endpoint_id, []))
+                endpoints[self._endpoints[endpoint_id]] = {
+                    'count': count,
+                    'errors': errors,
+                    'bytes': size,
+                    'latency_mean': latency_sum / count if count else None,
+                    'latency_max': latency_max,
+                    'latency_p50': percentile(values, 0.50),
+                    'latency_p95': percentile(values, 0.95),
+                }
+            return {
+                'total': self.total,
+                'retained': len(self),
+                'sampled': min(self._evicted, self.sample_size),
+                'statuses': {str(status): count for status, count in sorted(self._statuses.items())},
+                'endpoints': endpoints,
+            }
+
+    def print_summary(self):
+        stats = self.stats()
+        print(f"📊 {stats['total']} requests ({stats['retained']} retained, {stats['sampled']} sampled)")
+        for endpoint, entry in sorted(stats['endpoints'].items(), key=lambda item: -item[1]['count']):
+            p95 = entry['latency_p95']
+            print(f"   {endpoint}: {entry['count']} calls, {entry['errors']} errors, "
+                  f"mean {entry['latency_mean'] * 1000:.0f}ms"
+                  + (f", p95 {p95 * 1000:.0f}ms" if p95 is not None else ""))
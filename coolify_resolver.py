@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Coolify Project/Environment Resolver
+Discovers project and environment UUIDs once per instance and revalidates only on failure
+"""
+
+import os
+
+from coolify_inventory import fetch_environments, get_inventory
+
+
+class EnvironmentResolver:
+    """Pick a project/environment by name or UUID from the stored dashboard scan
+
+    Stored values never expire on a timer: they are re-read from the
+    dashboard only when nothing is stored yet or when a request that used
+    them fails (see revalidate / call_with_revalidation).
+    """
+
+    def __init__(self, session, base_url, inventory=None):
+        self.session = session
+        self.base_url = base_url
+        self.inventory = inventory or get_inventory()
+
+    def _fetch(self):
+        return fetch_environments(self.session, self.base_url)
+
+    def environments(self):
+        """All known project/environment pairs, discovering them on first use"""
+        environments = self.inventory.get(self.base_url, 'environments')
+        if not environments:
+            environments = self.revalidate()
+        return environments or []
+
+    def revalidate(self):
+        """Re-scan the dashboard (after a request using stored UUIDs failed)"""
+        print("🔍 Discovering projects and environments from dashboard...")
+        return self.inventory.read_through(self.base_url, 'environments', self._fetch, refresh=True)
+
+    @staticmethod
+    def _match(environments, project=None, environment=None):
+        for env in environments:
+            if project and project.lower() not in (env['project_uuid'], (env.get('project_name') or '').lower()):
+                continue
+            if environment and environment != env['environment_uuid']:
+                continue
+            return env
+        return None
+
+    def resolve(self, project=None, environment=None):
+        """Return {'project_uuid', 'environment_uuid', 'project_name'} or None
+
+        project may be a project name or UUID; without one, COOLIFY_PROJECT
+        or else the first project on the dashboard is used.
+        """
+        project = project or os.environ.get('COOLIFY_PROJECT')
+        env = self._match(self.environments(), project, environment)
+        if env is None and (project or environment):
+            # The name may belong to a project created since the last scan
+            env = self._match(self.revalidate() or [], project, environment)
+        return env
+
+    def call_with_revalidation(self, func, project=None, environment=None):
+        """Run func(env); if it reports failure, rescan once and retry with fresh UUIDs
+
+        func returns a truthy value on success (or a (success, result)
+        tuple, as most of the client methods do).
+        """
+        env = self.resolve(project, environment)
+        if env is None:
+            return None, None
+        result = func(env)
+        if _succeeded(result):
+            return env, result
+
+        fresh = self._match(self.revalidate() or [], project or os.environ.get('COOLIFY_PROJECT'), environment)
+        if fresh is None or fresh == env:
+            return env, result
+        print(f"   🔄 Retrying with rediscovered environment {fresh['environment_uuid']}")
+        return fresh, func(fresh)
+
+
+def _succeeded(result):
+    if isinstance(result, tuple):
+        return bool(result[0])
+    return bool(result)
@@ -0,0 +1,556 @@
+#!/usr/bin/env python3
+"""
+Local Coolify Stand-in Server
+Serves the captured pages with working login, Livewire and /api/v1 endpoints for offline load and integration tests
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import secrets
+import string
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlparse
+
+FIXTURE_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_ORIGIN = 'https://coolify.247420.xyz'
+
+# Page fixtures captured from the live instance, by path
+FIXTURE_PAGES = {
+    '/login': 'login_page_fresh.html',
+    '/': 'deployment__resources.html',
+    '/dashboard': 'deployment__resources.html',
+    '/projects': 'deployment__projects.html',
+    '/servers': 'deployment__servers.html',
+}
+RESOURCE_PAGE = 'resource_page.html'
+RESOURCE_PATH_PATTERN = re.compile(r'^/project/[a-z0-9]+/environment/[a-z0-9]+(?:/new)?$')
+
+CSRF_PATTERNS = [
+    re.compile(r'(<meta name="csrf-token" content=")[^"]*(")'),
+    re.compile(r'(data-csrf=")[^"]*(")'),
+    re.compile(r'(name="_token" value=")[^"]*(")'),
+]
+SERVER_LINK_PATTERN = re.compile(r'/server/([a-z0-9]{20,})"')
+
+
+def new_uuid(rng, length=24):
+    """Coolify-style lowercase alphanumeric identifier"""
+    return ''.join(rng.choice(string.ascii_lowercase + string.digits) for _ in range(length))
+
+
+class FixtureSite:
+    """Pages and initial inventory taken from the captured HTML fixtures
+
+    The server only needs page(path), servers() and applications(), so a
+    generated site (see coolify_fleet_generator) can be plugged in instead.
+    """
+
+    origin = FIXTURE_ORIGIN
+
+    def __init__(self, fixture_dir=FIXTURE_DIR):
+        self.fixture_dir = fixture_dir
+        self._pages = {}
+
+    def _read(self, name):
+        html = self._pages.get(name)
+        if html is None:
+            with open(os.path.join(self.fixture_dir, name), encoding='utf-8') as f:
+                html = self._pages[name] = f.read()
+        return html
+
+    def page(self, path):
+        if path in FIXTURE_PAGES:
+            return self._read(FIXTURE_PAGES[path])
+        if RESOURCE_PATH_PATTERN.match(path):
+            return self._read(RESOURCE_PAGE)
+        return None
+
+    def servers(self):
+        uuids = dict.fromkeys(SERVER_LINK_PATTERN.findall(self._read(FIXTURE_PAGES['/servers'])))
+        return [{'uuid': uuid, 'name': 'localhost' if i == 0 else f"server-{i}", 'ip': 'host.docker.internal',
+                 'user': 'root', 'port': 22, 'is_reachable': True, 'is_usable': True}
+                for i, uuid in enumerate(uuids)]
+
+    def applications(self):
+        return []
+
+
+class StandInState:
+    """Sessions, applications and deployments held by one stand-in server"""
+
+    def __init__(self, site, credentials=None, api_tokens=None, deploy_duration=5.0, seed=None):
+        self.site = site
+        self.credentials = credentials  # {email: password}; None accepts any login
+        self.api_tokens = set(api_tokens or [])
+        self.deploy_duration = deploy_duration
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.sessions = {}
+        self.servers = site.servers()
+        self.applications = {app['uuid']: app for app in site.applications()}
+        self.deployments = {}
+        self.latest_deployment = {}
+        self.logins = 0
+
+    def new_session(self):
+        session_id = secrets.token_hex(20)
+        with self.lock:
+            self.sessions[session_id] = {'csrf': secrets.token_urlsafe(30)[:40], 'user': None}
+        return session_id
+
+    def check_credentials(self, email, password):
+        if not email or not password:
+            return False
+        if self.credentials is None:
+            return True
+        return self.credentials.get(email) == password
+
+    def create_application(self, data):
+        with self.lock:
+            uuid = new_uuid(self.rng)
+            server = self.servers[0]['uuid'] if self.servers else None
+            app = {
+                'uuid': uuid,
+                'name': data.get('name') or f"app-{uuid[:6]}",
+                'git_repository': data.get('git_repository') or data.get('repository_url') or '',
+                'git_branch': data.get('git_branch') or data.get('branch') or 'main',
+                'build_pack': data.get('build_pack') or 'nixpacks',
+                'ports_exposes': str(data.get('ports_exposes') or '3000'),
+                'fqdn': data.get('domains') or data.get('fqdn') or f"http://{uuid}.127.0.0.1.sslip.io",
+                'project_uuid': data.get('project_uuid'),
+                'environment_name': data.get('environment_name') or 'production',
+                'server_uuid': data.get('server_uuid') or server,
+                'status': 'exited:unhealthy',
+                'created_at': time.strftime('%Y-%m-%dT%H:%M:%S.000000Z', time.gmtime()),
+            }
+            self.applications[uuid] = app
+            return app
+
+    def start_deployment(self, app_uuid):
+        with self.lock:
+            if app_uuid not in self.applications:
+                return None
+            deployment = {'deployment_uuid': new_uuid(self.rng), 'application_uuid': app_uuid,
+                          'started': time.time()}
+            self.deployments[deployment['deployment_uuid']] = deployment
+            self.latest_deployment[app_uuid] = deployment
+            self.applications[app_uuid]['status'] = 'starting:unknown'
+            return deployment
+
+    def deployment_view(self, deployment):
+        elapsed = time.time() - deployment['started']
+        if elapsed < self.deploy_duration * 0.2:
+            status = 'queued'
+        elif elapsed < self.deploy_duration:
+            status = 'in_progress'
+        else:
+            status = 'finished'
+        return {'deployment_uuid': deployment['deployment_uuid'],
+                'application_uuid': deployment['application_uuid'], 'status': status}
+
+    def application_view(self, app):
+        """Application with its status advanced by any finished deployment"""
+        with self.lock:
+            deployment = self.latest_deployment.get(app['uuid'])
+            if deployment is not None and self.deployment_view(deployment)['status'] == 'finished':
+                app['status'] = 'running:healthy'
+            return dict(app)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    server_version = 'nginx'
+    sys_version = ''
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # -- plumbing ---------------------------------------------------------
+
+    def _session(self):
+        cookie = SimpleCookie(self.headers.get('Cookie', ''))
+        morsel = cookie.get('coolify_session')
+        if morsel and morsel.value in self.server.state.sessions:
+            return morsel.value, self.server.state.sessions[morsel.value]
+        return None, None
+
+    def _body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _send(self, status, body=b'', content_type='text/html; charset=UTF-8', headers=None, cookies=()):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        for cookie in cookies:
+            self.send_header('Set-Cookie', cookie)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _json(self, status, data, headers=None):
+        self._send(status, json.dumps(data), 'application/json', headers)
+
+    def _redirect(self, location, cookies=()):
+        self._send(302, '', headers={'Location': f"{self.server.base_url}{location}"}, cookies=cookies)
+
+    def _session_cookies(self, session_id, session):
+        return [f"XSRF-TOKEN={quote(session['csrf'])}; Path=/; SameSite=Lax",
+                f"coolify_session={session_id}; Path=/; HttpOnly; SameSite=Lax"]
+
+    def _render(self, html, session):
+        html = html.replace(self.server.state.site.origin, self.server.base_url)
+        for pattern in CSRF_PATTERNS:
+            html = pattern.sub(lambda m: f"{m.group(1)}{session['csrf']}{m.group(2)}", html)
+        return html
+
+    def _inject(self):
+        """Apply configured latency and failures; True if the request was answered"""
+        server = self.server
+        if server.latency or server.jitter:
+            time.sleep(server.latency + random.uniform(0, server.jitter))
+        path = urlparse(self.path).path
+        if server.failure_rate and path.startswith(server.failure_paths) and random.random() < server.failure_rate:
+            status = random.choice(server.failure_statuses)
+            headers = {'Retry-After': '1'} if status == 429 else None
+            self._json(status, {'message': 'Injected failure'}, headers)
+            return True
+        return False
+
+    def _dispatch(self, routes):
+        if self._inject():
+            return
+        path = urlparse(self.path).path.rstrip('/') or '/'
+        for pattern, handler in routes:
+            match = pattern.match(path)
+            if match:
+                return handler(self, *match.groups())
+        self._send(404, '<h1>404 | Not Found</h1>')
+
+    def do_GET(self):
+        self._dispatch(GET_ROUTES)
+
+    def do_POST(self):
+        self._dispatch(POST_ROUTES)
+
+    # -- pages ------------------------------------------------------------
+
+    def login_page(self):
+        session_id, session = self._session()
+        cookies = ()
+        if session is None:
+            session_id = self.server.state.new_session()
+            session = self.server.state.sessions[session_id]
+            cookies = self._session_cookies(session_id, session)
+        self._send(200, self._render(self.server.state.site.page('/login'), session), cookies=cookies)
+
+    def login(self):
+        state = self.server.state
+        session_id, session = self._session()
+        form = {k: v[0] for k, v in parse_qs(self._body().decode('utf-8')).items()}
+        if session is None or form.get('_token') != session['csrf']:
+            self._send(419, '<h1>419 | Page Expired</h1>')
+            return
+        if not state.check_credentials(form.get('email'), form.get('password')):
+            self._redirect('/login')
+            return
+        # Laravel regenerates the session on login
+        with state.lock:
+            del state.sessions[session_id]
+            state.logins += 1
+        new_id = state.new_session()
+        state.sessions[new_id]['user'] = form['email']
+        self._redirect('/', self._session_cookies(new_id, state.sessions[new_id]))
+
+    def logout(self):
+        session_id, session = self._session()
+        if session is not None:
+            with self.server.state.lock:
+                self.server.state.sessions.pop(session_id, None)
+        self._redirect('/login')
+
+    def page(self, *groups):
+        path = urlparse(self.path).path.rstrip('/') or '/'
+        _, session = self._session()
+        if session is None or session['user'] is None:
+            self._redirect('/login')
+            return
+        html = self.server.state.site.page(path)
+        if html is None:
+            self._send(404, '<h1>404 | Not Found</h1>')
+            return
+        self._send(200, self._render(html, session))
+
+    # -- livewire ---------------------------------------------------------
+
+    def livewire_update(self):
+        _, session = self._session()
+        try:
+            payload = json.loads(self._body() or b'{}')
+        except ValueError:
+            self._json(400, {'message': 'Invalid JSON'})
+            return
+        token = self.headers.get('X-CSRF-TOKEN') or payload.get('_token')
+        if session is None or token != session['csrf']:
+            self._json(419, {'message': 'CSRF token mismatch.'})
+            return
+        if session['user'] is None:
+            self._json(401, {'message': 'Unauthenticated.'})
+            return
+
+        if 'fingerprint' in payload:
+            # Livewire v2: one component per request, calls as callMethod updates
+            memo = dict(payload.get('serverMemo') or {})
+            data = dict(memo.get('data') or {})
+            calls = [u.get('payload', {}) for u in payload.get('updates') or [] if u.get('type') == 'callMethod']
+            returns = self._run_calls(data, calls)
+            memo.update(data=data, checksum=secrets.token_hex(32))
+            self._json(200, {'effects': {'html': '<div></div>', 'dirty': [], 'returns': returns},
+                             'serverMemo': memo})
+            return
+
+        components = []
+        for component in payload.get('components', []):
+            snapshot = component.get('snapshot') or {}
+            if isinstance(snapshot, str):
+                snapshot = json.loads(snapshot)
+            data = dict(snapshot.get('data') or {})
+            data.update(component.get('updates') or {})
+            returns = self._run_calls(data, component.get('calls') or [])
+            memo = dict(snapshot.get('memo') or {})
+            memo.setdefault('id', new_uuid(random, 20))
+            new_snapshot = {'data': data, 'memo': memo, 'checksum': secrets.token_hex(32)}
+            components.append({'snapshot': json.dumps(new_snapshot),
+                               'effects': {'returns': returns, 'html': '<div></div>'}})
+        self._json(200, {'components': components, 'assets': []})
+
+    def _run_calls(self, data, calls):
+        """Treat any call carrying a repository (in data or params) as application creation"""
+        returns = []
+        for call in calls:
+            params = [p for p in call.get('params') or [] if isinstance(p, dict)]
+            fields = dict(data, **params[0]) if params else data
+            if fields.get('repository_url') or fields.get('git_repository'):
+                app = self.server.state.create_application(fields)
+                returns.append({'uuid': app['uuid']})
+            else:
+                returns.append(None)
+        return returns
+
+    # -- api --------------------------------------------------------------
+
+    def _api_authorized(self):
+        auth = self.headers.get('Authorization', '')
+        if auth.startswith('Bearer ') and auth[7:] in self.server.state.api_tokens:
+            return True
+        _, session = self._session()
+        if session is not None and session['user'] is not None:
+            return True
+        self._json(401, {'message': 'Unauthenticated.'})
+        return False
+
+    def _api_list(self, items):
+        query = parse_qs(urlparse(self.path).query)
+        if not self.server.paginate or 'per_page' not in query:
+            self._json(200, items)
+            return
+        per_page = max(1, int(query['per_page'][0]))
+        page = max(1, int(query.get('page', ['1'])[0]))
+        last_page = max(1, (len(items) + per_page - 1) // per_page)
+        self._json(200, {'data': items[(page - 1) * per_page:page * per_page],
+                         'current_page': page, 'last_page': last_page, 'per_page': per_page,
+                         'total': len(items)})
+
+    def api_version(self):
+        if self._api_authorized():
+            self._send(200, '4.0.0-beta.stand-in', 'text/plain')
+
+    def api_servers(self):
+        if self._api_authorized():
+            self._api_list(self.server.state.servers)
+
+    def api_applications(self):
+        if self._api_authorized():
+            state = self.server.state
+            self._api_list([state.application_view(app) for app in list(state.applications.values())])
+
+    def api_application(self, uuid):
+        if not self._api_authorized():
+            return
+        app = self.server.state.applications.get(uuid)
+        if app is None:
+            self._json(404, {'message': 'Application not found.'})
+            return
+        self._json(200, self.server.state.application_view(app))
+
+    def api_create_application(self):
+        if not self._api_authorized():
+            return
+        try:
+            data = json.loads(self._body() or b'{}')
+        except ValueError:
+            self._json(400, {'message': 'Invalid JSON'})
+            return
+        if not (data.get('git_repository') or data.get('repository_url')):
+            self._json(422, {'message': 'Validation failed.', 'errors': {'git_repository': ['required']}})
+            return
+        app = self.server.state.create_application(data)
+        self._json(201, {'uuid': app['uuid'], 'id': app['uuid'], 'domains': app['fqdn']})
+
+    def _deploy(self, uuids):
+        deployments = []
+        for uuid in uuids:
+            deployment = self.server.state.start_deployment(uuid)
+            if deployment is not None:
+                deployments.append({'message': 'Application deployment queued.', 'resource_uuid': uuid,
+                                    'deployment_uuid': deployment['deployment_uuid']})
+        if not deployments:
+            self._json(404, {'message': 'No resources found.'})
+            return
+        self._json(200, {'deployments': deployments})
+
+    def api_deploy(self):
+        if self._api_authorized():
+            query = parse_qs(urlparse(self.path).query)
+            self._deploy([u for value in query.get('uuid', []) for u in value.split(',') if u])
+
+    def api_application_deploy(self, uuid):
+        if not self._api_authorized():
+            return
+        deployment = self.server.state.start_deployment(uuid)
+        if deployment is None:
+            self._json(404, {'message': 'Application not found.'})
+            return
+        self._json(202, {'id': deployment['deployment_uuid'], 'deployment_uuid': deployment['deployment_uuid'],
+                         'message': 'Deployment request queued.'})
+
+    def api_deployments(self):
+        if self._api_authorized():
+            state = self.server.state
+            self._api_list([state.deployment_view(d) for d in list(state.deployments.values())])
+
+    def api_deployment(self, uuid):
+        if not self._api_authorized():
+            return
+        deployment = self.server.state.deployments.get(uuid)
+        if deployment is None:
+            self._json(404, {'message': 'Deployment not found.'})
+            return
+        self._json(200, self.server.state.deployment_view(deployment))
+
+
+def _routes(table):
+    return [(re.compile(f"^{pattern}$"), handler) for pattern, handler in table]
+
+
+GET_ROUTES = _routes([
+    ('/login', StandInHandler.login_page),
+    ('/logout', StandInHandler.logout),
+    ('/api/v1/version', StandInHandler.api_version),
+    ('/api/v1/servers', StandInHandler.api_servers),
+    ('/api/v1/applications', StandInHandler.api_applications),
+    ('/api/v1/applications/([a-z0-9]+)', StandInHandler.api_application),
+    ('/api/v1/deploy', StandInHandler.api_deploy),
+    ('/api/v1/deployments', StandInHandler.api_deployments),
+    ('/api/v1/deployments/([a-z0-9]+)', StandInHandler.api_deployment),
+    ('/.*', StandInHandler.page),
+])
+POST_ROUTES = _routes([
+    ('/login', StandInHandler.login),
+    ('/logout', StandInHandler.logout),
+    ('/livewire/update', StandInHandler.livewire_update),
+    ('/api/v1/applications', StandInHandler.api_create_application),
+    ('/api/v1/applications/([a-z0-9]+)/deploy', StandInHandler.api_application_deploy),
+    ('/api/v1/deploy', StandInHandler.api_deploy),
+])
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded HTTP server emulating a Coolify instance"""
+
+    daemon_threads = True
+    request_queue_size = 128  # Load tests open many connections at once
+
+    def __init__(self, host='127.0.0.1', port=0, site=None, credentials=None, api_tokens=None,
+                 latency=0.0, jitter=0.0, failure_rate=0.0, failure_statuses=(500,), failure_paths=('/',),
+                 paginate=False, deploy_duration=5.0, seed=None, verbose=False):
+        super().__init__((host, port), StandInHandler)
+        self.state = StandInState(site or FixtureSite(), credentials, api_tokens, deploy_duration, seed)
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.failure_statuses = list(failure_statuses)
+        self.failure_paths = tuple(failure_paths)
+        self.paginate = paginate
+        self.verbose = verbose
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve on a daemon thread and return self"""
+        self._thread = threading.Thread(target=self.serve_forever, name='coolify-standin', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local Coolify stand-in server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--fixtures', default=FIXTURE_DIR, help='Directory with the captured HTML pages')
+    parser.add_argument('--user', action='append', default=[], metavar='EMAIL:PASSWORD',
+                        help='Accepted login (repeatable; default accepts any credentials)')
+    parser.add_argument('--token', action='append', default=[], help='Accepted API bearer token (repeatable)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra random latency up to this many seconds')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Fraction of requests that fail')
+    parser.add_argument('--failure-status', type=int, action='append', default=[],
+                        help='Status for injected failures (repeatable, default 500)')
+    parser.add_argument('--failure-path', action='append', default=[],
+                        help='Only inject failures under this path prefix (repeatable)')
+    parser.add_argument('--paginate', action='store_true', help='Paginate /api/v1 lists when per_page is given')
+    parser.add_argument('--deploy-duration', type=float, default=5.0, help='Seconds until a deployment finishes')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    credentials = dict(user.split(':', 1) for user in args.user) or None
+    server = StandInServer(args.host, args.port, FixtureSite(args.fixtures), credentials, args.token,
+                           args.latency, args.jitter, args.failure_rate, args.failure_status or (500,),
+                           args.failure_path or ('/',), args.paginate, args.deploy_duration, args.seed,
+                           args.verbose)
+    print(f"🧪 Coolify stand-in serving {args.fixtures} at {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopping stand-in server")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
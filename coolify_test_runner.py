@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Coolify Parallel Test Runner
+Runs the diagnostic test suites as a dependency graph, with independent checks in parallel on each suite's logged-in session
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+DEFAULT_URL = 'https://coolify.247420.xyz'
+DEFAULT_JOBS = 8
+
+
+class Check:
+    """One diagnostic: a callable plus the names of the checks that must pass before it"""
+
+    def __init__(self, name, func, after=()):
+        self.name = name
+        self.func = func
+        self.after = tuple(after)
+
+
+def passed(value):
+    """Whether a tester method's return value means success
+
+    The suites report in several shapes: bools, (success, message)
+    tuples, {'success': ...} dicts, lists of working endpoints and dicts
+    of per-endpoint results.
+    """
+    if isinstance(value, tuple) and value:
+        return bool(value[0])
+    if isinstance(value, dict):
+        if 'success' in value:
+            return bool(value['success'])
+        if value and all(isinstance(item, dict) for item in value.values()):
+            return any(item.get('success') for item in value.values())
+    return bool(value)
+
+
+class _ThreadOutput:
+    """sys.stdout stand-in that buffers prints per check thread so parallel checks do not interleave"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def capture(self):
+        self._local.buffer = io.StringIO()
+
+    def release(self):
+        buffer, self._local.buffer = self._local.buffer, None
+        return buffer.getvalue()
+
+    def write(self, text):
+        return (getattr(self._local, 'buffer', None) or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class GraphRunner:
+    """Runs checks as soon as everything they depend on has passed; dependents of a failure are skipped"""
+
+    def __init__(self, checks, jobs=DEFAULT_JOBS):
+        self.checks = {}
+        for check in checks:
+            if check.name in self.checks:
+                raise ValueError(f"Duplicate check {check.name!r}")
+            for dependency in check.after:
+                # Dependencies must be declared first, which also rules out cycles
+                if dependency not in self.checks:
+                    raise ValueError(f"{check.name!r} depends on unknown or later check {dependency!r}")
+            self.checks[check.name] = check
+        self.jobs = max(1, jobs)
+        self.results = {}
+        self._output = None
+
+    def _run_check(self, check):
+        self._output.capture()
+        start = time.monotonic()
+        try:
+            value = check.func()
+            result = {'status': 'passed' if passed(value) else 'failed', 'value': value}
+        except Exception as e:
+            result = {'status': 'failed', 'value': None, 'error': f"{type(e).__name__}: {e}"}
+        end = time.monotonic()
+        result.update(start=start, end=end, duration=end - start, output=self._output.release())
+        return result
+
+    def _report(self, name, result):
+        icon = {'passed': '✅', 'failed': '❌', 'skipped': '⏭️ '}[result['status']]
+        print(f"\n{icon} {name} ({result['status']}, {result['duration']:.2f}s)")
+        if result.get('output'):
+            print(result['output'].rstrip('\n'))
+        if result.get('error'):
+            print(f"    {result['error']}")
+
+    def run(self):
+        """Run every check; returns {name: result}"""
+        waiting = dict(self.checks)
+        running = {}
+        self.started = time.monotonic()
+        self._output = _ThreadOutput(sys.stdout)
+        sys.stdout = self._output
+        try:
+            with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+                while waiting or running:
+                    for name, check in list(waiting.items()):
+                        states = [self.results.get(dependency, {}).get('status') for dependency in check.after]
+                        if any(state in ('failed', 'skipped') for state in states):
+                            del waiting[name]
+                            failed = [d for d, state in zip(check.after, states) if state != 'passed']
+                            now = time.monotonic()
+                            self.results[name] = {'status': 'skipped', 'value': None, 'start': now, 'end': now,
+                                                  'duration': 0.0, 'error': f"needs {', '.join(failed)}"}
+                            self._report(name, self.results[name])
+                        elif all(state == 'passed' for state in states):
+                            del waiting[name]
+                            running[pool.submit(self._run_check, check)] = name
+                    if not running:
+                        continue  # Only skips happened; rescan for their dependents
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = running.pop(future)
+                        self.results[name] = future.result()
+                        self._report(name, self.results[name])
+        finally:
+            sys.stdout = self._output.stream
+        self.elapsed = time.monotonic() - self.started
+        return self.results
+
+    def critical_path(self):
+        """(seconds, [names]) of the longest dependency chain by measured duration"""
+        longest = {}
+        for name, check in self.checks.items():
+            duration = self.results.get(name, {}).get('duration', 0.0)
+            before = max((longest[d] for d in check.after), key=lambda item: item[0], default=(0.0, []))
+            longest[name] = (before[0] + duration, before[1] + [name])
+        return max(longest.values(), key=lambda item: item[0], default=(0.0, []))
+
+
+# -- suites -----------------------------------------------------------------
+# Each builder returns (checks, finish); finish(results) writes the suite's usual results file.
+
+def cli_suite(base_url, email, password):
+    from coolify_cli_test import CoolifyCLITester
+
+    tester = CoolifyCLITester()
+    tester.base_url, tester.username, tester.password = base_url, email, password
+
+    def finish(results):
+        with open('coolify_cli_test_results.json', 'w') as f:
+            json.dump(tester.test_results, f, indent=2)
+
+    return [
+        Check('connectivity', tester.test_basic_connectivity),
+        Check('login', tester.test_login_workflow, after=['connectivity']),
+        Check('api_endpoints', tester.test_api_endpoints, after=['login']),
+        Check('github_repo', tester.test_github_repo_access),
+        Check('nixpacks_config', tester.test_nixpacks_config),
+    ], finish
+
+
+def complete_suite(base_url, email, password):
+    from coolify_complete_test import CoolifyCompleteTest
+
+    tester = CoolifyCompleteTest()
+    tester.base_url, tester.username, tester.password = base_url, email, password
+
+    def finish(results):
+        tester.generate_comprehensive_report()
+
+    return [
+        Check('login', tester.test_coolify_login),
+        Check('resource_listings', tester.test_resource_listings, after=['login']),
+        Check('deployment_simulation', tester.test_deployment_simulation, after=['login']),
+        Check('github_integration', tester.test_github_integration),
+        Check('nixpacks_configuration', tester.test_nixpacks_configuration),
+    ], finish
+
+
+def simple_suite(base_url, email, password):
+    from simple_coolify_test import SimpleCoolifyTest
+
+    tester = SimpleCoolifyTest(base_url)
+
+    def finish(results):
+        login = results['login']['value'] or (False, results['login'].get('error'))
+        report = {'login': {'success': login[0], 'message': login[1]}}
+        for name in ('dashboard', 'application_creation', 'endpoints'):
+            if results[name]['status'] != 'skipped':
+                report[name] = results[name]['value']
+        with open('simple_coolify_test_results.json', 'w') as f:
+            json.dump(report, f, indent=2)
+
+    return [
+        Check('login', lambda: tester.login(email, password)),
+        Check('dashboard', tester.test_dashboard, after=['login']),
+        Check('application_creation', tester.test_application_creation, after=['login']),
+        Check('endpoints', tester.test_endpoints, after=['login']),
+    ], finish
+
+
+def comprehensive_suite(base_url, email, password):
+    from coolify_comprehensive_test import CoolifyComprehensiveTest
+
+    tester = CoolifyComprehensiveTest(base_url)
+
+    def finish(results):
+        login = results['login']['value'] or (False, results['login'].get('error'))
+        report = {'login': {'success': login[0], 'message': login[1]}}
+        if results['api_endpoints']['status'] != 'skipped':
+            endpoints = results['api_endpoints']['value'] or []
+            report['api_endpoints'] = {'successful': endpoints, 'count': len(endpoints)}
+        if results['app_creation']['status'] != 'skipped':
+            creation = results['app_creation']['value'] or (False, results['app_creation'].get('error'))
+            report['app_creation'] = {'success': creation[0], 'message': creation[1]}
+        with open('coolify_test_results.json', 'w') as f:
+            json.dump(report, f, indent=2)
+
+    return [
+        Check('login', lambda: tester.test_login(email, password)),
+        Check('api_endpoints', tester.test_api_endpoints, after=['login']),
+        Check('app_creation', tester.test_create_application, after=['login']),
+    ], finish
+
+
+SUITES = {
+    'cli': cli_suite,
+    'complete': complete_suite,
+    'simple': simple_suite,
+    'comprehensive': comprehensive_suite,
+}
+
+
+def build_checks(suite_names, base_url, email, password):
+    """Checks of the chosen suites in one graph, names prefixed by suite; returns (checks, finishers)"""
+    checks = []
+    finishers = []
+    for suite in suite_names:
+        suite_checks, finish = SUITES[suite](base_url, email, password)
+        for check in suite_checks:
+            checks.append(Check(f"{suite}.{check.name}", check.func, [f"{suite}.{d}" for d in check.after]))
+        finishers.append((suite, finish))
+    return checks, finishers
+
+
+def run_suites(suite_names, base_url, email, password, jobs=DEFAULT_JOBS, output=None):
+    """Run the suites; returns True when every check passed"""
+    checks, finishers = build_checks(suite_names, base_url, email, password)
+    print(f"🧪 Running {len(checks)} checks from {', '.join(suite_names)} against {base_url} ({jobs} parallel)")
+    runner = GraphRunner(checks, jobs)
+    results = runner.run()
+
+    for suite, finish in finishers:
+        prefix = suite + '.'
+        try:
+            finish({name[len(prefix):]: result for name, result in results.items() if name.startswith(prefix)})
+        except Exception as e:
+            print(f"⚠️  Could not write the {suite} results file: {e}")
+
+    counts = {status: sum(1 for r in results.values() if r['status'] == status)
+              for status in ('passed', 'failed', 'skipped')}
+    serial = sum(r['duration'] for r in results.values())
+    path_time, path = runner.critical_path()
+    print("\n=== Test Results ===")
+    print(f"Passed: {counts['passed']}/{len(results)}  Failed: {counts['failed']}  Skipped: {counts['skipped']}")
+    print(f"⏱️  Wall {runner.elapsed:.2f}s (checks sum to {serial:.2f}s; critical path {path_time:.2f}s: "
+          f"{' → '.join(path)})")
+
+    if output:
+        report = {
+            'base_url': base_url,
+            'suites': list(suite_names),
+            'elapsed': runner.elapsed,
+            'critical_path': {'seconds': path_time, 'checks': path},
+            'checks': {name: {'status': r['status'], 'duration': r['duration'],
+                              'start': r['start'] - runner.started, 'error': r.get('error'),
+                              'after': list(runner.checks[name].after)}
+                       for name, r in results.items()},
+        }
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Results saved to {output}")
+    return counts['passed'] == len(results)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the Coolify diagnostic suites as a parallel dependency graph')
+    parser.add_argument('--suite', action='append', choices=list(SUITES) + ['all'],
+                        help='Suite to run (repeatable; default: cli)')
+    parser.add_argument('--url', default=os.environ.get('COOLIFY_URL', DEFAULT_URL), help='Coolify base URL')
+    parser.add_argument('--email', default=os.environ.get('COOLIFY_EMAIL', 'admin@247420.xyz'), help='Email for login')
+    parser.add_argument('--password', default=os.environ.get('COOLIFY_PASSWORD', '123,slam123,slam'),
+                        help='Password for login')
+    parser.add_argument('--jobs', type=int, default=DEFAULT_JOBS, help='Checks run at once (1: serial)')
+    parser.add_argument('--output', help='Write per-check timings and statuses as JSON to this file')
+    args = parser.parse_args(argv)
+
+    suites = args.suite or ['cli']
+    if 'all' in suites:
+        suites = list(SUITES)
+    suites = list(dict.fromkeys(suites))
+    return 0 if run_suites(suites, args.url, args.email, args.password, args.jobs, args.output) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Coolify Request Timing
+Per-request connect/TLS/TTFB/transfer breakdown with per-endpoint-template histograms
+"""
+
+import atexit
+import bisect
+import json
+import os
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from coolify_request_log import endpoint_template
+
+PHASES = ('connect', 'tls', 'ttfb', 'transfer', 'total')
+
+# Histogram bucket upper bounds in seconds (the last bucket is +Inf)
+BUCKET_BOUNDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_current = threading.local()
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """Reports DNS + TCP connect time to the request in flight on this thread"""
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            timing = getattr(_current, 'timing', None)
+            if timing is not None:
+                timing['connect'] += time.perf_counter() - start
+
+
+class TimedHTTPSConnection(HTTPSConnection):
+    """Reports TCP connect and, separately, TLS handshake time"""
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            timing = getattr(_current, 'timing', None)
+            if timing is not None:
+                timing['connect'] += time.perf_counter() - start
+
+    def connect(self):
+        timing = getattr(_current, 'timing', None)
+        before = timing['connect'] if timing is not None else 0.0
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            if timing is not None:
+                # Whatever connect() spent beyond the TCP connect was the handshake
+                tcp = timing['connect'] - before
+                timing['tls'] += max(0.0, time.perf_counter() - start - tcp)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (cumulative buckets are derived on export)"""
+
+    __slots__ = ('counts', 'count', 'sum', 'min', 'max')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(BUCKET_BOUNDS, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, fraction):
+        """Upper bound of the bucket holding the given quantile"""
+        if not self.count:
+            return None
+        target = fraction * self.count
+        seen = 0
+        for bound, count in zip(BUCKET_BOUNDS + (self.max,), self.counts):
+            seen += count
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.quantile(0.50),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'buckets': dict(zip([str(b) for b in BUCKET_BOUNDS] + ['+Inf'], self.counts)),
+        }
+
+
+class TimingStats:
+    """Histograms per endpoint template ("POST /livewire/update") and phase"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+        self.errors = {}
+
+    def observe(self, timing):
+        key = f"{timing['method']} {timing['endpoint']}"
+        with self._lock:
+            if timing.get('error'):
+                self.errors[key] = self.errors.get(key, 0) + 1
+                return
+            phases = self._endpoints.get(key)
+            if phases is None:
+                phases = self._endpoints[key] = {phase: Histogram() for phase in PHASES}
+            for phase in PHASES:
+                value = timing.get(phase)
+                if value is not None:
+                    phases[phase].observe(value)
+
+    def histograms(self):
+        """{endpoint: {phase: Histogram}} (live objects; read-only use)"""
+        with self._lock:
+            return {key: dict(phases) for key, phases in self._endpoints.items()}
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'endpoints': {key: {phase: h.to_dict() for phase, h in phases.items()}
+                              for key, phases in self._endpoints.items()},
+                'errors': dict(self.errors),
+            }
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self.errors.clear()
+
+    def print_summary(self):
+        snapshot = self.snapshot()
+        if not snapshot['endpoints'] and not snapshot['errors']:
+            return
+        print("⏱️  Request timing by endpoint (p50 / p95, ms)")
+        rows = sorted(snapshot['endpoints'].items(), key=lambda item: -item[1]['total']['sum'])
+        for key, phases in rows:
+            parts = []
+            for phase in PHASES:
+                entry = phases[phase]
+                if entry['count']:
+                    parts.append(f"{phase} {entry['p50'] * 1000:.1f}/{entry['p95'] * 1000:.1f}")
+            print(f"   {key} ×{phases['total']['count']}: " + ', '.join(parts))
+        for key, count in snapshot['errors'].items():
+            print(f"   ❌ {key}: {count} failed before a response")
+
+
+_hooks = []
+_stats = TimingStats()
+
+
+def add_timing_hook(hook):
+    """Call hook(timing) after every request; timing holds method, endpoint, url, status, bytes and PHASES"""
+    _hooks.append(hook)
+
+
+def remove_timing_hook(hook):
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def get_timing_stats():
+    """Process-wide histograms, fed by every session from create_session()"""
+    return _stats
+
+
+add_timing_hook(_stats.observe)
+
+
+def _emit(timing):
+    for hook in list(_hooks):
+        try:
+            hook(timing)
+        except Exception as e:
+            print(f"   ⚠️  Timing hook failed: {e}")
+
+
+class TimingAdapter(HTTPAdapter):
+    """HTTPAdapter that times each HTTP exchange (every redirect hop separately)
+
+    connect covers DNS and TCP, tls the handshake, ttfb the time from
+    sending until the response headers arrived, and transfer the body read.
+    Reused keep-alive connections report connect and tls as 0. For
+    stream=True responses the body is read later by the caller, so
+    transfer is left out.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': TimedHTTPConnectionPool,
+                                                   'https': TimedHTTPSConnectionPool}
+
+    def send(self, request, stream=False, **kwargs):
+        timing = {'method': request.method, 'endpoint': endpoint_template(request.url), 'url': request.url,
+                  'status': None, 'connect': 0.0, 'tls': 0.0, 'ttfb': None, 'transfer': None, 'total': None}
+        _current.timing = timing
+        start = time.perf_counter()
+        try:
+            response = super().send(request, stream=stream, **kwargs)
+            headers_at = time.perf_counter()
+            if not stream:
+                response.content  # Read the body here so the transfer can be timed
+        except Exception as e:
+            timing['error'] = type(e).__name__
+            timing['total'] = time.perf_counter() - start
+            _emit(timing)
+            raise
+        finally:
+            _current.timing = None
+
+        end = time.perf_counter()
+        timing['status'] = response.status_code
+        timing['ttfb'] = max(0.0, headers_at - start - timing['connect'] - timing['tls'])
+        if not stream:
+            timing['transfer'] = end - headers_at
+            timing['bytes'] = len(response.content)
+        elif response.headers.get('Content-Length', '').isdigit():
+            timing['bytes'] = int(response.headers['Content-Length'])
+        timing['total'] = end - start
+        response.timing = timing
+        _emit(timing)
+        return response
+
+
+def _dump_at_exit():
+    target = os.environ.get('COOLIFY_TIMINGS', '')
+    if target in ('', '0'):
+        return
+    if target in ('1', 'print', 'stderr'):
+        _stats.print_summary()
+        return
+    with open(target, 'w') as f:
+        json.dump(_stats.snapshot(), f, indent=2)
+
+
+# COOLIFY_TIMINGS=1 prints the histograms at exit; any other value is a JSON file to write them to
+atexit.register(_dump_at_exit)
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Coolify Span Tracing
+Nested spans for workflow steps and HTTP calls, exported as OTLP-compatible JSON; a no-op when disabled
+"""
+
+import atexit
+import contextvars
+import functools
+import json
+import os
+import secrets
+import threading
+import time
+
+from coolify_timing import add_timing_hook, remove_timing_hook
+
+SERVICE_NAME = 'coolify-cli'
+
+# OTLP enums
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_current_span = contextvars.ContextVar('coolify_current_span', default=None)
+_exporter = None
+
+
+def _attribute(key, value):
+    if isinstance(value, bool):
+        return {'key': key, 'value': {'boolValue': value}}
+    if isinstance(value, int):
+        return {'key': key, 'value': {'intValue': str(value)}}
+    if isinstance(value, float):
+        return {'key': key, 'value': {'doubleValue': value}}
+    return {'key': key, 'value': {'stringValue': str(value)}}
+
+
+class Span:
+    """One timed operation; use as a context manager"""
+
+    __slots__ = ('name', 'kind', 'trace_id', 'span_id', 'parent_id', 'attributes', 'status', 'message',
+                 'start_ns', 'end_ns', '_token')
+
+    def __init__(self, name, parent=None, kind=SPAN_KIND_INTERNAL, attributes=None, start_ns=None):
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent is not None else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent is not None else None
+        self.attributes = dict(attributes or {})
+        self.status = None
+        self.message = None
+        self.start_ns = start_ns or time.time_ns()
+        self.end_ns = None
+        self._token = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def set_status(self, ok, message=None):
+        self.status = STATUS_OK if ok else STATUS_ERROR
+        self.message = message
+
+    def end(self, end_ns=None):
+        self.end_ns = end_ns or time.time_ns()
+        if _exporter is not None:
+            _exporter.export(self)
+
+    def __enter__(self):
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc is not None:
+            self.set_status(False, f"{exc_type.__name__}: {exc}")
+            self.attributes['exception.type'] = exc_type.__name__
+        _current_span.reset(self._token)
+        self.end()
+        return False
+
+    def to_otlp(self):
+        span = {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'name': self.name,
+            'kind': self.kind,
+            'startTimeUnixNano': str(self.start_ns),
+            'endTimeUnixNano': str(self.end_ns),
+            'attributes': [_attribute(k, v) for k, v in self.attributes.items() if v is not None],
+        }
+        if self.parent_id:
+            span['parentSpanId'] = self.parent_id
+        if self.status is not None:
+            span['status'] = {'code': self.status}
+            if self.message:
+                span['status']['message'] = self.message
+        return span
+
+
+class _NoopSpan:
+    """Returned while tracing is off so instrumented code costs a flag check"""
+
+    __slots__ = ()
+
+    def set_attribute(self, key, value):
+        pass
+
+    def set_status(self, ok, message=None):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class FileExporter:
+    """Appends one OTLP ExportTraceServiceRequest JSON object per line (the collector file format)
+
+    Spans are buffered and written whenever a root span ends, so each line
+    normally holds one complete trace.
+    """
+
+    def __init__(self, path, service_name=SERVICE_NAME):
+        self.path = path
+        self.service_name = service_name
+        self._spans = []
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, span):
+        with self._lock:
+            self._spans.append(span.to_otlp())
+            if span.parent_id is None:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._spans:
+            return
+        request = {'resourceSpans': [{
+            'resource': {'attributes': [_attribute('service.name', self.service_name)]},
+            'scopeSpans': [{'scope': {'name': 'coolify_tracing'}, 'spans': self._spans}],
+        }]}
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(request) + '\n')
+        self._spans = []
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+
+def tracing_enabled():
+    return _exporter is not None
+
+
+def current_span():
+    return _current_span.get()
+
+
+def span(name, kind=SPAN_KIND_INTERNAL, **attributes):
+    """Start a child of the current span (or a new trace); no-op when tracing is off"""
+    if _exporter is None:
+        return NOOP_SPAN
+    return Span(name, _current_span.get(), kind, attributes)
+
+
+def _record_result(current, result):
+    # Most client methods return (success, message); monitors return {'success': ..., 'message': ...}
+    if isinstance(result, tuple) and result and isinstance(result[0], bool):
+        current.set_attribute('coolify.success', result[0])
+        message = result[1] if len(result) > 1 and not result[0] else None
+        current.set_status(result[0], str(message)[:200] if message else None)
+    elif isinstance(result, bool):
+        current.set_attribute('coolify.success', result)
+        current.set_status(result)
+    elif isinstance(result, dict) and isinstance(result.get('success'), bool):
+        current.set_attribute('coolify.success', result['success'])
+        current.set_status(result['success'], None if result['success'] else result.get('message'))
+
+
+def traced(name=None):
+    """Decorator that runs a function inside a span named after it"""
+    def decorate(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _exporter is None:
+                return func(*args, **kwargs)
+            with span(span_name) as current:
+                result = func(*args, **kwargs)
+                _record_result(current, result)
+                return result
+        return wrapper
+    return decorate
+
+
+def _http_span(timing):
+    """Timing hook: turn a finished HTTP exchange into a client span under the current span"""
+    end_ns = time.time_ns()
+    start_ns = end_ns - int((timing.get('total') or 0) * 1e9)
+    http = Span(f"{timing['method']} {timing['endpoint']}", _current_span.get(), SPAN_KIND_CLIENT, {
+        'http.request.method': timing['method'],
+        'url.full': timing['url'],
+        'url.template': timing['endpoint'],
+        'http.response.status_code': timing.get('status'),
+        'http.response.body.size': timing.get('bytes'),
+        'coolify.connect_ms': round(timing['connect'] * 1000, 3),
+        # Plain-HTTP requests have no handshake; leave the attribute off rather than report 0
+        'coolify.tls_ms': round(timing['tls'] * 1000, 3) if timing['url'].startswith('https:') else None,
+        'coolify.ttfb_ms': round(timing['ttfb'] * 1000, 3) if timing.get('ttfb') is not None else None,
+        'coolify.transfer_ms': round(timing['transfer'] * 1000, 3) if timing.get('transfer') is not None else None,
+    }, start_ns)
+    if timing.get('error'):
+        http.set_status(False, timing['error'])
+    elif timing.get('status') is not None:
+        http.set_status(timing['status'] < 400)
+    http.end(end_ns)
+
+
+def enable_tracing(path, service_name=SERVICE_NAME):
+    """Start exporting spans (including one per HTTP request) to an OTLP JSON lines file"""
+    global _exporter
+    if _exporter is None:
+        add_timing_hook(_http_span)
+        atexit.register(disable_tracing)
+    else:
+        _exporter.flush()
+    _exporter = FileExporter(path, service_name)
+    return _exporter
+
+
+def disable_tracing():
+    global _exporter
+    if _exporter is not None:
+        _exporter.flush()
+        remove_timing_hook(_http_span)
+        _exporter = None
+
+
+# COOLIFY_TRACE=<file> turns tracing on for any tool without code changes
+if os.environ.get('COOLIFY_TRACE'):
+    enable_tracing(os.environ['COOLIFY_TRACE'])
@@ -11,13 +11,14 @@ import time
 import subprocess
 import sys
 from urllib.parse import urljoin
+from coolify_http import create_session
 
 class CoolifyDeployer:
     def __init__(self):
         self.base_url = "https://coolify.247420.xyz"
         self.username = os.getenv("COOLIFY_USERNAME", "admin@247420.xyz")
         self.password = os.getenv("COOLIFY_PASSWORD", "123,slam123,slam")
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.verify = False
         self.deployment_logs = []
         
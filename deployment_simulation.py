@@ -5,43 +5,40 @@ Simulates deployment of AnEntrypoint/nixpacks-test-app
 Captures expected network patterns and Livewire communications
 """
 
-import requests
+import os
 import re
 import json
 import time
 from datetime import datetime
+from coolify_http import create_session
+from coolify_inventory import get_inventory
+from coolify_recorder import NetworkRecorder, response_body
+from coolify_request_log import RequestLog
+
+DEFAULT_NETWORK_LOG = "network_simulation_log.jsonl"  # In the working directory unless COOLIFY_NETWORK_LOG is set
 
 class CoolifyDeploymentSimulator:
-    def __init__(self):
+    def __init__(self, network_log_path=None):
         self.base_url = "https://coolify.247420.xyz"
-        self.session = requests.Session()
+        self.session = create_session()
         self.username = "admin@247420.xyz"
         self.password = "123,slam123,slam"
-        self.network_log = []
+        self.recorder = NetworkRecorder(network_log_path or os.environ.get('COOLIFY_NETWORK_LOG', DEFAULT_NETWORK_LOG))
+        self.request_log = RequestLog()
+        self.inventory = get_inventory()
         self.test_repo = "https://github.com/AnEntrypoint/nixpacks-test-app"
         
     def log_request(self, method, url, data=None, headers=None, response=None):
         """Log all network requests with detailed information"""
-        log_entry = {
-            'timestamp': datetime.now().isoformat(),
-            'method': method,
-            'url': url,
-            'headers': headers or {},
-            'data': data,
-            'response_status': response.status_code if response else None,
-            'response_headers': dict(response.headers) if response else {},
-            'response_data': response.text[:2000] if response and hasattr(response, 'text') else None,
-            'content_type': response.headers.get('content-type', '') if response else '',
-            'content_length': len(response.content) if response else 0
-        }
-        self.network_log.append(log_entry)
+        content_length = self.recorder.record(method, url, data, headers, response)
+        self.request_log.log_response(method, url, response, content_length)
         
         # Print real-time feedback
         emoji = "📡" if method == "GET" else "🚀" if method == "POST" else "⚡"
-        print(f"{emoji} {method} {url} -> {response.status_code if response else 'N/A'} ({len(response.content) if response else 0} bytes)")
+        print(f"{emoji} {method} {url} -> {response.status_code if response else 'N/A'} ({content_length} bytes)")
         
         if response and response.status_code >= 400:
-            print(f"   ❌ Error details: {response.text[:200]}")
+            print(f"   ❌ Error details: {response_body(response, 200)}")
     
     def authenticate(self):
         """Authenticate with Coolify"""
@@ -79,16 +76,15 @@ class CoolifyDeploymentSimulator:
             print("❌ Authentication failed")
             return False
     
-    def get_project_structure(self):
-        """Get project structure to understand deployment flow"""
-        print("🏗️  Analyzing project structure...")
-        
+    def _fetch_project_structure(self):
+        """Scan the project pages for project and environment IDs"""
         pages = [
             '/sources',
             '/projects', 
             '/destinations'
         ]
         
+        structure = []
         for page in pages:
             try:
                 response = self.session.get(f"{self.base_url}{page}")
@@ -96,18 +92,31 @@ class CoolifyDeploymentSimulator:
                 
                 # Extract key information
                 if response.status_code == 200:
-                    # Look for project IDs
-                    project_ids = re.findall(r'/project/([a-z0-9]+)', response.text)
-                    if project_ids:
-                        print(f"   📁 Found {len(set(project_ids))} projects on {page}")
-                        
-                    # Look for environment IDs
-                    env_ids = re.findall(r'/environment/([a-z0-9]+)', response.text)
-                    if env_ids:
-                        print(f"   🌍 Found {len(set(env_ids))} environments on {page}")
+                    structure.append({
+                        'page': page,
+                        'project_ids': sorted(set(re.findall(r'/project/([a-z0-9]+)', response.text))),
+                        'environment_ids': sorted(set(re.findall(r'/environment/([a-z0-9]+)', response.text))),
+                    })
                         
             except Exception as e:
                 print(f"   ❌ Error accessing {page}: {e}")
+        
+        return structure or None
+    
+    def get_project_structure(self, refresh=False):
+        """Get project structure to understand deployment flow"""
+        print("🏗️  Analyzing project structure...")
+        
+        structure = self.inventory.read_through(
+            self.base_url, 'project_structure', self._fetch_project_structure, refresh=refresh) or []
+        
+        for entry in structure:
+            if entry['project_ids']:
+                print(f"   📁 Found {len(entry['project_ids'])} projects on {entry['page']}")
+            if entry['environment_ids']:
+                print(f"   🌍 Found {len(entry['environment_ids'])} environments on {entry['page']}")
+        
+        return structure
     
     def simulate_deployment_lifecycle(self):
         """Simulate the complete deployment lifecycle with expected network patterns"""
@@ -489,11 +498,10 @@ class CoolifyDeploymentSimulator:
     
     def save_results(self, deployment_steps, analysis):
         """Save simulation results to files"""
-        # Save network log
-        network_file = "/mnt/c/dev/setdomain/network_simulation_log.json"
-        with open(network_file, 'w') as f:
-            json.dump(self.network_log, f, indent=2)
-        print(f"📁 Network log saved to: {network_file}")
+        # Network log is streamed as it goes; just make sure it is on disk
+        self.recorder.flush()
+        print(f"📁 Network log saved to: {self.recorder.path} ({self.recorder.count} requests)")
+        self.request_log.print_summary()
         
         # Save deployment steps
         steps_file = "/mnt/c/dev/setdomain/deployment_steps.json"
@@ -5,11 +5,13 @@ Better session handling and debugging
 """
 
 import requests
-import json
 import sys
 import time
 import urllib3
 from urllib.parse import urljoin
+from coolify_capabilities import CapabilityProber
+from coolify_http import create_session, iter_resources
+from coolify_profiling import profile_main
 
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -17,7 +19,7 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 class ImprovedCoolifyDeployer:
     def __init__(self, base_url="https://coolify.247420.xyz"):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.verify = False
         # Set proper headers
         self.session.headers.update({
@@ -25,6 +27,7 @@ class ImprovedCoolifyDeployer:
             'Accept': 'application/json, text/plain, */*',
             'Accept-Language': 'en-US,en;q=0.9',
         })
+        self.prober = CapabilityProber(self.session, self.base_url)
 
     def login(self, email, password):
         """Login to Coolify with improved session handling"""
@@ -84,89 +87,79 @@ class ImprovedCoolifyDeployer:
             print(f"❌ Login error: {e}")
             return False
 
-    def get_servers(self):
+    def _iter_capability(self, capability):
+        """Yield resources one at a time from the endpoint that works on this instance"""
+        for attempt in range(2):
+            endpoint = self.prober.resolve(capability, refresh=attempt > 0)
+            if not endpoint:
+                print(f"❌ No working {capability} endpoint")
+                return
+            url = f"{self.base_url}{endpoint}"
+            print(f"Using {capability} endpoint: {url}")
+            yielded = False
+            try:
+                for item in iter_resources(self.session, url):
+                    yielded = True
+                    yield item
+                return
+            except (requests.HTTPError, ValueError) as e:
+                if yielded:
+                    raise
+                if isinstance(e, requests.HTTPError) and e.response.status_code == 401:
+                    print("❌ Authentication failed - session may be expired")
+                    return
+                print(f"⚠️  Stored endpoint failed ({e}), probing again...")
+                self.prober.invalidate(capability)
+
+    def iter_servers(self):
+        """Yield servers one at a time without loading the whole list"""
+        return self._iter_capability('servers')
+
+    def iter_applications(self):
+        """Yield applications one at a time without loading the whole list"""
+        return self._iter_capability('applications')
+
+    def get_servers(self, keep=True):
         """Get list of servers with improved error handling"""
         print("📋 Getting servers...")
         
+        servers = []
+        count = 0
         try:
-            # Try different endpoints
-            endpoints = [
-                "/api/v1/servers",
-                "/api/servers", 
-                "/servers"
-            ]
-            
-            for endpoint in endpoints:
-                url = f"{self.base_url}{endpoint}"
-                print(f"Trying endpoint: {url}")
-                
-                response = self.session.get(url)
-                print(f"Response status: {response.status_code}")
-                print(f"Response headers: {dict(response.headers)}")
-                
-                if response.status_code == 200:
-                    try:
-                        servers = response.json()
-                        if isinstance(servers, list):
-                            print(f"✅ Found {len(servers)} servers")
-                            for server in servers:
-                                print(f"   - {server.get('name', 'Unknown')} ({server.get('ip', 'No IP')})")
-                            return servers
-                    except json.JSONDecodeError:
-                        print(f"Response is not JSON: {response.text[:200]}")
-                elif response.status_code == 401:
-                    print("❌ Authentication failed - session may be expired")
-                else:
-                    print(f"Failed with status: {response.status_code}")
-                    
-            print("❌ All endpoints failed")
-            return []
+            for server in self.iter_servers():
+                count += 1
+                print(f"   - {server.get('name', 'Unknown')} ({server.get('ip', 'No IP')})")
+                if keep:
+                    servers.append(server)
+            print(f"✅ Found {count} servers")
+            return servers
             
         except Exception as e:
             print(f"❌ Error getting servers: {e}")
-            return []
+            return servers
 
-    def get_applications(self):
+    def get_applications(self, keep=True):
         """Get list of applications"""
         print("📋 Getting applications...")
         
+        apps = []
+        count = 0
         try:
-            endpoints = [
-                "/api/v1/applications",
-                "/api/applications",
-                "/applications"
-            ]
-            
-            for endpoint in endpoints:
-                url = f"{self.base_url}{endpoint}"
-                print(f"Trying applications endpoint: {url}")
-                
-                response = self.session.get(url)
-                print(f"Applications response status: {response.status_code}")
-                
-                if response.status_code == 200:
-                    try:
-                        apps = response.json()
-                        if isinstance(apps, list):
-                            print(f"✅ Found {len(apps)} applications")
-                            for app in apps:
-                                print(f"   - {app.get('name', 'Unknown')} ({app.get('uuid', 'No UUID')})")
-                            return apps
-                    except json.JSONDecodeError:
-                        print(f"Response is not JSON: {response.text[:200]}")
-                else:
-                    print(f"Failed with status: {response.status_code}")
-                    
-            print("❌ All application endpoints failed")
-            return []
+            for app in self.iter_applications():
+                count += 1
+                print(f"   - {app.get('name', 'Unknown')} ({app.get('uuid', 'No UUID')})")
+                if keep:
+                    apps.append(app)
+            print(f"✅ Found {count} applications")
+            return apps
             
         except Exception as e:
             print(f"❌ Error getting applications: {e}")
-            return []
+            return apps
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python3 improved_coolify_cli.py <command>")
+        print("Usage: python3 improved_coolify_cli.py <command> [--profile[=sampling]]")
         print("Commands: login, servers, apps")
         sys.exit(1)
 
@@ -181,11 +174,11 @@ def main():
 
         elif command == "servers":
             deployer.login("admin@247420.xyz", "123,slam123,slam")
-            deployer.get_servers()
+            deployer.get_servers(keep=False)
 
         elif command == "apps":
             deployer.login("admin@247420.xyz", "123,slam123,slam")
-            deployer.get_applications()
+            deployer.get_applications(keep=False)
 
         else:
             print(f"Unknown command: {command}")
@@ -195,4 +188,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
+    profile_main(main)
@@ -1,11 +1,11 @@
-import requests
 import re
 from bs4 import BeautifulSoup
+from coolify_http import create_session
 
 def test_login():
     """Quick test of login functionality"""
     
-    session = requests.Session()
+    session = create_session()
     session.headers.update({
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     })
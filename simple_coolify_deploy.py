@@ -3,12 +3,12 @@
 Simplified Coolify Application Deployment Tool
 """
 
-import requests
 import json
 import sys
 import time
 import urllib3
 from urllib.parse import urljoin
+from coolify_http import create_session
 
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -16,7 +16,7 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 class SimpleCoolifyDeployer:
     def __init__(self, base_url="https://coolify.247420.xyz"):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.verify = False
         
         # Browser-like headers
@@ -4,12 +4,12 @@ Simple Coolify Test Tool
 Tests basic functionality without complex regex
 """
 
-import requests
 import json
 import sys
 import time
 import urllib3
 from urllib.parse import urljoin
+from coolify_http import create_session
 
 # Disable SSL warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -17,7 +17,7 @@ urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 class SimpleCoolifyTest:
     def __init__(self, base_url="https://coolify.247420.xyz"):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.verify = False
         
         # Set proper headers
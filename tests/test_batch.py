@@ -0,0 +1,85 @@
+import io
+import json
+
+from coolify_batch import BatchRunner
+
+
+class FakeAPI:
+    def __init__(self, apps=()):
+        self.apps = list(apps)
+        self.created = []
+        self.deployed = []
+
+    def create_application(self, name, repo, branch='main'):
+        if name == 'broken':
+            return None
+        app = {'uuid': f"app{len(self.created):021d}", 'name': name}
+        self.created.append(app)
+        return app
+
+    def find_applications(self, query):
+        return [app for app in self.apps if query in (app['uuid'], app['name'])]
+
+    def deploy_application(self, app_id, branch='main', force_rebuild=False):
+        self.deployed.append(app_id)
+        return {'deployment_uuid': f"dep-{app_id}"}
+
+
+def run(api, *operations):
+    output = io.StringIO()
+    runner = BatchRunner(api, concurrency=4, output=output)
+    lines = [op if isinstance(op, str) else json.dumps(op) for op in operations]
+    runner.run(lines)
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def test_references_resolve_to_earlier_results():
+    api = FakeAPI()
+    results = run(api,
+                  {'id': 'web', 'op': 'create', 'name': 'web', 'repo': 'owner/web'},
+                  {'id': 'go', 'op': 'deploy', 'app': '$web'})
+    assert [line['ok'] for line in results] == [True, True]
+    assert api.deployed == [api.created[0]['uuid']]
+
+
+def test_unknown_and_duplicate_ids_fail_on_their_own_line():
+    api = FakeAPI()
+    results = run(api,
+                  {'id': 'web', 'op': 'create', 'name': 'web', 'repo': 'owner/web'},
+                  {'id': 'web', 'op': 'create', 'name': 'other', 'repo': 'owner/other'},
+                  {'op': 'deploy', 'app': '$later'},
+                  {'op': 'deploy', 'app': '$web'},
+                  {'id': 'later', 'op': 'list', 'kind': 'nothing'})
+    assert [line['ok'] for line in results] == [True, False, False, True, False]
+    assert 'duplicate id' in results[1]['error']
+    assert 'unknown reference' in results[2]['error']
+    assert [app['name'] for app in api.created] == ['web']
+    assert api.deployed == [api.created[0]['uuid']]
+
+
+def test_failed_dependency_is_reported():
+    results = run(FakeAPI(),
+                  {'id': 'bad', 'op': 'create', 'name': 'broken', 'repo': 'owner/broken'},
+                  {'op': 'deploy', 'app': '$bad'})
+    assert results[1]['error'] == "depends on failed operation 'bad'"
+
+
+def test_double_dollar_is_a_literal():
+    api = FakeAPI()
+    results = run(api, {'op': 'create', 'name': '$$web', 'repo': 'owner/web'})
+    assert results[0]['ok']
+    assert api.created[0]['name'] == '$web'
+
+
+def test_uuid_shaped_names_are_looked_up():
+    long_name = 'billingworkerproduction'
+    api = FakeAPI([{'uuid': 'k' * 24, 'name': long_name}])
+    results = run(api, {'op': 'deploy', 'app': long_name}, {'op': 'deploy', 'app': 'z' * 24})
+    assert [line['ok'] for line in results] == [True, True]
+    # An unindexed UUID is used as is (e.g. created earlier in the batch)
+    assert api.deployed == ['k' * 24, 'z' * 24]
+
+
+def test_malformed_ids_do_not_stop_the_run():
+    results = run(FakeAPI(), {'id': ['x'], 'op': 'list'}, {'op': 'deploy', 'app': 'a', 'after': [{}]}, 'not json')
+    assert [line['ok'] for line in results] == [False, False, False]
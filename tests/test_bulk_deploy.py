@@ -0,0 +1,79 @@
+import time
+
+import pytest
+
+import coolify_bulk_deploy
+from coolify_bulk_deploy import BulkDeployExecutor, DeployJob, PriorityDeployQueue
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(coolify_bulk_deploy.time, 'monotonic', clock)
+    return clock
+
+
+def test_priority_then_fifo(clock):
+    queue = PriorityDeployQueue(aging_interval=0)
+    for name, priority in [('n1', 'normal'), ('u1', 'urgent'), ('n2', 'normal'), ('u2', 'urgent'), ('l1', 'low')]:
+        queue.put(DeployJob(name, priority=priority, name=name))
+    queue.close()
+    assert [job.name for job in iter(queue.get, None)] == ['u1', 'u2', 'n1', 'n2', 'l1']
+
+
+def test_low_priority_job_overtakes_a_stream_of_urgent_ones(clock):
+    queue = PriorityDeployQueue(aging_interval=1.0)
+    queue.put(DeployJob('low', priority='low', name='low'))
+    order = []
+    for n in range(10):
+        clock.now += 1.0
+        queue.put(DeployJob(f"u{n}", priority='urgent', name=f"u{n}"))
+        order.append(queue.get().name)
+    # Three levels behind, the low job draws level after three intervals and wins the tie as the older job
+    assert order.index('low') == 2
+    assert order[:2] == ['u0', 'u1']
+
+
+def test_without_aging_urgent_stream_starves_low(clock):
+    queue = PriorityDeployQueue(aging_interval=0)
+    queue.put(DeployJob('low', priority='low', name='low'))
+    order = []
+    for n in range(10):
+        clock.now += 1.0
+        queue.put(DeployJob(f"u{n}", priority='urgent', name=f"u{n}"))
+        order.append(queue.get().name)
+    assert 'low' not in order
+
+
+def _run_stream(aging_interval):
+    started = []
+
+    def deploy(job):
+        started.append(job.name)
+        time.sleep(0.03)
+        return {'id': job.name}
+
+    # Urgent jobs arrive faster than the single worker drains them, so a backlog builds up
+    jobs = [DeployJob(f"u{n}", priority='urgent', name=f"u{n}", delay=0.02 * n) for n in range(25)]
+    jobs.append(DeployJob('low', priority='low', name='low', delay=0.01))
+    completed = BulkDeployExecutor(deploy, workers=1, aging_interval=aging_interval).run(jobs)
+    assert len(completed) == 26
+    return started
+
+
+def test_executor_feeds_delayed_jobs_so_aging_applies():
+    assert _run_stream(aging_interval=0.05).index('low') < 20
+    assert _run_stream(aging_interval=0)[-1] == 'low'
+
+
+def test_from_dict_reads_delay():
+    job = DeployJob.from_dict({'app_id': 'a1', 'priority': 'high', 'delay': '2.5'})
+    assert (job.priority, job.delay) == (1, 2.5)
@@ -0,0 +1,26 @@
+import json
+
+from coolify_capabilities import CapabilityStore
+
+INSTANCE = 'http://coolify.test'
+
+
+def test_entries_are_scoped_to_the_version(tmp_path):
+    store = CapabilityStore(str(tmp_path / 'capabilities.json'))
+    store.set(INSTANCE, 'v1', 'endpoints', 'servers', '/api/v1/servers')
+    assert store.get(INSTANCE, 'v1', 'endpoints', 'servers') == '/api/v1/servers'
+    assert store.get(INSTANCE, 'v2', 'endpoints', 'servers') is None
+    store.set(INSTANCE, 'v2', 'endpoints', 'servers', '/api/servers')
+    assert store.get(INSTANCE, 'v1', 'endpoints', 'servers') is None
+
+
+def test_unknown_version_never_evicts_the_known_entry(tmp_path):
+    path = tmp_path / 'capabilities.json'
+    store = CapabilityStore(str(path))
+    store.set(INSTANCE, 'v1', 'endpoints', 'servers', '/api/v1/servers')
+    store.set(INSTANCE, None, 'endpoints', 'servers', '/servers')
+    store.update(INSTANCE, None, 'strategies', 'create_application', lambda memory: {'winner': 'form'})
+    store.delete(INSTANCE, None, 'endpoints', 'servers')
+    assert store.get(INSTANCE, None, 'endpoints', 'servers') is None
+    assert store.get(INSTANCE, 'v1', 'endpoints', 'servers') == '/api/v1/servers'
+    assert json.loads(path.read_text())[INSTANCE]['version'] == 'v1'
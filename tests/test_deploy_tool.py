@@ -0,0 +1,35 @@
+from types import SimpleNamespace
+
+import pytest
+
+from coolify_deploy_tool import CoolifyApplicationDeployer
+
+
+def _response(status, headers=None, text=''):
+    return SimpleNamespace(status_code=status, headers=headers or {}, text=text)
+
+
+@pytest.fixture
+def deployer(tmp_path, monkeypatch):
+    monkeypatch.setenv('COOLIFY_RATE_LIMIT', '0')
+    monkeypatch.chdir(tmp_path)
+    return CoolifyApplicationDeployer('http://coolify.test')
+
+
+@pytest.mark.parametrize('response', [
+    _response(302, {'Location': 'http://coolify.test/login'}),
+    _response(302, {'Location': '/login?expired=1'}),
+    _response(200, {'Content-Type': 'text/html'}, '<form action="/login"><input name="password"></form>'),
+])
+def test_login_page_is_not_a_created_application(deployer, monkeypatch, response):
+    monkeypatch.setattr(deployer.session, 'post', lambda *args, **kwargs: response)
+    success, message, unsupported = deployer._create_via_form('/applications', {})
+    assert (success, unsupported) == (False, False)
+    assert message == "Not logged in"
+
+
+def test_redirect_to_the_application_is_success(deployer, monkeypatch):
+    response = _response(302, {'Location': '/project/1/application/abc'})
+    monkeypatch.setattr(deployer.session, 'post', lambda *args, **kwargs: response)
+    success, _, _ = deployer._create_via_form('/applications', {})
+    assert success
@@ -0,0 +1,55 @@
+import coolify_inventory
+import pytest
+
+from coolify_fanout import FanOutRunner, deploy_operation, list_applications, merge_results
+from coolify_standin_server import StandInServer
+
+
+@pytest.fixture
+def servers(tmp_path, monkeypatch):
+    monkeypatch.setenv('COOLIFY_RATE_LIMIT', '0')
+    monkeypatch.setenv('COOLIFY_INVENTORY_DB', str(tmp_path / 'inventory.db'))
+    monkeypatch.delenv('COOLIFY_CASSETTE', raising=False)
+    monkeypatch.setattr(coolify_inventory, '_default_inventory', None)
+    with StandInServer(deploy_duration=0.0) as first, StandInServer(deploy_duration=0.0) as second:
+        yield first, second
+
+
+def _instances(*servers):
+    return [{'base_url': server.base_url, 'email': 'admin@example.com', 'password': 'secret'} for server in servers]
+
+
+def test_failed_deploy_is_reported_per_instance(servers):
+    first, second = servers
+    app = first.state.create_application({'name': 'shop'})
+    outcomes = FanOutRunner(_instances(first, second)).run(deploy_operation(app['uuid']))
+    assert outcomes[first.base_url]['success']
+    assert outcomes[first.base_url]['result']['deployment_uuid']
+    assert not outcomes[second.base_url]['success']
+    assert outcomes[second.base_url]['error'] == "Deployment did not start"
+    assert list(merge_results(outcomes)['errors']) == [second.base_url]
+
+
+def test_deploy_by_name_looks_up_each_instance(servers):
+    first, second = servers
+    uuids = [server.state.create_application({'name': 'shop'})['uuid'] for server in servers]
+    outcomes = FanOutRunner(_instances(first, second)).run(deploy_operation(app='shop'))
+    assert all(outcome['success'] for outcome in outcomes.values())
+    assert [d['application_uuid'] for server in servers for d in server.state.deployments.values()] == uuids
+
+
+def test_listing_errors_are_not_an_empty_success(servers):
+    first, _ = servers
+    first.state.create_application({'name': 'shop'})
+    instances = _instances(first) + [{'base_url': 'http://127.0.0.1:9', 'email': 'a', 'password': 'b'}]
+
+    class Client:
+        def __init__(self, base_url):
+            from coolify_final_deploy import CoolifyAPI
+            self.api = CoolifyAPI(base_url)
+            self.login = self.api.login if base_url == first.base_url else (lambda email, password: True)
+            self.iter_applications = self.api.iter_applications
+
+    outcomes = FanOutRunner(instances, client_factory=Client).run(list_applications)
+    assert [app['name'] for app in outcomes[first.base_url]['result']] == ['shop']
+    assert not outcomes['http://127.0.0.1:9']['success']
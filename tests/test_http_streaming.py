@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from coolify_http import iter_json_array
+
+FIXTURE = (
+    '[ -500.0, 1.5e3, 0, -0.25E-2, 12345678901234567890, true, false, null,\n'
+    '  "plain", "caf\u00e9 \u2713 \U0001F680", "escaped \\" quote \\u00e9",\n'
+    '  {"uuid": "abc123", "name": "app", "fqdn": "https://app.example.com", "ports": [80, 443]},\n'
+    '  [1, [2.5, [-3e-1]]], {}, [] ]'
+).encode('utf-8')
+
+
+def test_whole_array():
+    assert list(iter_json_array([FIXTURE])) == json.loads(FIXTURE)
+
+
+@pytest.mark.parametrize('offset', range(1, len(FIXTURE)))
+def test_split_at_every_offset(offset):
+    chunks = [FIXTURE[:offset], FIXTURE[offset:]]
+    assert list(iter_json_array(chunks)) == json.loads(FIXTURE)
+
+
+def test_one_byte_chunks():
+    chunks = [FIXTURE[i:i + 1] for i in range(len(FIXTURE))]
+    assert list(iter_json_array(chunks)) == json.loads(FIXTURE)
+
+
+@pytest.mark.parametrize('chunks, expected', [
+    ([b'[-500.', b'0]'], [-500.0]),
+    ([b'[1.5e', b'3]'], [1500.0]),
+    ([b'[1', b'2', b']'], [12]),
+    ([b'[12', b']'], [12]),
+    ([b'[7]'], [7]),
+    ([b'[]'], []),
+])
+def test_numbers_split_across_chunks(chunks, expected):
+    assert list(iter_json_array(chunks)) == expected
+
+
+@pytest.mark.parametrize('body, message', [
+    (b'{"data": []}', 'not a JSON array'),
+    (b'[1, 2', 'Unterminated'),
+    (b'[1 2]', "missing ','"),
+])
+def test_malformed(body, message):
+    with pytest.raises(ValueError, match=message):
+        list(iter_json_array([body]))
@@ -0,0 +1,105 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import coolify_inventory
+from coolify_index import ApplicationIndex, normalize_domain, normalize_repo
+from coolify_inventory import InventoryCache
+
+INSTANCE = 'http://coolify.test'
+
+
+def app(uuid, name, repo='https://github.com/acme/shop.git', **fields):
+    return dict({'uuid': uuid, 'name': name, 'git_repository': repo}, **fields)
+
+
+@pytest.fixture
+def inventory(tmp_path):
+    return InventoryCache(str(tmp_path / 'inventory.db'))
+
+
+@pytest.mark.parametrize('repo', [
+    'https://github.com/Acme/Shop.git',
+    'git@github.com:acme/shop.git',
+    'github.com/acme/shop',
+    'acme/shop',
+])
+def test_normalize_repo_variants(repo):
+    assert normalize_repo(repo) == 'github.com/acme/shop'
+
+
+def test_normalize_domain():
+    assert normalize_domain('HTTPS://Shop.Example.com:443/path') == 'shop.example.com'
+    assert normalize_domain('shop.example.com') == 'shop.example.com'
+
+
+def test_find_by_each_key():
+    index = ApplicationIndex([
+        app('u1', 'Shop', fqdn='https://shop.example.com,https://www.shop.example.com', project_uuid='p1'),
+        app('u2', 'Blog', repo='git@github.com:acme/blog.git', project_uuid='p1'),
+    ])
+    assert [a['uuid'] for a in index.find('u1')] == ['u1']
+    assert [a['uuid'] for a in index.find('shop')] == ['u1']
+    assert [a['uuid'] for a in index.find('https://github.com/acme/blog')] == ['u2']
+    assert [a['uuid'] for a in index.find('www.shop.example.com')] == ['u1']
+    assert sorted(a['uuid'] for a in index.by_project('p1')) == ['u1', 'u2']
+    assert index.find('missing') == []
+
+
+def test_update_rekeys_changed_apps_and_drops_removed_ones():
+    index = ApplicationIndex([app('u1', 'shop'), app('u2', 'blog')])
+    index.update([app('u1', 'store')])
+    assert index.find('shop') == []
+    assert [a['uuid'] for a in index.find('store')] == ['u1']
+    assert index.find('blog') == [] and len(index) == 1
+
+
+def test_domain_only_change_is_reindexed():
+    index = ApplicationIndex([app('u1', 'shop', domains='https://old.example.com')])
+    assert index.find('old.example.com')
+    index.update([app('u1', 'shop', domains='https://new.example.com')])
+    assert index.find('old.example.com') == []
+    assert [a['uuid'] for a in index.find('new.example.com')] == ['u1']
+
+
+def test_attach_follows_refreshes_until_detached(inventory):
+    inventory.put(INSTANCE, 'applications', [app('u1', 'shop')])
+    index = ApplicationIndex().attach(inventory, INSTANCE)
+    assert index.find('shop')
+
+    inventory.put(INSTANCE, 'applications', [app('u2', 'blog')])
+    inventory.put('http://other.test', 'applications', [app('u3', 'wiki')])
+    assert index.find('blog') and not index.find('shop') and not index.find('wiki')
+
+    index.detach()
+    assert inventory._listeners['applications'] == []
+    inventory.put(INSTANCE, 'applications', [app('u4', 'docs')])
+    assert index.find('blog') and not index.find('docs')
+
+
+def test_reattach_does_not_stack_listeners(inventory):
+    index = ApplicationIndex()
+    index.attach(inventory, INSTANCE)
+    index.attach(inventory, INSTANCE)
+    assert len(inventory._listeners['applications']) == 1
+
+
+def test_concurrent_lookups_share_one_index(tmp_path, monkeypatch):
+    from coolify_final_deploy import CoolifyAPI
+    from coolify_standin_server import StandInServer
+
+    monkeypatch.setenv('COOLIFY_RATE_LIMIT', '0')
+    monkeypatch.setenv('COOLIFY_INVENTORY_DB', str(tmp_path / 'inventory.db'))
+    monkeypatch.delenv('COOLIFY_CASSETTE', raising=False)
+    monkeypatch.setattr(coolify_inventory, '_default_inventory', None)
+    with StandInServer(deploy_duration=0.0) as server:
+        created = server.state.create_application({'name': 'shop'})
+        api = CoolifyAPI(server.base_url)
+        assert api.login('test@example.com', 'secret')
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(api.find_applications, ['shop'] * 16))
+        assert all([a['uuid'] for a in matches] == [created['uuid']] for matches in results)
+        listeners = api.inventory._listeners['applications']
+        assert len(listeners) == 1
+        api.close()
+        assert listeners == []
@@ -0,0 +1,90 @@
+import pytest
+
+from coolify_inventory import InventoryCache
+
+INSTANCE = 'http://coolify.test'
+
+
+@pytest.fixture
+def inventory(tmp_path):
+    return InventoryCache(str(tmp_path / 'inventory.db'))
+
+
+def apps(*names):
+    return [{'uuid': f"uuid-{name}", 'name': name} for name in names]
+
+
+def failing_stream(items, error):
+    yield from items
+    raise error
+
+
+def test_put_stream_replaces_records_when_exhausted(inventory):
+    inventory.put(INSTANCE, 'applications', apps('old'))
+    streamed = list(inventory.put_stream(INSTANCE, 'applications', iter(apps('a', 'b', 'c')), batch_size=2))
+    assert streamed == apps('a', 'b', 'c')
+    assert inventory.get(INSTANCE, 'applications') == apps('a', 'b', 'c')
+    assert inventory.is_fresh(INSTANCE, 'applications')
+
+
+def test_put_stream_failure_keeps_last_good_copy(inventory):
+    inventory.put(INSTANCE, 'applications', apps('old'))
+    fetched_at = inventory.fetched_at(INSTANCE, 'applications')
+    stream = inventory.put_stream(INSTANCE, 'applications',
+                                  failing_stream(apps('a', 'b', 'c'), ConnectionError('dropped')), batch_size=2)
+    with pytest.raises(ConnectionError):
+        list(stream)
+    assert inventory.get(INSTANCE, 'applications') == apps('old')
+    assert inventory.fetched_at(INSTANCE, 'applications') == fetched_at
+    # No staging rows are left behind
+    count = inventory._conn().execute('SELECT COUNT(*) FROM records').fetchone()[0]
+    assert count == 1
+
+
+def test_put_stream_abandoned_keeps_last_good_copy(inventory):
+    inventory.put(INSTANCE, 'applications', apps('old'))
+    stream = inventory.put_stream(INSTANCE, 'applications', iter(apps('a', 'b', 'c')), batch_size=1)
+    next(stream)
+    next(stream)
+    stream.close()
+    assert inventory.get(INSTANCE, 'applications') == apps('old')
+
+
+def test_iter_through_failure_matches_read_through(inventory):
+    inventory.put(INSTANCE, 'servers', apps('s1'))
+    with pytest.raises(ConnectionError):
+        list(inventory.iter_through(INSTANCE, 'servers', lambda: failing_stream(apps('s2'), ConnectionError()),
+                                    refresh=True))
+    assert inventory.read_through(INSTANCE, 'servers', lambda: None) == apps('s1')
+
+
+def test_read_through_caches_and_counts(inventory):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return apps('a')
+
+    assert inventory.read_through(INSTANCE, 'applications', fetch) == apps('a')
+    assert inventory.read_through(INSTANCE, 'applications', fetch) == apps('a')
+    assert len(calls) == 1
+    assert (inventory.hits, inventory.misses) == (1, 1)
+    assert inventory.read_through(INSTANCE, 'applications', fetch, refresh=True) == apps('a')
+    assert len(calls) == 2
+
+
+def test_read_through_keeps_stale_copy_when_fetch_fails(inventory):
+    inventory.put(INSTANCE, 'applications', apps('old'))
+    assert inventory.read_through(INSTANCE, 'applications', lambda: None, refresh=True) == apps('old')
+
+
+def test_read_through_never_fetched_and_failing(inventory):
+    assert inventory.read_through(INSTANCE, 'applications', lambda: None) is None
+
+
+def test_subscribers_see_refreshes(inventory):
+    seen = []
+    inventory.subscribe('applications', lambda instance, items: seen.append((instance, items)))
+    inventory.put(INSTANCE, 'applications', apps('a'))
+    list(inventory.put_stream(INSTANCE, 'applications', iter(apps('b'))))
+    assert seen == [(INSTANCE, apps('a')), (INSTANCE, apps('b'))]
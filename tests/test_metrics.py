@@ -0,0 +1,97 @@
+import threading
+
+from coolify_metrics import Counter, Histogram
+
+
+def test_counter_totals_survive_finished_threads_without_keeping_their_slots():
+    counter = Counter('coolify_test_events', 'Events')
+
+    def work():
+        for _ in range(100):
+            counter.inc()
+
+    for _ in range(10):
+        threads = [threading.Thread(target=work) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert counter._default.value == 20000
+    assert counter._default._cells._cells == []
+
+
+def test_histogram_counts_from_many_threads():
+    histogram = Histogram('coolify_test_seconds', 'Durations', bounds=(0.1, 1.0))
+    threads = [threading.Thread(target=histogram.observe, args=(value,)) for value in (0.05, 0.5, 5.0) * 10]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    counts, total = histogram._default.snapshot()
+    assert counts == [10, 10, 10]
+    assert round(total, 6) == 55.5
+
+
+def test_inventory_lookups_render_as_counter(tmp_path, monkeypatch):
+    import coolify_inventory
+    from coolify_inventory import InventoryCache
+    from coolify_metrics import MetricsRegistry, _install_default_metrics
+
+    cache = InventoryCache(str(tmp_path / 'inventory.db'))
+    cache.hits, cache.misses = 3, 1
+    monkeypatch.setattr(coolify_inventory, '_default_inventory', cache)
+    registry = MetricsRegistry()
+    monkeypatch.setattr('coolify_metrics.add_timing_hook', lambda hook: None)
+    _install_default_metrics(registry)
+
+    text = registry.render()
+    assert '# TYPE coolify_inventory_cache_lookups counter' in text
+    assert 'coolify_inventory_cache_lookups_total{result="hit"} 3' in text
+    assert 'coolify_inventory_cache_lookups_total{result="miss"} 1' in text
+    assert 'coolify_inventory_cache_hit_ratio 0.75' in text
+    assert text.endswith('# EOF\n')
+
+
+def test_poll_closes_deployments_that_leave_the_listing(monkeypatch, tmp_path):
+    from coolify_metrics import MetricsRegistry, MonitorDaemon
+
+    monkeypatch.setenv('COOLIFY_INVENTORY_DB', str(tmp_path / 'inventory.db'))
+    daemon = MonitorDaemon('http://coolify.test', 'a@example.com', 'secret', registry=MetricsRegistry())
+    daemon.logged_in = True
+    listings = {
+        '/api/v1/applications': [{'uuid': 'a1', 'status': 'running:healthy'}],
+        '/api/v1/deployments': [{'deployment_uuid': 'd1', 'status': 'in_progress'}],
+    }
+    monkeypatch.setattr(daemon, '_list', listings.get)
+    assert daemon.poll_once()
+    assert 'd1' in daemon.phases._current
+    listings['/api/v1/deployments'] = []
+    assert daemon.poll_once()
+    assert daemon.phases._current == {}
+
+
+def test_poll_reads_every_page_and_logs_in_again(monkeypatch, tmp_path):
+    import coolify_inventory
+    from coolify_metrics import MetricsRegistry, MonitorDaemon
+    from coolify_standin_server import StandInServer
+
+    monkeypatch.setenv('COOLIFY_RATE_LIMIT', '0')
+    monkeypatch.setenv('COOLIFY_INVENTORY_DB', str(tmp_path / 'inventory.db'))
+    monkeypatch.delenv('COOLIFY_CASSETTE', raising=False)
+    monkeypatch.setattr(coolify_inventory, '_default_inventory', None)
+    with StandInServer(paginate=True, deploy_duration=600.0) as server:
+        for _ in range(150):
+            app = server.state.create_application({})
+            server.state.start_deployment(app['uuid'])
+        registry = MetricsRegistry()
+        daemon = MonitorDaemon(server.base_url, 'a@example.com', 'secret', registry=registry)
+        assert daemon.poll_once()
+        assert len(daemon.phases._current) == 150
+        assert daemon.active._default[0] == 150
+
+        server.state.sessions.clear()
+        assert daemon.poll_once()
+        assert len(daemon.phases._current) == 150
+        text = registry.render()
+        assert 'coolify_session_relogins_total 1' in text
+        assert 'coolify_applications{status="starting"} 150' in text
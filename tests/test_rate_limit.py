@@ -0,0 +1,26 @@
+import json
+
+import pytest
+
+from coolify_http import TokenBucket, fcntl
+
+
+@pytest.mark.skipif(fcntl is None, reason='shared bucket files need fcntl')
+def test_rewards_are_batched_into_the_next_update(tmp_path):
+    bucket = TokenBucket('host:api', 10.0, 10, 0.5, 50.0, str(tmp_path))
+    bucket.acquire()
+    path = tmp_path / 'host_api.bucket'
+    before = path.read_text()
+    for _ in range(4):
+        bucket.reward()
+    assert path.read_text() == before
+    assert bucket.rate == pytest.approx(12.0)
+    assert json.loads(path.read_text())['rate'] == pytest.approx(12.0)
+    assert bucket.rate == pytest.approx(12.0)
+
+
+def test_rewards_respect_max_rate_and_precede_a_penalty():
+    bucket = TokenBucket('host:api', 10.0, 10, 0.5, 11.0)
+    for _ in range(100):
+        bucket.reward()
+    assert bucket.penalize(retry_after=0) == pytest.approx(5.5)
@@ -0,0 +1,41 @@
+import time
+
+from coolify_recorder import NetworkRecorder, iter_entries
+
+
+def test_constructor_creates_nothing(tmp_path):
+    path = tmp_path / 'logs' / 'network.jsonl'
+    recorder = NetworkRecorder(str(path))
+    assert not path.parent.exists()
+    recorder.close()
+    assert not path.parent.exists()
+
+
+def test_idle_buffer_is_flushed_by_timer(tmp_path):
+    path = tmp_path / 'logs' / 'network.jsonl'
+    recorder = NetworkRecorder(str(path), flush_interval=0.05)
+    recorder.write({'n': 1})
+    deadline = time.time() + 2
+    while not path.exists() and time.time() < deadline:
+        time.sleep(0.01)
+    assert list(iter_entries(str(path))) == [{'n': 1}]
+    recorder.close()
+
+
+def test_close_flushes_and_stops_writing(tmp_path):
+    path = tmp_path / 'network.jsonl'
+    recorder = NetworkRecorder(str(path), flush_interval=60)
+    for n in range(3):
+        recorder.write({'n': n})
+    recorder.close()
+    recorder.write({'n': 99})
+    assert [entry['n'] for entry in iter_entries(str(path))] == [0, 1, 2]
+    assert recorder.count == 3
+
+
+def test_rotation(tmp_path):
+    path = tmp_path / 'network.jsonl'
+    with NetworkRecorder(str(path), buffer_bytes=1, max_bytes=50) as recorder:
+        for n in range(10):
+            recorder.write({'padding': 'x' * 20, 'n': n})
+    assert (tmp_path / 'network.jsonl.1').exists()
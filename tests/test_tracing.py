@@ -0,0 +1,23 @@
+import json
+
+import coolify_tracing
+
+
+def _timing(url):
+    return {'method': 'GET', 'url': url, 'endpoint': '/api/v1/version', 'status': 200, 'bytes': 5,
+            'connect': 0.002, 'tls': 0.0 if url.startswith('http:') else 0.004, 'ttfb': 0.01,
+            'transfer': 0.001, 'total': 0.017}
+
+
+def test_tls_time_is_only_reported_for_https(tmp_path):
+    path = tmp_path / 'trace.jsonl'
+    coolify_tracing.enable_tracing(str(path))
+    try:
+        coolify_tracing._http_span(_timing('http://coolify.test/api/v1/version'))
+        coolify_tracing._http_span(_timing('https://coolify.test/api/v1/version'))
+    finally:
+        coolify_tracing.disable_tracing()
+    spans = [json.loads(line)['resourceSpans'][0]['scopeSpans'][0]['spans'][0] for line in path.read_text().splitlines()]
+    keys = [{attribute['key'] for attribute in span['attributes']} for span in spans]
+    assert 'coolify.tls_ms' not in keys[0]
+    assert 'coolify.tls_ms' in keys[1]